@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'artvinvizyonu.settings')
 
 application = get_asgi_application()
+
+# Okunma sayaçları bellekte toplanır; sunucu süreçlerinde arka planda yazılır
+from haberler.counters import otomatik_yazmayi_etkinlestir  # noqa: E402
+
+otomatik_yazmayi_etkinlestir()
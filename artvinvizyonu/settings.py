@@ -45,6 +45,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # İstek profilleme (örneklemeli, bkz. haberler/middleware.py)
+    'haberler.middleware.IstekProfiliMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     
     # ------------------------------------------------
@@ -74,6 +76,7 @@ TEMPLATES = [
                 'django.contrib.messages.context_processors.messages',
                 # Custom Context Processor
                 'haberler.views.global_context',
+                'haberler.views.parca_onbellegi',
             ],
         },
     },
@@ -83,13 +86,106 @@ WSGI_APPLICATION = 'artvinvizyonu.wsgi.application'
 
 
 # Database
-DATABASES = {
+# Varsayılan SQLite'tır; her bağlantı SQLITE_PRAGMALARI ile açılır
+# (bkz. haberler/veritabani.py). Birden fazla worker'ın yoğun yazdığı kurulumlarda
+# DJANGO_DB_ENGINE=postgresql seçilebilir. DJANGO_DB_HAVUZ=True ise psycopg
+# bağlantı havuzu kullanılır (psycopg[pool] gerekir); aksi halde bağlantılar
+# DJANGO_DB_CONN_MAX_AGE saniye açık tutulur.
+# `python manage.py veritabani_yuk_testi` yapılandırmaları karşılaştırır.
+DB_MOTORU = os.getenv('DJANGO_DB_ENGINE', 'sqlite3')
+DB_HAVUZU = os.getenv('DJANGO_DB_HAVUZ', 'False').lower() in ('1', 'true', 'yes')
+DB_BAGLANTI_OMRU = int(os.getenv('DJANGO_DB_CONN_MAX_AGE', '60'))
+
+if DB_MOTORU in ('postgresql', 'postgres'):
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.getenv('DJANGO_DB_NAME', 'artvizyon'),
+            'USER': os.getenv('DJANGO_DB_USER', ''),
+            'PASSWORD': os.getenv('DJANGO_DB_PASSWORD', ''),
+            'HOST': os.getenv('DJANGO_DB_HOST', ''),
+            'PORT': os.getenv('DJANGO_DB_PORT', ''),
+            # Django havuzu kalıcı bağlantılarla birlikte kabul etmez
+            'CONN_MAX_AGE': 0 if DB_HAVUZU else DB_BAGLANTI_OMRU,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': int(os.getenv('DJANGO_DB_HAVUZ_MIN', '2')),
+                    'max_size': int(os.getenv('DJANGO_DB_HAVUZ_MAX', '10')),
+                },
+            } if DB_HAVUZU else {},
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.getenv('DJANGO_DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'CONN_MAX_AGE': DB_BAGLANTI_OMRU,
+            'CONN_HEALTH_CHECKS': True,
+            # İşlemler DEFERRED başlar; okuyup sonra yazan bloklar
+            # haberler.veritabani.yazma_islemi() ile IMMEDIATE açılır
+        }
+    }
+
+SQLITE_PRAGMALARI = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': int(os.getenv('SQLITE_BEKLEME_MS', '5000')),
+    'mmap_size': int(os.getenv('SQLITE_MMAP_BOYUTU', str(256 * 1024 * 1024))),
+    'temp_store': 'MEMORY',
+}
+
+
+# Önbellek
+# Varsayılan LocMem önbelleği süreç başınadır. Birden fazla worker çalışıyorsa
+# geçersiz kılmanın tüm worker'lara ulaşması için ortak bir arka uç seçin
+# (örn. DJANGO_CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+# ve DJANGO_CACHE_LOCATION=/home/kullanici/artvizyon-cache).
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': os.getenv('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('DJANGO_CACHE_LOCATION', 'artvizyon'),
     }
 }
 
+# Menü/son dakika verisinin önbellekte kalma süresi (saniye)
+NAVIGASYON_ONBELLEK_SURESI = int(os.getenv('NAVIGASYON_ONBELLEK_SURESI', '300'))
+
+# Anonim okuyuculara sunulan tam sayfaların önbellek süresi (saniye).
+# Yayın/yorum kaydında ilgili sayfalar zaten anında temizlenir.
+SAYFA_ONBELLEK_SURESI = int(os.getenv('SAYFA_ONBELLEK_SURESI', '600'))
+
+# Bellekte toplanan okunma sayılarının veritabanına yazılma aralığı (saniye)
+OKUNMA_YAZMA_ARALIGI = int(os.getenv('OKUNMA_YAZMA_ARALIGI', '10'))
+
+# Yüklenen görseller varsayılan olarak kayıt anında işlenir. True yapılırsa
+# `python manage.py gorsel_isleyici` ile arka planda işlenir; işçi sürekli
+# çalışmıyorsa yüklenen görseller yer tutucuda kalır.
+GORSEL_ISLEME_ARKA_PLANDA = os.getenv('GORSEL_ISLEME_ARKA_PLANDA', 'False').lower() in ('1', 'true', 'yes')
+
+# Verilirse manşet işareti bu kadar günden eski kayıtlar ana sayfa şeridinden
+# düşer; varsayılan (ya da 0) süre sınırı yoktur (bkz. haberler/manset.py)
+MANSET_GECERLILIK_GUNU = int(os.getenv('MANSET_GECERLILIK_GUNU') or 0) or None
+
+# `python manage.py statik_disa_aktar` çıktısının yazıldığı, nginx'in doğrudan
+# sunduğu dizin (bkz. haberler/statik.py)
+STATIK_KOPYA_DIZINI = os.getenv('STATIK_KOPYA_DIZINI', os.path.join(BASE_DIR, 'statik_kopya'))
+
+# Site haritası parçalarının önbelleklendiği dizin ve haritadaki adreslerin
+# kök adresi (bkz. haberler/site_haritasi.py)
+SITE_HARITASI_DIZINI = os.getenv('SITE_HARITASI_DIZINI', os.path.join(BASE_DIR, 'site_haritasi'))
+SITE_ADRESI = os.getenv('SITE_ADRESI', 'https://www.artvinvizyonu.com')
+
+# Benzer içerik dizininin (TF-IDF sözlüğü, idf ve vektör matrisi) tutulduğu
+# dizin (bkz. haberler/benzerlik.py)
+BENZERLIK_DIZINI = os.getenv('BENZERLIK_DIZINI', os.path.join(BASE_DIR, 'benzerlik'))
+
+# İstek profilleme: üretimde isteklerin küçük bir kısmı ölçülür
+PROFIL_ORNEKLEME_ORANI = float(os.getenv('PROFIL_ORNEKLEME_ORANI', '1.0' if DEBUG else '0.05'))
+PROFIL_YAVAS_ESIK_MS = int(os.getenv('PROFIL_YAVAS_ESIK_MS', '1000'))
+PROFIL_GUNLUK_DOSYASI = os.getenv('PROFIL_GUNLUK_DOSYASI', os.path.join(BASE_DIR, 'logs', 'yavas_istekler.jsonl'))
+
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
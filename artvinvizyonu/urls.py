@@ -5,6 +5,8 @@ import os
 from django.conf import settings
 from django.conf.urls.static import static
 from haberler import views # Senin uygulamanın adı 'haberler'
+from haberler.kosullu import kosullu_get
+from haberler.beslemeler import besleme_adresleri
 from django.views.generic import TemplateView
 
 def ads_txt(request):
@@ -31,7 +33,13 @@ def robots_txt(request):
 urlpatterns = [
     path('ads.txt', ads_txt, name='ads_txt'),
     path('robots.txt', robots_txt, name='robots_txt'),
+    path('sitemap.xml', views.site_haritasi, name='site_haritasi'),
+    path('sitemap-<slug:bolum>-<int:no>.xml', views.site_haritasi_parcasi, name='site_haritasi_parcasi'),
+    # RSS / Atom beslemeleri (bkz. haberler/beslemeler.py)
+    *[path(yol, gorunum, name=ad) for yol, gorunum, ad in besleme_adresleri()],
     # --- GÜVENLİK: ÖZEL ADMİN YOLU ---
+    path('artvizyon-sami/onbellek-durumu/', views.onbellek_durumu, name='onbellek_durumu'),
+    path('artvizyon-sami/profil-ozeti/', views.profil_ozeti_gorunumu, name='profil_ozeti'),
     path('artvizyon-sami/', admin.site.urls),
     
     # ==========================================
@@ -79,17 +87,19 @@ urlpatterns = [
         
     # Tarihi ve Turistik Yerler
     path('tarihi-yerler/', views.tarihi_yerler_listesi, name='tarihi_yerler_listesi'),
+    path('tarihi-yerler/harita.json', views.tarihi_yer_isaretleri, name='tarihi_yer_isaretleri'),
+    path('tarihi-yerler/<int:pk>/icerik.json', views.tarihi_yer_icerigi, name='tarihi_yer_icerigi'),
     path('tarihi-yerler/<slug:slug>/', views.tarihi_yer_detay, name='tarihi_yer_detay'),
 
     path('ckeditor/', include('ckeditor_uploader.urls')),
     
     # Haberler uygulaması için ek URL'ler
     path('', include('haberler.urls')),
-    path('hakkimizda/', TemplateView.as_view(template_name='hakkimizda.html'), name='hakkimizda'),
-    path('gizlilik-politikasi/', TemplateView.as_view(template_name='gizlilik.html'), name='gizlilik_politikasi'),
-    path('hizmet-sartlari/', TemplateView.as_view(template_name='hizmet_sartlari.html'), name='hizmet_sartlari'),
-    path('teslimat-iade/', TemplateView.as_view(template_name='teslimat_iade.html'), name='teslimat_iade'),
-    path('mesafeli-satis-sozlesmesi/', TemplateView.as_view(template_name='mesafeli_satis.html'), name='mesafeli_satis'),
+    path('hakkimizda/', kosullu_get(views.sabit_sayfa_kaynaklari)(TemplateView.as_view(template_name='hakkimizda.html')), name='hakkimizda'),
+    path('gizlilik-politikasi/', kosullu_get(views.sabit_sayfa_kaynaklari)(TemplateView.as_view(template_name='gizlilik.html')), name='gizlilik_politikasi'),
+    path('hizmet-sartlari/', kosullu_get(views.sabit_sayfa_kaynaklari)(TemplateView.as_view(template_name='hizmet_sartlari.html')), name='hizmet_sartlari'),
+    path('teslimat-iade/', kosullu_get(views.sabit_sayfa_kaynaklari)(TemplateView.as_view(template_name='teslimat_iade.html')), name='teslimat_iade'),
+    path('mesafeli-satis-sozlesmesi/', kosullu_get(views.sabit_sayfa_kaynaklari)(TemplateView.as_view(template_name='mesafeli_satis.html')), name='mesafeli_satis'),
 ]
     
 if settings.DEBUG:
@@ -12,8 +12,9 @@ from .models import (
     Haber, Kategori, Ilce, KoseYazari, KoseYazisi, 
     Galeri, GaleriResim, Siir, 
     EczaneLinki, Yorum, Destekci,
-    OzelGun, TebrikMesaji, TarihiYer 
+    OzelGun, TebrikMesaji, TarihiYer, GorselIsi
 )
+from .images import asili_isler
 # Geri alma (Undo) özelliği için gerekli kütüphane
 from reversion.admin import VersionAdmin
 
@@ -230,7 +231,10 @@ class YorumAdmin(DeleteLinkMixin, VersionAdmin): # VersionAdmin kullanıldı
     actions = ['yorumlari_onayla']
 
     def yorumlari_onayla(self, request, queryset):
-        queryset.update(aktif=True)
+        # update() sinyal göndermez; kayıt kayıt saklayınca sayfa önbelleği de temizlenir
+        for yorum in queryset.filter(aktif=False):
+            yorum.aktif = True
+            yorum.save(update_fields=['aktif'])
     yorumlari_onayla.short_description = "Seçili yorumları onayla ve yayınla"
 
     def govde_kisalt(self, obj):
@@ -317,6 +321,29 @@ class KategoriAdmin(DeleteLinkMixin, VersionAdmin):
     list_display = ('isim', 'slug', 'delete_link')
     prepopulated_fields = {'slug': ('isim',)}
 
+# --- GÖRSEL İŞLEME KUYRUĞU ---
+@admin.register(GorselIsi)
+class GorselIsiAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'tur', 'durum_ikonu', 'deneme', 'guncellenme_tarihi')
+    list_filter = ('durum', 'tur', 'model_etiketi')
+    readonly_fields = ('model_etiketi', 'nesne_id', 'alan', 'kaynak', 'tur', 'durum', 'deneme', 'hata',
+                       'olusturulma_tarihi', 'guncellenme_tarihi')
+    actions = ['yeniden_dene']
+
+    def has_add_permission(self, request):
+        return False
+
+    def yeniden_dene(self, request, queryset):
+        secilenler = queryset.filter(durum=GorselIsi.HATA) | asili_isler(queryset)
+        adet = secilenler.update(durum=GorselIsi.BEKLIYOR, deneme=0)
+        self.message_user(request, f"{adet} iş yeniden sıraya alındı.")
+    yeniden_dene.short_description = "Hatalı ve asılı kalmış işleri yeniden dene"
+
+    def durum_ikonu(self, obj):
+        renkler = {GorselIsi.BEKLIYOR: 'gray', GorselIsi.ISLENIYOR: 'orange', GorselIsi.TAMAM: 'green', GorselIsi.HATA: 'red'}
+        return format_html('<span style="color:{};">{}</span>', renkler[obj.durum], obj.get_durum_display())
+    durum_ikonu.short_description = "Durum"
+
 # İstenmeyen bölümleri panelden kaldır (örn. Nöbetçi Eczane)
 for model in (EczaneLinki,):
     try:
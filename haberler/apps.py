@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class HaberlerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'haberler'
+
+    def ready(self):
+        from . import signals, veritabani  # noqa: F401
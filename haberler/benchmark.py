@@ -0,0 +1,424 @@
+"""
+Görünüm başına sorgu sayısı, süre ve sorgu planı ölçümü.
+
+Gerçekçi büyüklükte bir veri seti (binlerce haber, onlarca yazar, çok fotoğraflı
+galeriler, yorumlar) oluşturur ve artvinvizyonu/urls.py'deki herkese açık her
+adresi soğuk önbellekle ölçer. Hem testler (haberler/tests.py) hem de
+`python manage.py performans_raporu`, `python manage.py sorgu_planlari` ve
+`python manage.py veritabani_yuk_testi` komutları bu modülü kullanır.
+"""
+import random
+import threading
+import time
+from urllib.parse import urlencode
+from dataclasses import dataclass
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import OperationalError, close_old_connections, connection, transaction
+from django.db.models import F
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import (
+    Destekci, EczaneLinki, Galeri, GaleriResim, Haber, Ilce, Kategori, KoseYazari,
+    KoseYazisi, OzelGun, Siir, TarihiYer, TebrikMesaji, Yorum,
+)
+from .pagination import imleci_kodla
+from .search import dizin_kullanilabilir, dizini_yeniden_olustur
+
+# Adres adı -> (en fazla sorgu, en fazla milisaniye). Testler yalnızca sorgu
+# sayısını denetler; süreler makineye bağlı olduğundan performans_raporu'nda.
+BUTCELER = {
+    'anasayfa': (22, 1500),
+    'anasayfa_derin_sayfa': (21, 1500),
+    'haber_detay': (15, 1000),
+    'kategori_haberleri': (13, 1000),
+    'ilce_haberleri': (13, 1000),
+    'galeri_listesi': (12, 1000),
+    'galeri_detay': (12, 1000),
+    'siir_listesi': (13, 1000),
+    'siir_detay': (14, 1000),
+    'roportaj_listesi': (12, 1000),
+    'yazi_detay': (19, 1000),
+    'ozel_gun_detay': (12, 1000),
+    'tarihi_yerler_listesi': (12, 1000),
+    'tarihi_yer_detay': (13, 1000),
+    'tarihi_yer_isaretleri': (12, 500),
+    'tarihi_yer_icerigi': (12, 500),
+    'arama': (13, 1000),
+    'kimdir': (10, 500),
+    'iletisim': (10, 500),
+    'destek': (10, 500),
+    'tesekkur': (10, 500),
+    'hakkimizda': (10, 500),
+    'gizlilik_politikasi': (10, 500),
+    'hizmet_sartlari': (10, 500),
+    'teslimat_iade': (10, 500),
+    'mesafeli_satis': (10, 500),
+    'rss_haberler': (13, 1000),
+    'rss_kategori': (13, 1000),
+    'rss_yazar': (14, 1000),
+    'rss_siir': (12, 1000),
+}
+
+
+@dataclass
+class Olcum:
+    ad: str
+    url: str
+    durum: int
+    sorgu: int
+    sure_ms: float
+    tekrarlanan: int
+    sicak_sorgu: int
+    sicak_sure_ms: float
+
+    @property
+    def butce(self):
+        return BUTCELER.get(self.ad)
+
+
+def ornek_veri_olustur(haber_sayisi=3000, yazar_sayisi=40, galeri_sayisi=12,
+                       galeri_resim_sayisi=60, yorum_sayisi=40):
+    """Toplu ekleme ile ölçüm verisi oluşturur; sinyaller tetiklenmez."""
+    simdi = timezone.now()
+    kategoriler = Kategori.objects.bulk_create(
+        [Kategori(isim=f"Kategori {i}", slug=f"olcum-kategori-{i}") for i in range(8)]
+    )
+    ilceler = Ilce.objects.bulk_create([Ilce(isim=f"İlçe {i}") for i in range(9)])
+    EczaneLinki.objects.bulk_create(
+        [EczaneLinki(ilce_adi=f"İlçe {i}", url="https://example.com", sira=i) for i in range(9)]
+    )
+
+    govde = "<p>" + "Artvin'de gündem yoğun. " * 150 + "</p>"
+    Haber.objects.bulk_create([
+        Haber(
+            baslik=f"Haber başlığı {i}", ozet=f"Kısa özet {i}", icerik=govde,
+            kategori=kategoriler[i % len(kategoriler)], ilce=ilceler[i % len(ilceler)],
+            yayin_tarihi=simdi - timedelta(minutes=i), manset_mi=i % 40 == 0,
+            son_dakika=i < 5, roportaj_mi=i % 25 == 0, resim=f"haber_resimleri/{i}.jpg",
+        )
+        for i in range(haber_sayisi)
+    ], batch_size=500)
+
+    yazarlar = KoseYazari.objects.bulk_create([
+        KoseYazari(ad_soyad=f"Yazar {i}", resim=f"yazarlar/{i}.jpg", basyazar_mi=i == 0)
+        for i in range(yazar_sayisi)
+    ])
+    KoseYazisi.objects.bulk_create([
+        KoseYazisi(
+            yazar=yazar, baslik=f"{yazar.ad_soyad} yazısı {j}", icerik=govde,
+            yayin_tarihi=simdi - timedelta(hours=j), manset_mi=j == 0,
+        )
+        for yazar in yazarlar for j in range(5)
+    ], batch_size=500)
+    Siir.objects.bulk_create([
+        Siir(baslik=f"Şiir {i}", yazar=yazarlar[i % len(yazarlar)], sair=f"Şair {i}",
+             siir_metni="<p>Dizeler</p>" * 10, gunun_siiri_mi=i == 0,
+             yayin_tarihi=simdi - timedelta(days=i))
+        for i in range(60)
+    ])
+
+    galeriler = Galeri.objects.bulk_create([
+        Galeri(baslik=f"Galeri {i}", kapak_resmi=f"galeri_kapak/{i}.jpg", yayin_tarihi=simdi - timedelta(days=i))
+        for i in range(galeri_sayisi)
+    ])
+    GaleriResim.objects.bulk_create([
+        GaleriResim(galeri=galeri, resim=f"galeri_resimleri/{galeri.pk}_{j}.jpg",
+                    haftanin_fotografi_mi=galeri == galeriler[0] and j == 0)
+        for galeri in galeriler for j in range(galeri_resim_sayisi)
+    ], batch_size=500)
+
+    TarihiYer.objects.bulk_create([
+        TarihiYer(baslik=f"Tarihi Yer {i}", slug=f"olcum-tarihi-yer-{i}", icerik=govde, ozet="Özet",
+                  enlem=f"{41.10 + i / 100:.6f}", boylam="41.820000", resim=f"tarihi_yerler/{i}.jpg", sira=i)
+        for i in range(25)
+    ])
+
+    ozel_gun = OzelGun.objects.create(baslik="Yeni Yıl", slug="olcum-yeni-yil", anasayfada_goster=True)
+    TebrikMesaji.objects.bulk_create([
+        TebrikMesaji(ozel_gun=ozel_gun, ad_soyad=f"Kişi {i}", mesaj_metni="Kutlu olsun",
+                     resim=f"tebrikler/{i}.jpg", instagram_gorseli=f"instagram_postlari/{i}.jpg", sira=i)
+        for i in range(15)
+    ])
+
+    ilk_haber = Haber.objects.order_by('-yayin_tarihi').first()
+    ilk_yazi = KoseYazisi.objects.order_by('-yayin_tarihi').first()
+    Yorum.objects.bulk_create(
+        [Yorum(haber=ilk_haber, isim=f"Okur {i}", email=f"okur{i}@example.com", govde="Yorum", aktif=True)
+         for i in range(yorum_sayisi)]
+        + [Yorum(kose_yazisi=ilk_yazi, isim=f"Okur {i}", email=f"okur{i}@example.com", govde="Yorum", aktif=True)
+           for i in range(yorum_sayisi)]
+    )
+    Destekci.objects.bulk_create([
+        Destekci(isim=f"Destekçi {i}", email=f"okur{i}@example.com", aktif_mi=True,
+                 bitis_tarihi=simdi + timedelta(days=30))
+        for i in range(200)
+    ])
+
+    if dizin_kullanilabilir():
+        dizini_yeniden_olustur({'haber': Haber, 'yazi': KoseYazisi, 'siir': Siir, 'tarihi_yer': TarihiYer})
+
+
+def _derin_imlec(sayfa, boyut=10):
+    """Anasayfanın `sayfa`. sayfasına denk gelen imleç (eski ?page= karşılığı)."""
+    sinir = (
+        Haber.objects.filter(aktif_mi=True).order_by('-yayin_tarihi', '-pk')
+        .values_list('yayin_tarihi', 'pk')[(sayfa - 1) * boyut - 1:(sayfa - 1) * boyut]
+    )
+    return '?' + urlencode({'eski': imleci_kodla(*sinir[0])}) if sinir else ''
+
+
+def olcum_istemcisi():
+    """ALLOWED_HOSTS'taki ilk gerçek ada istek atan test istemcisi (komutlar için)."""
+    hostlar = [host for host in settings.ALLOWED_HOSTS if host != '*']
+    return Client(SERVER_NAME=hostlar[0].lstrip('.')) if hostlar else Client()
+
+
+def olculecek_adresler():
+    """Herkese açık adresler, veritabanındaki örnek nesnelerle doldurulmuş olarak."""
+    haber = Haber.objects.filter(aktif_mi=True).order_by('-yayin_tarihi').first()
+    yazi = KoseYazisi.objects.filter(aktif_mi=True).order_by('-yayin_tarihi').first()
+    siir = Siir.objects.filter(aktif_mi=True).first()
+    galeri = Galeri.objects.first()
+    ozel_gun = OzelGun.objects.filter(aktif_mi=True).first()
+    tarihi_yer = TarihiYer.objects.filter(aktif_mi=True).first()
+    kategori = Kategori.objects.first()
+    ilce = Ilce.objects.first()
+
+    adresler = [
+        ('anasayfa', reverse('anasayfa')),
+        ('anasayfa_derin_sayfa', reverse('anasayfa') + _derin_imlec(200)),
+        ('galeri_listesi', reverse('galeri_listesi')),
+        ('siir_listesi', reverse('siir_listesi')),
+        ('roportaj_listesi', reverse('roportaj_listesi')),
+        ('tarihi_yerler_listesi', reverse('tarihi_yerler_listesi')),
+        ('arama', reverse('arama') + '?q=haber'),
+        ('tarihi_yer_isaretleri', reverse('tarihi_yer_isaretleri') + '?kutu=41.5,41.0,42.0,41.2'),
+        ('rss_haberler', reverse('rss_haberler')),
+        ('rss_siir', reverse('rss_siir')),
+    ]
+    for ad in ('kimdir', 'iletisim', 'destek', 'tesekkur', 'hakkimizda', 'gizlilik_politikasi',
+               'hizmet_sartlari', 'teslimat_iade', 'mesafeli_satis'):
+        adresler.append((ad, reverse(ad)))
+    if haber:
+        adresler.append(('haber_detay', reverse('haber_detay', args=[haber.pk])))
+    if yazi:
+        adresler.append(('yazi_detay', reverse('yazi_detay', args=[yazi.pk])))
+    if siir:
+        adresler.append(('siir_detay', reverse('siir_detay', args=[siir.pk])))
+    if galeri:
+        adresler.append(('galeri_detay', reverse('galeri_detay', args=[galeri.pk])))
+    if ozel_gun:
+        adresler.append(('ozel_gun_detay', reverse('ozel_gun_detay', args=[ozel_gun.slug])))
+    if tarihi_yer:
+        adresler.append(('tarihi_yer_detay', reverse('tarihi_yer_detay', args=[tarihi_yer.slug])))
+        adresler.append(('tarihi_yer_icerigi', reverse('tarihi_yer_icerigi', args=[tarihi_yer.pk])))
+    if yazi:
+        adresler.append(('rss_yazar', reverse('rss_yazar', args=[yazi.yazar_id])))
+    if kategori:
+        adresler.append(('kategori_haberleri', reverse('kategori_haberleri', args=[kategori.pk])))
+        adresler.append(('rss_kategori', reverse('rss_kategori', args=[kategori.pk])))
+    if ilce:
+        adresler.append(('ilce_haberleri', reverse('ilce_haberleri', args=[ilce.pk])))
+    return adresler
+
+
+def _istek(client, url):
+    with CaptureQueriesContext(connection) as sorgular:
+        baslangic = time.perf_counter()
+        response = client.get(url)
+        sure_ms = (time.perf_counter() - baslangic) * 1000
+    return response, [sorgu['sql'] for sorgu in sorgular.captured_queries], sure_ms
+
+
+def olc(client, ad, url):
+    """Adresi önce soğuk, sonra sıcak önbellekle ister; sorgu sayısını ve süreyi döner."""
+    cache.clear()
+    response, sqller, sure_ms = _istek(client, url)
+    _, sicak_sqller, sicak_sure_ms = _istek(client, url)
+    return Olcum(
+        ad=ad, url=url, durum=response.status_code, sorgu=len(sqller), sure_ms=sure_ms,
+        tekrarlanan=len(sqller) - len(set(sqller)),
+        sicak_sorgu=len(sicak_sqller), sicak_sure_ms=sicak_sure_ms,
+    )
+
+
+def tum_adresleri_olc(client):
+    return [olc(client, ad, url) for ad, url in olculecek_adresler()]
+
+
+# Doğası gereği birkaç düzine satırı geçmeyen tablolar; tam taramaları sorun değil
+KUCUK_TABLOLAR = {
+    'haberler_kategori', 'haberler_ilce', 'haberler_eczanelinki', 'haberler_ozelgun',
+    'haberler_tarihiyer', 'haberler_koseyazari', 'socialaccount_socialapp', 'socialaccount_socialapp_sites', 'django_site',
+}
+
+
+@dataclass
+class PlanBulgusu:
+    ad: str
+    sql: str
+    plan: list
+    tam_taramalar: list
+    gecici_siralama: bool
+
+
+def _tam_taramalar(plan):
+    taramalar = []
+    for satir in plan:
+        # "SCAN tablo" tam tarama; "SCAN tablo USING (COVERING) INDEX ..." değil
+        if (satir.startswith('SCAN ') and ' USING ' not in satir and '(' not in satir
+                and 'VIRTUAL TABLE' not in satir):
+            tablo = satir.split()[1]
+            if tablo not in KUCUK_TABLOLAR:
+                taramalar.append(tablo)
+    return taramalar
+
+
+def sorgu_planlarini_denetle(client):
+    """
+    Her adresin soğuk önbellekteki SELECT sorgularını EXPLAIN QUERY PLAN ile
+    inceler; büyük tablolarda tam tarama ya da geçici sıralama ağacı kullanan
+    sorguları döner. Yalnızca SQLite'ta çalışır.
+    """
+    bulgular = []
+    for ad, url in olculecek_adresler():
+        sorgular = []
+
+        def yakala(execute, sql, params, many, context):
+            if sql.lstrip().upper().startswith('SELECT'):
+                sorgular.append((sql, tuple(params or ())))
+            return execute(sql, params, many, context)
+
+        cache.clear()
+        with connection.execute_wrapper(yakala):
+            client.get(url)
+
+        with connection.cursor() as cursor:
+            for sql, params in dict.fromkeys(sorgular):
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+                plan = [satir[-1] for satir in cursor.fetchall()]
+                taramalar = _tam_taramalar(plan)
+                gecici = any('TEMP B-TREE' in satir for satir in plan)
+                if taramalar or gecici:
+                    bulgular.append(PlanBulgusu(ad, sql, plan, taramalar, gecici))
+    return bulgular
+
+
+@dataclass
+class YukOlcumu:
+    yapilandirma: str
+    okuma: int
+    yazma: int
+    kilit_hatasi: int
+    sure: float
+
+    @property
+    def okuma_hizi(self):
+        return self.okuma / self.sure
+
+    @property
+    def yazma_hizi(self):
+        return self.yazma / self.sure
+
+
+def _anasayfa_listesi():
+    return list(
+        Haber.objects.filter(aktif_mi=True).order_by('-yayin_tarihi', '-pk').values_list('pk', 'baslik')[:10]
+    )
+
+
+def eszamanli_yuk_olc(yapilandirma, okuyucu=4, yazici=2, sure=5.0):
+    """
+    `okuyucu` + `yazici` iş parçacığını `sure` saniye boyunca çalıştırır.
+    Okuyucular anasayfa listesini, yazıcılar okunma sayacının toplu yazımını
+    taklit eder. Her işlem bir istek sayılır ve ardından istek sonundaki gibi
+    close_old_connections() çağrılır; böylece CONN_MAX_AGE/havuz farkı da
+    ölçüme girer. Kilit yüzünden başarısız olan işlemler ayrıca sayılır.
+    """
+    haber_idleri = list(Haber.objects.values_list('pk', flat=True)[:500])
+    if not haber_idleri:
+        raise ValueError("Ölçüm için en az bir haber gerekli.")
+
+    def yaz():
+        with transaction.atomic():
+            Haber.objects.filter(pk=random.choice(haber_idleri)).update(okunma_sayisi=F('okunma_sayisi') + 1)
+
+    sayac = {'okuma': 0, 'yazma': 0, 'kilit': 0}
+    sayac_kilidi = threading.Lock()
+    bitis = time.perf_counter() + sure
+
+    def calis(islem, tur):
+        tamam = kilitli = 0
+        try:
+            while time.perf_counter() < bitis:
+                try:
+                    islem()
+                    tamam += 1
+                except OperationalError:
+                    kilitli += 1
+                finally:
+                    close_old_connections()
+        finally:
+            connection.close()
+        with sayac_kilidi:
+            sayac[tur] += tamam
+            sayac['kilit'] += kilitli
+
+    parcaciklar = (
+        [threading.Thread(target=calis, args=(_anasayfa_listesi, 'okuma')) for _ in range(okuyucu)]
+        + [threading.Thread(target=calis, args=(yaz, 'yazma')) for _ in range(yazici)]
+    )
+    baslangic = time.perf_counter()
+    for parcacik in parcaciklar:
+        parcacik.start()
+    for parcacik in parcaciklar:
+        parcacik.join()
+    return YukOlcumu(yapilandirma, sayac['okuma'], sayac['yazma'], sayac['kilit'], time.perf_counter() - baslangic)
+
+
+@dataclass
+class BenzerlikOlcumu:
+    belge: int
+    terim: int
+    vektorlestirme_sn: float
+    komsu_sn: float
+    tepe_bellek_mb: float
+
+
+def benzerlik_olc(belge_sayisi=100_000, belge_uzunlugu=150, kelime_sayisi=60_000, tohum=0):
+    """
+    Benzerlik dizininin tam kurulumunu veritabanı olmadan, Zipf dağılımlı
+    yapay belgelerle ölçer: vektörleştirme ve komşu bulma süreleri ile
+    sürecin tepe belleği (ru_maxrss).
+    """
+    import resource
+
+    from .benzerlik import komsulari_bul, vektorlestir
+
+    rng = np.random.default_rng(tohum)
+    kelimeler = [f'kelime{no}' for no in range(kelime_sayisi)]
+    belgeler = [
+        [kelimeler[no] for no in np.minimum(rng.zipf(1.2, belge_uzunlugu), kelime_sayisi) - 1]
+        for _ in range(belge_sayisi)
+    ]
+
+    baslangic = time.perf_counter()
+    sozluk, _, matris = vektorlestir(belgeler)
+    del belgeler
+    vektorlestirme = time.perf_counter() - baslangic
+
+    baslangic = time.perf_counter()
+    for _ in komsulari_bul(matris):
+        pass
+    komsu = time.perf_counter() - baslangic
+    return BenzerlikOlcumu(
+        belge_sayisi, len(sozluk), vektorlestirme, komsu,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    )
@@ -0,0 +1,390 @@
+"""
+Benzer içerikler: haber ve köşe yazıları için TF-IDF benzerlik dizini.
+
+Metinler arama dizinindeki gibi HTML'den arındırılıp Türkçe kurallarla
+normalleştirilir (search.normallestir) ve durak kelimeleri atılır. Her belge,
+alt doğrusal tf * idf ağırlıklı seyrek bir vektördür. Vektör en ağırlıklı
+TERIM_SINIRI terimine budanır ve birim uzunluğa getirilir. İki belgenin
+benzerliği bu vektörlerin iç çarpımıdır (kosinüs).
+
+Tam kurulum `python manage.py benzerlik_dizinini_olustur` ile yapılır ve
+cron'dan gece çalıştırılması önerilir:
+    Tüm vektörler tek bir CSR matriste toplanır. Komşular PARCA_BOYUTU
+    satırlık dilimler hâlinde X[dilim] @ X.T çarpılarak bulunur ve her
+    belgenin en benzer KOMSU_SAYISI içeriği BenzerIcerik'e yazılır. Sözlük,
+    idf ve matris BENZERLIK_DIZINI altına kaydedilir.
+
+Artımlı güncelleme signals.py'den yapılır:
+    Kaydedilen belgenin vektörü kayıtlı sözlük ve idf ile yeniden hesaplanır.
+    Metni değişmeyen kısmi kayıtlar (örn. görsel işçisi) bu adımı atlar.
+    Vektör değişmediyse yalnızca başkalarının listesindeki kart kopyası
+    güncellenir. Değiştiyse belge, kayıtlı matrisle ve son kurulumdan beri
+    değişen en yeni EN_FAZLA_ARTIMLI_VEKTOR belgenin vektörüyle
+    (BenzerlikVektoru) karşılaştırılır. Kendi listesi yenilenir ve daha
+    benzer olduğu belgelerin listelerine girer.
+    Sözlükte olmayan yeni kelimeler bir sonraki tam kurulumda hesaba katılır.
+
+Tam kurulumun büyük arşivdeki süresi ve belleği
+`python manage.py performans_raporu --benzerlik 100000` ile ölçülür.
+"""
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from scipy import sparse
+
+from .cache import silme_surumunu_artir
+from .models import BenzerIcerik, BenzerlikVektoru, Haber, KoseYazisi
+from .search import normallestir
+
+KOMSU_SAYISI = 5
+TERIM_SINIRI = 64
+# Tek belgede geçen terim benzerlik taşımaz; belgelerin çoğunda geçen de ayırt etmez.
+# Mutlak üst sınır komşu aramasını doğrusal tutar: bir terim X @ X.T'ye belge
+# sıklığının karesi kadar çarpım ekler.
+EN_AZ_BELGE = 2
+EN_FAZLA_BELGE_ORANI = 0.1
+EN_FAZLA_BELGE_ALT_SINIRI = 50
+EN_FAZLA_BELGE = 1000
+PARCA_BOYUTU = 500
+# Artımlı güncellemede listesine girip giremeyeceğine bakılan en benzer belge sayısı
+ADAY_SAYISI = 50
+# Artımlı güncellemede karşılaştırılan, son kurulumdan beri değişmiş belge sayısı
+# (en yeniler); tablo bir sonraki tam kurulumda boşalır
+EN_FAZLA_ARTIMLI_VEKTOR = 5000
+# Kısmi kayıtta (update_fields) bu alanlardan biri yoksa dizin hiç güncellenmez;
+# yalnızca kart alanları varsa vektör yeniden hesaplanmaz
+METIN_ALANLARI = frozenset({'baslik', 'ozet', 'icerik', 'aktif_mi'})
+KART_ALANLARI = frozenset({'baslik', 'resim', 'manset_resmi', 'yayin_tarihi'})
+DOSYA = 'benzerlik.npz'
+
+TUR_KODLARI = {'haber': 0, 'yazi': 1}
+_KELIME = re.compile(r'\w+', re.UNICODE)
+DURAK_KELIMELERI = frozenset('''
+    ile bir icin olarak ama gibi daha cok veya her kadar sonra once olan ise ancak diye tarafindan ayni
+    bunu buna bunun bunlar seklinde uzere oldu olmak olan etti eden dedi kendi tum butun hem nin nun gore
+    ayrica simdi yine bile icinde arasinda uzerinde olmasi oldugu var yok degil ilgili sadece artik
+'''.split())
+
+
+def terimler(metin):
+    return [
+        kelime for kelime in _KELIME.findall(normallestir(metin))
+        if len(kelime) > 2 and not kelime.isdigit() and kelime not in DURAK_KELIMELERI
+    ]
+
+
+def _vektor(sayim, indeks, idf):
+    """Terim sayımından budanmış, birim uzunlukta (terim nolari, ağırlıklar)."""
+    ciftler = [(indeks[terim], adet) for terim, adet in sayim.items() if terim in indeks]
+    if not ciftler:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    nolar = np.fromiter((no for no, _ in ciftler), dtype=np.int32, count=len(ciftler))
+    adetler = np.fromiter((adet for _, adet in ciftler), dtype=np.float32, count=len(ciftler))
+    agirliklar = (1 + np.log(adetler)) * idf[nolar]
+    if len(nolar) > TERIM_SINIRI:
+        secilen = np.argpartition(-agirliklar, TERIM_SINIRI)[:TERIM_SINIRI]
+        nolar, agirliklar = nolar[secilen], agirliklar[secilen]
+    sira = np.argsort(nolar)
+    return nolar[sira], agirliklar[sira] / np.linalg.norm(agirliklar)
+
+
+def vektorlestir(belgeler):
+    """
+    `belgeler` terim listeleridir. (sözlük, idf, satırları belge olan CSR
+    matris) döner.
+    """
+    sayimlar = [Counter(belge) for belge in belgeler]
+    belge_sikligi = Counter()
+    for sayim in sayimlar:
+        belge_sikligi.update(sayim.keys())
+    ust_sinir = min(max(EN_FAZLA_BELGE_ALT_SINIRI, len(sayimlar) * EN_FAZLA_BELGE_ORANI), EN_FAZLA_BELGE)
+    sozluk = sorted(terim for terim, adet in belge_sikligi.items() if EN_AZ_BELGE <= adet <= ust_sinir)
+    indeks = {terim: no for no, terim in enumerate(sozluk)}
+    siklik = np.array([belge_sikligi[terim] for terim in sozluk], dtype=np.float32)
+    idf = (np.log((1 + len(sayimlar)) / (1 + siklik)) + 1).astype(np.float32)
+
+    satirlar = [_vektor(sayim, indeks, idf) for sayim in sayimlar]
+    indptr = np.zeros(len(satirlar) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(nolar) for nolar, _ in satirlar])
+    matris = sparse.csr_matrix(
+        (
+            np.concatenate([a for _, a in satirlar]) if satirlar else np.empty(0, dtype=np.float32),
+            np.concatenate([n for n, _ in satirlar]) if satirlar else np.empty(0, dtype=np.int32),
+            indptr,
+        ),
+        shape=(len(satirlar), len(sozluk)),
+    )
+    return sozluk, idf, matris
+
+
+def komsulari_bul(matris, komsu_sayisi=KOMSU_SAYISI):
+    """Her satır için [(satır no, skor), ...] (en benzerden başlayarak) üretir."""
+    devrik = matris.T.tocsr()
+    for bas in range(0, matris.shape[0], PARCA_BOYUTU):
+        carpim = (matris[bas:bas + PARCA_BOYUTU] @ devrik).tocsr()
+        for satir in range(carpim.shape[0]):
+            sutunlar = carpim.indices[carpim.indptr[satir]:carpim.indptr[satir + 1]]
+            skorlar = carpim.data[carpim.indptr[satir]:carpim.indptr[satir + 1]]
+            kendisi_degil = sutunlar != bas + satir
+            sutunlar, skorlar = sutunlar[kendisi_degil], skorlar[kendisi_degil]
+            if len(skorlar) > komsu_sayisi:
+                secilen = np.argpartition(-skorlar, komsu_sayisi)[:komsu_sayisi]
+                sutunlar, skorlar = sutunlar[secilen], skorlar[secilen]
+            sira = np.argsort(-skorlar, kind='stable')
+            yield [(int(sutunlar[i]), float(skorlar[i])) for i in sira]
+
+
+# --- VERİTABANI İLE BAĞLANTI ---
+
+def _metin(tur, nesne):
+    # Başlık iki kez: başlıktaki kelime gövdedekinden daha belirleyicidir
+    if tur == 'haber':
+        return f'{nesne.baslik} {nesne.baslik} {nesne.ozet} {nesne.icerik}'
+    return f'{nesne.baslik} {nesne.baslik} {nesne.icerik}'
+
+
+def _kart(tur, nesne):
+    """Listelerde kopyalanan (başlık, görsel adı, yayın tarihi)."""
+    if tur == 'haber':
+        return nesne.baslik, nesne.resim.name or '', nesne.yayin_tarihi
+    return nesne.baslik, nesne.manset_resmi.name or nesne.yazar.resim.name or '', nesne.yayin_tarihi
+
+
+def _belgeler():
+    haberler = Haber.objects.filter(aktif_mi=True).only('baslik', 'ozet', 'icerik', 'resim', 'yayin_tarihi')
+    yazilar = (
+        KoseYazisi.objects.filter(aktif_mi=True).select_related('yazar')
+        .only('baslik', 'icerik', 'manset_resmi', 'yayin_tarihi', 'yazar__resim')
+    )
+    for tur, queryset in (('haber', haberler), ('yazi', yazilar)):
+        for nesne in queryset.order_by('pk').iterator(chunk_size=2000):
+            yield (tur, nesne.pk), _metin(tur, nesne), _kart(tur, nesne)
+
+
+def _satir(kaynak, hedef, skor, kart):
+    return BenzerIcerik(
+        kaynak_tur=kaynak[0], kaynak_id=kaynak[1], hedef_tur=hedef[0], hedef_id=hedef[1], skor=skor,
+        baslik=kart[0], resim=kart[1], yayin_tarihi=kart[2],
+    )
+
+
+def dizini_olustur(dizin=None):
+    """Tüm aktif haber ve yazılardan dizini baştan kurar; (belge, satır) sayısı döner."""
+    anahtarlar, belgeler, kartlar = [], [], []
+    for anahtar, metin, kart in _belgeler():
+        anahtarlar.append(anahtar)
+        belgeler.append(terimler(metin))
+        kartlar.append(kart)
+    sozluk, idf, matris = vektorlestir(belgeler)
+
+    toplam = 0
+    with transaction.atomic():
+        BenzerIcerik.objects.all().delete()
+        BenzerlikVektoru.objects.all().delete()
+        satirlar = []
+        for no, komsular in enumerate(komsulari_bul(matris)):
+            satirlar += [_satir(anahtarlar[no], anahtarlar[j], skor, kartlar[j]) for j, skor in komsular]
+            if len(satirlar) >= 5000:
+                BenzerIcerik.objects.bulk_create(satirlar)
+                toplam += len(satirlar)
+                satirlar = []
+        BenzerIcerik.objects.bulk_create(satirlar)
+        toplam += len(satirlar)
+        _durumu_kaydet(dizin or settings.BENZERLIK_DIZINI, sozluk, idf, matris, anahtarlar)
+    silme_surumunu_artir(BenzerIcerik)
+    return len(anahtarlar), toplam
+
+
+@dataclass
+class _Durum:
+    indeks: dict
+    idf: np.ndarray
+    matris: sparse.csr_matrix
+    anahtarlar: list
+    satir_nolari: dict
+
+
+_durumlar = {}
+
+
+def _durumu_kaydet(dizin, sozluk, idf, matris, anahtarlar):
+    os.makedirs(dizin, exist_ok=True)
+    yol = os.path.join(dizin, DOSYA)
+    gecici = f'{yol}.{os.getpid()}.tmp.npz'
+    np.savez(
+        gecici, sozluk=np.array(sozluk, dtype=str), idf=idf,
+        veri=matris.data, sutunlar=matris.indices, satir_baslari=matris.indptr, boyut=np.array(matris.shape),
+        turler=np.array([TUR_KODLARI[tur] for tur, _ in anahtarlar], dtype=np.int8),
+        idler=np.array([pk for _, pk in anahtarlar], dtype=np.int64),
+    )
+    os.replace(gecici, yol)
+
+
+def _durum():
+    """Kayıtlı tam kurulum; dosya değiştiyse yeniden okunur. Kurulum yoksa None."""
+    yol = os.path.join(settings.BENZERLIK_DIZINI, DOSYA)
+    try:
+        zaman = os.path.getmtime(yol)
+    except OSError:
+        return None
+    onbellekte = _durumlar.get(yol)
+    if onbellekte and onbellekte[0] == zaman:
+        return onbellekte[1]
+    with np.load(yol) as dosya:
+        tur_adlari = {kod: tur for tur, kod in TUR_KODLARI.items()}
+        anahtarlar = [(tur_adlari[int(kod)], int(pk)) for kod, pk in zip(dosya['turler'], dosya['idler'])]
+        durum = _Durum(
+            indeks={terim: no for no, terim in enumerate(dosya['sozluk'].tolist())},
+            idf=dosya['idf'],
+            matris=sparse.csr_matrix(
+                (dosya['veri'], dosya['sutunlar'], dosya['satir_baslari']), shape=tuple(dosya['boyut']),
+            ),
+            anahtarlar=anahtarlar,
+            satir_nolari={anahtar: no for no, anahtar in enumerate(anahtarlar)},
+        )
+    _durumlar[yol] = (zaman, durum)
+    return durum
+
+
+def _listeler_sorgusu(anahtarlar):
+    return reduce(or_, (Q(kaynak_tur=tur, kaynak_id=pk) for tur, pk in anahtarlar))
+
+
+def benzer_icerikler(tur, pk):
+    return list(BenzerIcerik.objects.filter(kaynak_tur=tur, kaynak_id=pk).order_by('-skor')[:KOMSU_SAYISI])
+
+
+def kategori_yenileri(haber):
+    """
+    Dizin henüz kurulmamışken ya da haberin listesi boşken: aynı kategorinin
+    (yoksa sitenin) en yeni haberleri, kaydedilmemiş BenzerIcerik olarak.
+    """
+    haberler = Haber.objects.filter(aktif_mi=True).exclude(pk=haber.pk).kartlar().order_by('-yayin_tarihi')
+    yeniler = list(haberler.filter(kategori_id=haber.kategori_id)[:KOMSU_SAYISI]) or list(haberler[:KOMSU_SAYISI])
+    return [_satir(('haber', haber.pk), ('haber', h.pk), 0.0, _kart('haber', h)) for h in yeniler]
+
+
+def dizinden_cikar(tur, pk):
+    """Belgeyi tüm listelerden çıkarır; listesi değişen belgeleri döner."""
+    etkilenen = set(BenzerIcerik.objects.filter(hedef_tur=tur, hedef_id=pk).values_list('kaynak_tur', 'kaynak_id'))
+    BenzerIcerik.objects.filter(Q(hedef_tur=tur, hedef_id=pk) | Q(kaynak_tur=tur, kaynak_id=pk)).delete()
+    BenzerlikVektoru.objects.filter(tur=tur, nesne_id=pk).delete()
+    silme_surumunu_artir(BenzerIcerik)
+    return etkilenen
+
+
+def _adaylar(durum, anahtar, nolar, agirliklar):
+    """Belgeye en benzer ADAY_SAYISI belge: {anahtar: skor}."""
+    skorlar = {}
+    if len(nolar):
+        sorgu = np.zeros(durum.matris.shape[1], dtype=np.float32)
+        sorgu[nolar] = agirliklar
+        benzerlik = durum.matris @ sorgu
+        for no in np.argsort(-benzerlik)[:ADAY_SAYISI * 2]:
+            if benzerlik[no] > 0:
+                skorlar[durum.anahtarlar[no]] = float(benzerlik[no])
+    # Son kurulumdan beri değişen belgelerin matristeki satırı eskidir
+    sorgu = dict(zip(nolar.tolist(), agirliklar.tolist()))
+    vektorler = BenzerlikVektoru.objects.order_by('-id').values_list('tur', 'nesne_id', 'terimler')
+    for tur, nesne_id, terimler in vektorler[:EN_FAZLA_ARTIMLI_VEKTOR]:
+        diger = (tur, nesne_id)
+        skor = sum(agirlik * sorgu.get(int(no), 0.0) for no, agirlik in terimler.items())
+        skorlar.pop(diger, None)
+        if skor > 0:
+            skorlar[diger] = skor
+    skorlar.pop(anahtar, None)
+    return dict(sorted(skorlar.items(), key=lambda oge: -oge[1])[:ADAY_SAYISI])
+
+
+def _aktif_kartlar(anahtarlar):
+    kartlar = {}
+    haberler = Haber.objects.filter(aktif_mi=True, pk__in=[pk for tur, pk in anahtarlar if tur == 'haber'])
+    for haber in haberler.only('baslik', 'resim', 'yayin_tarihi'):
+        kartlar[('haber', haber.pk)] = _kart('haber', haber)
+    yazilar = (
+        KoseYazisi.objects.filter(aktif_mi=True, pk__in=[pk for tur, pk in anahtarlar if tur == 'yazi'])
+        .select_related('yazar').only('baslik', 'manset_resmi', 'yayin_tarihi', 'yazar__resim')
+    )
+    for yazi in yazilar:
+        kartlar[('yazi', yazi.pk)] = _kart('yazi', yazi)
+    return kartlar
+
+
+def belgeyi_guncelle(nesne, update_fields=None):
+    """
+    Kaydedilen haber ya da yazı için dizini günceller; listesi değişen
+    belgeleri (tür, pk) olarak döner. `update_fields` post_save'den gelir.
+    """
+    if update_fields is not None and not update_fields & (METIN_ALANLARI | KART_ALANLARI):
+        return set()
+    tur = 'haber' if isinstance(nesne, Haber) else 'yazi'
+    anahtar = (tur, nesne.pk)
+    if not nesne.aktif_mi:
+        return dizinden_cikar(tur, nesne.pk)
+
+    kendi_karti = baslik, resim, yayin_tarihi = _kart(tur, nesne)
+    kopyalar = BenzerIcerik.objects.filter(hedef_tur=tur, hedef_id=nesne.pk).exclude(
+        baslik=baslik, resim=resim, yayin_tarihi=yayin_tarihi,
+    )
+    etkilenen = set(kopyalar.values_list('kaynak_tur', 'kaynak_id'))
+    if etkilenen:
+        for kopya in kopyalar:
+            kopya.baslik, kopya.resim, kopya.yayin_tarihi = baslik, resim, yayin_tarihi
+            kopya.save(update_fields=['baslik', 'resim', 'yayin_tarihi'])
+
+    durum = _durum()
+    if durum is None or (update_fields is not None and not update_fields & METIN_ALANLARI):
+        return etkilenen
+    nolar, agirliklar = _vektor(Counter(terimler(_metin(tur, nesne))), durum.indeks, durum.idf)
+    yeni = {str(no): round(float(agirlik), 6) for no, agirlik in zip(nolar, agirliklar)}
+    kayitli = BenzerlikVektoru.objects.filter(tur=tur, nesne_id=nesne.pk).first()
+    if kayitli:
+        onceki = kayitli.terimler
+    elif anahtar in durum.satir_nolari:
+        satir = durum.matris[durum.satir_nolari[anahtar]]
+        onceki = {str(no): round(float(agirlik), 6) for no, agirlik in zip(satir.indices, satir.data)}
+    else:
+        onceki = None
+    if onceki == yeni and BenzerIcerik.objects.filter(kaynak_tur=tur, kaynak_id=nesne.pk).exists():
+        return etkilenen
+    BenzerlikVektoru.objects.update_or_create(tur=tur, nesne_id=nesne.pk, defaults={'terimler': yeni})
+
+    adaylar = _adaylar(durum, anahtar, nolar, agirliklar)
+    kartlar = _aktif_kartlar(adaylar)
+    adaylar = {diger: skor for diger, skor in adaylar.items() if diger in kartlar}
+
+    # Kendi listesi; silinen satırlar koşullu GET'in silme sürümünü ilerletir
+    BenzerIcerik.objects.filter(kaynak_tur=tur, kaynak_id=nesne.pk).delete()
+    silme_surumunu_artir(BenzerIcerik)
+    BenzerIcerik.objects.bulk_create([
+        _satir(anahtar, diger, skor, kartlar[diger]) for diger, skor in list(adaylar.items())[:KOMSU_SAYISI]
+    ])
+    etkilenen.add(anahtar)
+
+    # Başkalarının listeleri: eski skoruyla girdiği yerlerden çıkar, yeni skoruyla girebildiği yerlere girer
+    eski = BenzerIcerik.objects.filter(hedef_tur=tur, hedef_id=nesne.pk)
+    etkilenen |= set(eski.values_list('kaynak_tur', 'kaynak_id'))
+    eski.delete()
+    if adaylar:
+        listeler = {}
+        for satir in BenzerIcerik.objects.filter(_listeler_sorgusu(adaylar)).order_by('skor'):
+            listeler.setdefault((satir.kaynak_tur, satir.kaynak_id), []).append(satir)
+        eklenecek = []
+        for diger, skor in adaylar.items():
+            listesi = listeler.get(diger, [])
+            if len(listesi) >= KOMSU_SAYISI:
+                if skor <= listesi[0].skor:
+                    continue
+                listesi[0].delete()
+            eklenecek.append(_satir(diger, anahtar, skor, kendi_karti))
+            etkilenen.add(diger)
+        BenzerIcerik.objects.bulk_create(eklenecek)
+    return etkilenen
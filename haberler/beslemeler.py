@@ -0,0 +1,201 @@
+"""
+RSS 2.0 ve Atom beslemeleri.
+
+Tüm haberler, her kategori, her ilçe, her yazarın köşe yazıları ve şiirler için
+son BESLEME_BOYUTU kayıt. Gövde kayıt anında saklanan işlenmiş gövdeden
+(`govde_html`) gelir, besleme isteğinde şablon ya da video gömme işi yapılmaz.
+
+Beslemeler sayfalar gibi anonim sayfa önbelleğinden sunulur; yayınlanan kayıt
+signals.py'deki yol temizliğiyle kendi beslemelerini de düşürür. Önbellekten
+önce kosullu_get çalışır: okuyucu aynı ETag/Last-Modified ile tekrar sorarsa
+besleme hiç üretilmeden 304 döner.
+"""
+from django.contrib.syndication.views import Feed
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+
+from .cache import anonim_sayfa_onbellegi
+from .kosullu import kosullu_get
+from .models import Haber, Ilce, Kategori, KoseYazari, KoseYazisi, Siir
+
+BESLEME_BOYUTU = 30
+SITE_ADI = 'Artvizyon Haber'
+
+
+class HaberBeslemesi(Feed):
+    url_adi = 'rss_haberler'
+    language = 'tr'
+
+    def get_object(self, request, *args, **kwargs):
+        return None
+
+    def title(self, obj):
+        return f"{SITE_ADI} - Son Haberler"
+
+    def description(self, obj):
+        return "Artvin'den son dakika haberleri ve güncel gelişmeler."
+
+    def subtitle(self, obj):
+        return self.description(obj)
+
+    def link(self, obj):
+        return reverse('anasayfa')
+
+    def haberler(self, obj):
+        return Haber.objects.filter(aktif_mi=True)
+
+    def items(self, obj):
+        return (
+            self.haberler(obj).select_related('kategori')
+            .order_by('-yayin_tarihi', '-id')[:BESLEME_BOYUTU]
+        )
+
+    def item_title(self, item):
+        return item.baslik
+
+    def item_description(self, item):
+        return item.govde_html
+
+    def item_link(self, item):
+        return reverse('haber_detay', args=[item.pk])
+
+    def item_pubdate(self, item):
+        return item.yayin_tarihi
+
+    def item_updateddate(self, item):
+        return item.guncellenme_tarihi
+
+    def item_categories(self, item):
+        return [item.kategori.isim]
+
+
+class KategoriBeslemesi(HaberBeslemesi):
+    url_adi = 'rss_kategori'
+
+    def get_object(self, request, pk):
+        return get_object_or_404(Kategori, pk=pk)
+
+    def title(self, obj):
+        return f"{SITE_ADI} - {obj.isim}"
+
+    def description(self, obj):
+        return f"{obj.isim} kategorisindeki son haberler."
+
+    def link(self, obj):
+        return reverse('kategori_haberleri', args=[obj.pk])
+
+    def haberler(self, obj):
+        return Haber.objects.filter(aktif_mi=True, kategori=obj)
+
+
+class IlceBeslemesi(HaberBeslemesi):
+    url_adi = 'rss_ilce'
+
+    def get_object(self, request, pk):
+        return get_object_or_404(Ilce, pk=pk)
+
+    def title(self, obj):
+        return f"{SITE_ADI} - {obj.isim}"
+
+    def description(self, obj):
+        return f"{obj.isim} ilçesinden son haberler."
+
+    def link(self, obj):
+        return reverse('ilce_haberleri', args=[obj.pk])
+
+    def haberler(self, obj):
+        return Haber.objects.filter(aktif_mi=True, ilce=obj)
+
+
+class YazarBeslemesi(HaberBeslemesi):
+    url_adi = 'rss_yazar'
+
+    def get_object(self, request, pk):
+        return get_object_or_404(KoseYazari, pk=pk)
+
+    def title(self, obj):
+        return f"{SITE_ADI} - {obj.ad_soyad}"
+
+    def description(self, obj):
+        return f"{obj.ad_soyad} köşe yazıları."
+
+    def link(self, obj):
+        son_yazisi = obj.son_yazisi
+        return reverse('yazi_detay', args=[son_yazisi.pk]) if son_yazisi else reverse('anasayfa')
+
+    def items(self, obj):
+        return (
+            KoseYazisi.objects.filter(aktif_mi=True, yazar=obj).select_related('yazar')
+            .order_by('-yayin_tarihi', '-id')[:BESLEME_BOYUTU]
+        )
+
+    def item_link(self, item):
+        return reverse('yazi_detay', args=[item.pk])
+
+    def item_author_name(self, item):
+        return item.yazar.ad_soyad
+
+    def item_categories(self, item):
+        return ["Köşe Yazısı"]
+
+
+class SiirBeslemesi(HaberBeslemesi):
+    url_adi = 'rss_siir'
+
+    def title(self, obj):
+        return f"{SITE_ADI} - Şiir Köşesi"
+
+    def description(self, obj):
+        return "Şiir köşesine eklenen son şiirler."
+
+    def link(self, obj):
+        return reverse('siir_listesi')
+
+    def items(self, obj):
+        return Siir.objects.filter(aktif_mi=True).select_related('yazar').order_by('-yayin_tarihi', '-id')[:BESLEME_BOYUTU]
+
+    def item_link(self, item):
+        return reverse('siir_detay', args=[item.pk])
+
+    def item_author_name(self, item):
+        return item.yazar.ad_soyad if item.yazar else item.sair or None
+
+    def item_categories(self, item):
+        return ["Şiir"]
+
+
+def _atom(besleme_sinifi):
+    return type(besleme_sinifi.__name__ + 'Atom', (besleme_sinifi,), {
+        'feed_type': Atom1Feed, 'url_adi': besleme_sinifi.url_adi.replace('rss_', 'atom_'),
+    })
+
+
+def _gorunum(besleme_sinifi, kaynaklar):
+    return kosullu_get(kaynaklar)(anonim_sayfa_onbellegi(besleme_sinifi()))
+
+
+# (yol, besleme, koşullu GET kaynakları). Kategori ve ilçe adları menü verisidir;
+# değişiklikleri içerik sürümüyle ETag'e zaten girer.
+BESLEMELER = [
+    ('', HaberBeslemesi, lambda request: [Haber.objects.all()]),
+    ('kategori/<int:pk>/', KategoriBeslemesi, lambda request, pk: [Haber.objects.filter(kategori_id=pk)]),
+    ('ilce/<int:pk>/', IlceBeslemesi, lambda request, pk: [Haber.objects.filter(ilce_id=pk)]),
+    ('yazar/<int:pk>/', YazarBeslemesi,
+     lambda request, pk: [KoseYazari.objects.filter(pk=pk), KoseYazisi.objects.filter(yazar_id=pk)]),
+    ('siir/', SiirBeslemesi, lambda request: [Siir.objects.all(), KoseYazari.objects.all()]),
+]
+
+
+def besleme_adresleri():
+    """urls.py için (yol, görünüm, ad) üçlüleri: /rss/... ve /atom/..."""
+    adresler = []
+    for yol, besleme_sinifi, kaynaklar in BESLEMELER:
+        for onek, sinif in (('rss/', besleme_sinifi), ('atom/', _atom(besleme_sinifi))):
+            adresler.append((onek + yol, _gorunum(sinif, kaynaklar), sinif.url_adi))
+    return adresler
+
+
+def besleme_yollari(url_adi, *args):
+    """Bir beslemenin RSS ve Atom yolları (önbellek temizliği için)."""
+    return [reverse(url_adi, args=args), reverse(url_adi.replace('rss_', 'atom_'), args=args)]
@@ -0,0 +1,230 @@
+"""
+Sürümlü önbellek yardımcıları.
+
+İçerik modelleri kaydedildiğinde ya da silindiğinde "içerik sürümü" güncellenir.
+Sürüm önbellek anahtarının bir parçası olduğu için eski kayıtları tek tek silmeye
+gerek kalmaz; yeni sürümle gelen ilk istek veriyi yeniden üretir, eskiler zaman
+aşımıyla kendiliğinden düşer.
+"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+
+ICERIK_SURUMU_ANAHTARI = 'haberler:icerik_surumu'
+SAYAC_ANAHTARI = 'haberler:sayac:{ad}:{tur}'
+SILME_SURUMU_ANAHTARI = 'haberler:silme_surumu:{model}'
+SAYFA_ONBELLEK_SURESI = getattr(settings, 'SAYFA_ONBELLEK_SURESI', 600)
+
+# Bu süreçte kullanılan önbellek adları (istatistik uç noktası için)
+_kayitli_adlar = set()
+
+
+def icerik_surumu():
+    """
+    Geçerli içerik sürümünü döner. Sürüm, son değişikliğin milisaniye cinsinden
+    zaman damgasıdır; önbellekten düşmüşse yeni bir damga ile yeniden başlatılır.
+    """
+    surum = cache.get(ICERIK_SURUMU_ANAHTARI)
+    if surum is None:
+        cache.add(ICERIK_SURUMU_ANAHTARI, int(time.time() * 1000), None)
+        surum = cache.get(ICERIK_SURUMU_ANAHTARI)
+    return surum
+
+
+def icerik_surumunu_artir():
+    yeni = int(time.time() * 1000)
+    eski = cache.get(ICERIK_SURUMU_ANAHTARI)
+    # Aynı milisaniyedeki iki değişiklik de sürümü ilerletmeli
+    if eski is not None and yeni <= eski:
+        yeni = eski + 1
+    cache.set(ICERIK_SURUMU_ANAHTARI, yeni, None)
+
+
+def silme_surumleri(modeller):
+    """
+    Her model için son silmenin damgası. Silinen kayıt MAX(guncellenme_tarihi)
+    değerini değiştirmeyebilir; koşullu GET bu damgayı ETag'e katar. Önbellekten
+    düşen damga yeni bir damgayla başlar (doğrulayıcılar bir kez geçersiz olur).
+    """
+    anahtarlar = [SILME_SURUMU_ANAHTARI.format(model=model._meta.label_lower) for model in modeller]
+    degerler = cache.get_many(anahtarlar)
+    for anahtar in anahtarlar:
+        if anahtar not in degerler:
+            cache.add(anahtar, time.time_ns(), None)
+            degerler[anahtar] = cache.get(anahtar)
+    return [degerler[anahtar] for anahtar in anahtarlar]
+
+
+def silme_surumunu_artir(model):
+    cache.set(SILME_SURUMU_ANAHTARI.format(model=model._meta.label_lower), time.time_ns(), None)
+
+
+def _sayac_artir(ad, tur):
+    anahtar = SAYAC_ANAHTARI.format(ad=ad, tur=tur)
+    cache.add(anahtar, 0, None)
+    try:
+        cache.incr(anahtar)
+    except ValueError:
+        # Anahtar add ile incr arasında düştüyse sayımı kaçırmak sorun değil
+        pass
+
+
+def surumlu_getir(ad, uretici, timeout=300):
+    """
+    `ad` için içerik sürümüne bağlı önbellek kaydını döner; yoksa `uretici()`
+    çağrılır ve sonuç saklanır. İsabet/ıska sayıları `onbellek_istatistikleri`
+    ile okunabilir.
+    """
+    _kayitli_adlar.add(ad)
+    anahtar = f'haberler:{ad}:{icerik_surumu()}'
+    deger = cache.get(anahtar)
+    if deger is not None:
+        _sayac_artir(ad, 'isabet')
+        return deger
+
+    _sayac_artir(ad, 'iska')
+    deger = uretici()
+    cache.set(anahtar, deger, timeout)
+    return deger
+
+
+def onbellek_istatistikleri():
+    anahtarlar = {
+        SAYAC_ANAHTARI.format(ad=ad, tur=tur): (ad, tur)
+        for ad in _kayitli_adlar
+        for tur in ('isabet', 'iska')
+    }
+    degerler = cache.get_many(list(anahtarlar))
+    sonuc = {ad: {'isabet': 0, 'iska': 0} for ad in _kayitli_adlar}
+    for anahtar, (ad, tur) in anahtarlar.items():
+        sonuc[ad][tur] = degerler.get(anahtar, 0)
+    return sonuc
+
+
+# --- ANONİM OKUYUCULAR İÇİN TAM SAYFA ÖNBELLEĞİ ---
+# Anahtar; genel nesil + yol nesli + sorgu dizesinden oluşur. Bir yolun neslini
+# değiştirmek o yolun tüm sayfalarını (?page=2 dahil) geçersiz kılar, genel nesil
+# ise menü gibi her sayfada görünen veriler değiştiğinde hepsini birden düşürür.
+SAYFA_ANAHTARI = 'haberler:sayfa:{genel}:{nesil}:{ozet}'
+SAYFA_NESLI_ANAHTARI = 'haberler:sayfa_nesli:{yol}'
+GENEL_SAYFA_NESLI_ANAHTARI = 'haberler:sayfa_nesli'
+# Menü imzası ve en son hangi içerik sürümünde karşılaştırıldığı
+MENU_IMZASI_ANAHTARI = 'haberler:menu_imzasi'
+MENU_DENETIMI_ANAHTARI = 'haberler:menu_denetimi'
+
+
+def _ozet(metin):
+    return hashlib.md5(metin.encode('utf-8')).hexdigest()
+
+
+def sayfa_anahtari(request):
+    """İsteğin tam sayfa önbellek anahtarı; istek başına bir kez hesaplanır."""
+    if not hasattr(request, '_sayfa_anahtari'):
+        request._sayfa_anahtari = _sayfa_anahtari(request)
+    return request._sayfa_anahtari
+
+
+def _sayfa_anahtari(request):
+    yol_anahtari = SAYFA_NESLI_ANAHTARI.format(yol=_ozet(request.path))
+    nesiller = cache.get_many(
+        [GENEL_SAYFA_NESLI_ANAHTARI, yol_anahtari, ICERIK_SURUMU_ANAHTARI, MENU_DENETIMI_ANAHTARI]
+    )
+    surum = nesiller.get(ICERIK_SURUMU_ANAHTARI)
+    if surum is None or surum != nesiller.get(MENU_DENETIMI_ANAHTARI):
+        # İçerik değişti; her sayfada görünen menü de değiştiyse genel nesil
+        # ilerler. Yazan isteği yavaşlatmamak için bu iş okuyucuya bırakılır.
+        from .views import menuyu_denetle
+        menuyu_denetle(surum or icerik_surumu())
+        nesiller[GENEL_SAYFA_NESLI_ANAHTARI] = cache.get(GENEL_SAYFA_NESLI_ANAHTARI, 0)
+    return SAYFA_ANAHTARI.format(
+        genel=nesiller.get(GENEL_SAYFA_NESLI_ANAHTARI, 0),
+        nesil=nesiller.get(yol_anahtari, 0),
+        ozet=_ozet(request.get_full_path()),
+    )
+
+
+def sayfalari_temizle(*yollar):
+    """Verilen yolların önbellekteki tüm sayfalarını geçersiz kılar."""
+    damga = time.time_ns()
+    cache.set_many({SAYFA_NESLI_ANAHTARI.format(yol=_ozet(yol)): damga for yol in yollar}, None)
+
+
+def tum_sayfalari_temizle():
+    cache.set(GENEL_SAYFA_NESLI_ANAHTARI, time.time_ns(), None)
+
+
+def menu_imzasini_denetle(surum, imza):
+    """`surum` içerik sürümünün menü imzası öncekinden farklıysa tüm sayfaları temizler."""
+    if cache.get(MENU_IMZASI_ANAHTARI) != imza:
+        cache.set(MENU_IMZASI_ANAHTARI, imza, None)
+        tum_sayfalari_temizle()
+    cache.set(MENU_DENETIMI_ANAHTARI, surum, None)
+
+
+def _onbelleklenebilir(request, response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not request.META.get('CSRF_COOKIE_USED')
+    )
+
+
+def anonim_sayfa_onbellegi(view=None, *, isabette=None):
+    """
+    Giriş yapmamış okuyucuların GET isteklerini yol + sorgu dizesine göre
+    önbellekten yanıtlar. `isabette(request, *args, **kwargs)` verilirse önbellek
+    isabetinde de çağrılır (örn. okunma sayacı).
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def sarmalayici(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+                return view_func(request, *args, **kwargs)
+
+            _kayitli_adlar.add('sayfa')
+            anahtar = sayfa_anahtari(request)
+            response = cache.get(anahtar)
+            if response is not None:
+                _sayac_artir('sayfa', 'isabet')
+                if isabette:
+                    isabette(request, *args, **kwargs)
+                return response
+
+            _sayac_artir('sayfa', 'iska')
+            response = view_func(request, *args, **kwargs)
+            if _onbelleklenebilir(request, response):
+                cache.set(anahtar, response, SAYFA_ONBELLEK_SURESI)
+            return response
+        # kosullu_get doğrulayıcıları sayfayla aynı anahtar altında saklar
+        sarmalayici.sayfa_onbellekli = True
+        return sarmalayici
+
+    if view is not None:
+        return decorator(view)
+    return decorator
+
+
+# --- ŞABLON PARÇA ÖNBELLEĞİ ---
+# Ağır şablon bölgeleri {% cache %} ile saklanır; anahtara parçanın sürümü
+# katılır: {% cache 600 anasayfa_manset parca_surumleri.manset %}. Parçanın
+# bağlı olduğu modellerden biri değişince (signals.py) yalnızca o parçanın
+# sürümü ilerler. 'navigasyon' menü verisinin içerik sürümüdür.
+PARCA_SURUMU_ANAHTARI = 'haberler:parca_surumu:{ad}'
+PARCALAR = ('manset', 'yazarlar', 'ozel_gun')
+
+
+def parca_surumleri():
+    anahtarlar = {PARCA_SURUMU_ANAHTARI.format(ad=ad): ad for ad in PARCALAR}
+    degerler = cache.get_many(list(anahtarlar))
+    surumler = {ad: degerler.get(anahtar, 0) for anahtar, ad in anahtarlar.items()}
+    surumler['navigasyon'] = icerik_surumu()
+    return surumler
+
+
+def parca_surumunu_artir(*adlar):
+    damga = time.time_ns()
+    cache.set_many({PARCA_SURUMU_ANAHTARI.format(ad=ad): damga for ad in adlar}, None)
@@ -0,0 +1,109 @@
+"""
+Okunma sayacı tamponu.
+
+Her sayfa görüntülemesinde satır güncellemek SQLite'ta yazma kilidini alır ve
+okuyucuları bekletir. Bunun yerine artışlar süreç belleğinde toplanır; arka plan
+iş parçacığı belirli aralıklarla model başına tek bir işlemde (transaction)
+toplu olarak yazar. Gösterilen sayı = veritabanındaki değer + bekleyen artış.
+"""
+import atexit
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+
+logger = logging.getLogger(__name__)
+
+# SQLite'ın değişken sınırına takılmamak için tek UPDATE'teki satır sayısı
+PARCA_BOYUTU = 300
+
+_bekleyen = Counter()  # {(model, pk): artış}
+_kilit = threading.Lock()
+_dur = threading.Event()
+_otomatik = False
+_yazici_pid = None
+
+
+def okunma_artir(model, pk, adet=1):
+    with _kilit:
+        _bekleyen[(model, pk)] += adet
+    if _otomatik and _yazici_pid != os.getpid():
+        _yaziciyi_baslat()
+
+
+def bekleyen_okunma(model, pk):
+    with _kilit:
+        return _bekleyen.get((model, pk), 0)
+
+
+def okunmalari_yaz():
+    """Bekleyen artışları veritabanına yazar, yazılan satır sayısını döner."""
+    with _kilit:
+        tampon = dict(_bekleyen)
+        _bekleyen.clear()
+    if not tampon:
+        return 0
+
+    modele_gore = defaultdict(dict)
+    for (model, pk), adet in tampon.items():
+        modele_gore[model][pk] = adet
+
+    yazilan = 0
+    for model, artislar in modele_gore.items():
+        try:
+            with transaction.atomic():
+                pkler = list(artislar)
+                for i in range(0, len(pkler), PARCA_BOYUTU):
+                    parca = pkler[i:i + PARCA_BOYUTU]
+                    artis = Case(
+                        *[When(pk=pk, then=Value(artislar[pk])) for pk in parca],
+                        default=Value(0), output_field=IntegerField(),
+                    )
+                    model.objects.filter(pk__in=parca).update(okunma_sayisi=F('okunma_sayisi') + artis)
+            yazilan += len(artislar)
+        except Exception:
+            logger.exception("Okunma sayıları yazılamadı (%s), tekrar denenecek", model.__name__)
+            # Sayımlar kaybolmasın diye tampona geri konur
+            with _kilit:
+                for pk, adet in artislar.items():
+                    _bekleyen[(model, pk)] += adet
+    return yazilan
+
+
+def _yazici_dongusu(aralik):
+    while not _dur.wait(aralik):
+        okunmalari_yaz()
+        # Bu iş parçacığının bağlantısı uzun süre açık kalmasın
+        connection.close()
+
+
+def _yaziciyi_baslat():
+    global _yazici_pid
+    with _kilit:
+        if _yazici_pid == os.getpid():
+            return
+        # fork sonrası (gunicorn --preload) her worker kendi yazıcısını başlatır
+        _yazici_pid = os.getpid()
+    aralik = getattr(settings, 'OKUNMA_YAZMA_ARALIGI', 10)
+    threading.Thread(target=_yazici_dongusu, args=(aralik,), name='okunma-yazici', daemon=True).start()
+
+
+def otomatik_yazmayi_etkinlestir():
+    """
+    Web sunucusu süreçlerinde (wsgi/asgi) çağrılır: ilk artışta arka plan
+    yazıcısı başlar, süreç düzgün kapanırken bekleyen sayılar yazılır.
+    """
+    global _otomatik
+    if _otomatik:
+        return
+    _otomatik = True
+    atexit.register(_kapanista_yaz)
+
+
+def _kapanista_yaz():
+    _dur.set()
+    okunmalari_yaz()
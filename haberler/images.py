@@ -0,0 +1,344 @@
+"""
+Arka planda işlenen görseller.
+
+`ErtelenmisGorselAlani`, imagekit'in ProcessedImageField'ı ile aynı ayarları
+(processors/format/options) alır; ancak yüklenen dosyayı kaydetme anında
+işlemez. Ham dosya `bekleyen/` altına yazılır, `GorselIsi` kuyruğuna bir iş
+eklenir ve yönetim paneli isteği hemen döner. İş bitene kadar sitede yer tutucu
+görsel gösterilir. İşleri çalıştırmak için:
+
+    python manage.py gorsel_isleyici          # sürekli çalışır
+    python manage.py gorsel_isleyici --bir-kez
+
+Varsayılan eşzamanlı (eski) davranıştır; kuyruk GORSEL_ISLEME_ARKA_PLANDA = True
+ile açılır; o zaman yukarıdaki işçi de sürekli çalıştırılmalıdır.
+
+Son hâline gelen her görsel için ayrıca farklı genişliklerde WebP (Pillow
+destekliyorsa AVIF) varyantları `turevler/` altına bir kez üretilir; şablonlarda
+`{% duyarli_gorsel %}` etiketi bunlardan srcset oluşturur (bkz.
+haberler/templatetags/gorsel_tags.py).
+"""
+import hashlib
+import json
+import logging
+import os
+import traceback
+from datetime import timedelta
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db.models.signals import post_save
+from django.templatetags.static import static
+from django.utils import timezone
+from imagekit.models import ProcessedImageField
+from imagekit.models.fields.files import ProcessedImageFieldFile
+from imagekit.utils import generate, suggest_extension
+from PIL import Image
+
+from .veritabani import yazma_islemi
+
+try:
+    # Pillow sürümü AVIF'i kendisi desteklemiyorsa eklenti varsa o kullanılır
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+BEKLEYEN_DIZINI = 'bekleyen/'
+YER_TUTUCU = 'img/gorsel-hazirlaniyor.svg'
+EN_FAZLA_DENEME = 3
+# Bu süreden uzun "işleniyor" kalan işin işçisi ölmüş sayılır ve iş sıraya geri döner
+ASILI_IS_SURESI = timedelta(minutes=15)
+
+VARYANT_DIZINI = 'turevler/'
+VARYANT_GENISLIKLERI = (160, 320, 480, 640, 800, 1024)
+VARYANT_KALITESI = {'avif': 55, 'webp': 75}
+# Varyantı henüz olmayan görsel için "yok" bilgisi kısa tutulur ki işçi bitirince çabuk görünsün
+VARYANT_ONBELLEK_SURESI = 24 * 60 * 60
+VARYANT_YOK_SURESI = 60
+
+
+def arka_planda_mi():
+    return getattr(settings, 'GORSEL_ISLEME_ARKA_PLANDA', False)
+
+
+def bekliyor_mu(isim):
+    return bool(isim) and isim.startswith(BEKLEYEN_DIZINI)
+
+
+class ErtelenmisGorselDosyasi(ProcessedImageFieldFile):
+    def save(self, name, content, save=True):
+        if not arka_planda_mi():
+            return super().save(name, content, save)
+        # Django'nun FieldFile.save'i ile aynı, yalnızca hedef `bekleyen/` altında
+        name = self.field.generate_filename(self.instance, name)
+        self.name = self.storage.save(BEKLEYEN_DIZINI + name, content, max_length=self.field.max_length)
+        setattr(self.instance, self.field.attname, self.name)
+        self._committed = True
+        if save:
+            self.instance.save()
+
+    save.alters_data = True
+
+    @property
+    def hazir_mi(self):
+        return not bekliyor_mu(self.name)
+
+    @property
+    def url(self):
+        if bekliyor_mu(self.name):
+            return static(YER_TUTUCU)
+        return super().url
+
+
+class ErtelenmisGorselAlani(ProcessedImageField):
+    attr_class = ErtelenmisGorselDosyasi
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+        if not cls._meta.abstract:
+            post_save.connect(self._is_ekle, sender=cls, weak=False,
+                              dispatch_uid=f'gorsel_isi_{cls._meta.label_lower}_{name}')
+
+    def _is_ekle(self, sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        isim = getattr(getattr(instance, self.attname), 'name', None)
+        if not isim:
+            return
+        if bekliyor_mu(isim):
+            gorsel_isi_ekle(instance, self.name, kaynak=isim)
+        elif not varyant_bilgisi(isim, self.storage):
+            if arka_planda_mi():
+                gorsel_isi_ekle(instance, self.name, kaynak=isim, tur='varyant')
+            elif self.storage.exists(isim):
+                # Dosyası olmayan yol (içe aktarılmış kayıt, taşınmamış medya) için üretilecek bir şey yok
+                try:
+                    varyantlari_uret(isim, self.storage)
+                except Exception:
+                    logger.exception("Varyantlar üretilemedi: %s", isim)
+
+
+def gorsel_isi_ekle(instance, alan, kaynak='', tur='turev'):
+    GorselIsi = apps.get_model('haberler', 'GorselIsi')
+    is_, _ = GorselIsi.objects.get_or_create(
+        model_etiketi=instance._meta.label_lower, nesne_id=instance.pk, alan=alan,
+        kaynak=kaynak, tur=tur, durum=GorselIsi.BEKLIYOR,
+    )
+    return is_
+
+
+# --- DUYARLI VARYANTLAR ---
+
+def desteklenen_bicimler():
+    """Tarayıcıya öncelik sırasıyla sunulacak biçimler."""
+    Image.init()
+    return [bicim for bicim in ('avif', 'webp') if bicim.upper() in Image.SAVE]
+
+
+def _varyant_dizini(isim):
+    return VARYANT_DIZINI + os.path.splitext(isim)[0] + '/'
+
+
+def _varyant_anahtari(isim):
+    return 'gorsel_varyant:' + hashlib.md5(isim.encode('utf-8')).hexdigest()
+
+
+def varyant_bilgisi(isim, storage):
+    """
+    Görselin varyant listesi ({'genislikler': [...], 'bicimler': [...], ...});
+    henüz üretilmemişse boş sözlük. Sonuç önbellekte tutulur, disk her
+    render'da yoklanmaz.
+    """
+    if not isim or bekliyor_mu(isim):
+        return {}
+    anahtar = _varyant_anahtari(isim)
+    bilgi = cache.get(anahtar)
+    if bilgi is None:
+        manifest = _varyant_dizini(isim) + 'manifest.json'
+        bilgi = {}
+        if storage.exists(manifest):
+            with storage.open(manifest, 'rb') as f:
+                bilgi = json.load(f)
+        cache.set(anahtar, bilgi, VARYANT_ONBELLEK_SURESI if bilgi else VARYANT_YOK_SURESI)
+    return bilgi
+
+
+def varyant_url(isim, storage, genislik, bicim):
+    return storage.url(f'{_varyant_dizini(isim)}{genislik}.{bicim}')
+
+
+def _ayar_imzasi():
+    """Genişlik/biçim/kalite ayarı değişince eski varyantlar güncel sayılmasın."""
+    return f'{VARYANT_GENISLIKLERI}|{desteklenen_bicimler()}|{sorted(VARYANT_KALITESI.items())}'
+
+
+def _icerik_ozeti(veri):
+    return hashlib.sha1(veri).hexdigest()
+
+
+def varyantlar_guncel_mi(isim, storage):
+    """Manifest var ve kaynağın içeriği de ayarlar da değişmemişse True."""
+    manifest = _varyant_dizini(isim) + 'manifest.json'
+    if not storage.exists(manifest):
+        return False
+    with storage.open(manifest, 'rb') as f:
+        bilgi = json.load(f)
+    if bilgi.get('ayar') != _ayar_imzasi():
+        return False
+    with storage.open(isim, 'rb') as f:
+        return bilgi.get('ozet') == _icerik_ozeti(f.read())
+
+
+def varyantlari_uret(isim, storage):
+    """Kaynaktan küçük her genişlik (ve kaynağın kendi genişliği) için varyant üretir."""
+    dizin = _varyant_dizini(isim)
+    with storage.open(isim, 'rb') as f:
+        veri = f.read()
+    kaynak = Image.open(BytesIO(veri))
+    kaynak.load()
+    if kaynak.mode not in ('RGB', 'RGBA'):
+        kaynak = kaynak.convert('RGBA' if 'A' in kaynak.getbands() or 'transparency' in kaynak.info else 'RGB')
+
+    en, boy = kaynak.size
+    genislikler = sorted({g for g in VARYANT_GENISLIKLERI if g < en} | {en})
+    bicimler = desteklenen_bicimler()
+    for genislik in genislikler:
+        gorsel = kaynak if genislik == en else kaynak.resize(
+            (genislik, max(1, round(boy * genislik / en))), Image.LANCZOS)
+        for bicim in bicimler:
+            tampon = BytesIO()
+            gorsel.save(tampon, format=bicim.upper(), quality=VARYANT_KALITESI[bicim])
+            hedef = f'{dizin}{genislik}.{bicim}'
+            if storage.exists(hedef):
+                storage.delete(hedef)
+            storage.save(hedef, ContentFile(tampon.getvalue()))
+
+    bilgi = {
+        'kaynak': isim, 'en': en, 'boy': boy, 'genislikler': genislikler, 'bicimler': bicimler,
+        'ozet': _icerik_ozeti(veri), 'ayar': _ayar_imzasi(),
+    }
+    manifest = dizin + 'manifest.json'
+    if storage.exists(manifest):
+        storage.delete(manifest)
+    # Manifest en son yazılır: varsa tüm varyantlar hazırdır
+    storage.save(manifest, ContentFile(json.dumps(bilgi).encode('utf-8')))
+    cache.set(_varyant_anahtari(isim), bilgi, VARYANT_ONBELLEK_SURESI)
+    return bilgi
+
+
+# --- İŞÇİ ---
+
+def _turev_uret(is_, nesne):
+    alan = nesne._meta.get_field(is_.alan)
+    dosya = getattr(nesne, is_.alan)
+    if dosya.name != is_.kaynak:
+        # Bu arada yeni bir dosya yüklenmiş; o da kendi işini almıştır
+        return
+
+    with alan.storage.open(is_.kaynak, 'rb') as kaynak:
+        spec = alan.get_spec(source=kaynak)
+        icerik = generate(spec)
+        govde, _ = os.path.splitext(is_.kaynak[len(BEKLEYEN_DIZINI):])
+        hedef = govde + suggest_extension(is_.kaynak, spec.format)
+        yeni_isim = alan.storage.save(hedef, ContentFile(icerik.read()), max_length=alan.max_length)
+
+    setattr(nesne, alan.attname, yeni_isim)
+    # save() sinyalleri tetikler: sayfa önbelleği ve sürümler güncellenir
+    nesne.save(update_fields=[alan.attname])
+    alan.storage.delete(is_.kaynak)
+
+
+def _instagram_uret(is_, nesne):
+    if nesne.instagram_gorseli:
+        return
+    nesne.instagram_gorseli_olustur()
+    # Metot hataları kendisi yutuyor; sonuç yoksa iş hatalı sayılsın
+    if not nesne.instagram_gorseli:
+        raise RuntimeError("Instagram postu oluşturulamadı")
+
+
+def _varyant_uret(is_, nesne):
+    dosya = getattr(nesne, is_.alan)
+    if dosya.name != is_.kaynak:
+        return
+    varyantlari_uret(dosya.name, dosya.storage)
+    # Sayfa artık srcset içeriyor; save() sinyalleri önbellekteki sayfaları
+    # temizler ve guncellenme_tarihi'ni (koşullu GET doğrulayıcıları) ilerletir
+    nesne.save(update_fields=[nesne._meta.get_field(is_.alan).attname])
+
+
+ISLEYICILER = {
+    'turev': _turev_uret,
+    'instagram': _instagram_uret,
+    'varyant': _varyant_uret,
+}
+
+
+def _isi_calistir(is_):
+    model = apps.get_model(is_.model_etiketi)
+    nesne = model.objects.filter(pk=is_.nesne_id).first()
+    if nesne is not None:
+        ISLEYICILER[is_.tur](is_, nesne)
+
+
+def asili_isler(queryset):
+    """İşçisi iş ortasında öldürülmüş ya da çökmüş (ASILI_IS_SURESI'ni aşan) işler."""
+    GorselIsi = apps.get_model('haberler', 'GorselIsi')
+    return queryset.filter(durum=GorselIsi.ISLENIYOR, guncellenme_tarihi__lt=timezone.now() - ASILI_IS_SURESI)
+
+
+def asili_isleri_kurtar():
+    """
+    Asılı işleri sıraya geri koyar; deneme hakkı bitenler hatalı sayılır.
+    Sıraya dönen iş sayısını döner.
+    """
+    GorselIsi = apps.get_model('haberler', 'GorselIsi')
+    asililar = asili_isler(GorselIsi.objects.all())
+    hata = "İşçi iş bitmeden durdu (zaman aşımı)."
+    asililar.filter(deneme__gte=EN_FAZLA_DENEME).update(
+        durum=GorselIsi.HATA, hata=hata, guncellenme_tarihi=timezone.now(),
+    )
+    return asililar.update(durum=GorselIsi.BEKLIYOR, hata=hata, guncellenme_tarihi=timezone.now())
+
+
+def gorsel_islerini_calistir(en_fazla=None):
+    """
+    Bekleyen işleri sırayla çalıştırır, işlenen iş sayısını döner. Aynı işi iki
+    işçinin almaması için iş önce koşullu UPDATE ile sahiplenilir. Önce asılı
+    kalmış işler sıraya geri konur.
+    """
+    GorselIsi = apps.get_model('haberler', 'GorselIsi')
+    asili_isleri_kurtar()
+    islenen = 0
+    while en_fazla is None or islenen < en_fazla:
+        is_ = GorselIsi.objects.filter(durum=GorselIsi.BEKLIYOR).order_by('id').first()
+        if is_ is None:
+            break
+        sahiplenildi = GorselIsi.objects.filter(pk=is_.pk, durum=GorselIsi.BEKLIYOR).update(
+            durum=GorselIsi.ISLENIYOR, deneme=is_.deneme + 1, guncellenme_tarihi=timezone.now(),
+        )
+        if not sahiplenildi:
+            continue
+        is_.deneme += 1
+
+        try:
+            # Nesneyi okuyup sonra kaydeder; yazma kilidi baştan alınır
+            with yazma_islemi():
+                _isi_calistir(is_)
+        except Exception:
+            logger.exception("Görsel işi başarısız: %s", is_)
+            durum = GorselIsi.HATA if is_.deneme >= EN_FAZLA_DENEME else GorselIsi.BEKLIYOR
+            GorselIsi.objects.filter(pk=is_.pk).update(
+                durum=durum, hata=traceback.format_exc()[-2000:], guncellenme_tarihi=timezone.now(),
+            )
+        else:
+            GorselIsi.objects.filter(pk=is_.pk).update(
+                durum=GorselIsi.TAMAM, hata='', guncellenme_tarihi=timezone.now(),
+            )
+        islenen += 1
+    return islenen
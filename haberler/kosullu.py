@@ -0,0 +1,140 @@
+"""
+Koşullu GET: ETag ve Last-Modified doğrulayıcıları.
+
+Her görünüm sayfada gösterdiği kayıtların sorgu kümelerini bildirir. Hepsinin
+MAX(guncellenme_tarihi) değeri tek bir UNION ALL sorgusuyla okunur; her biri
+guncellenme_tarihi indeksinde tek bir aramadır, tablo büyüdükçe yavaşlamaz:
+
+    ETag           her kaynağın son değişikliği + kaynak modellerinin silme
+                   sürümleri + menü içerik sürümü + son dakika bandı +
+                   şablonlar + GOVDE_SURUMU
+    Last-Modified  bunların içindeki en yeni zaman
+
+Okuyucu ya da arama motoru botu aynı doğrulayıcıyla gelirse görünüm hiç
+çalışmadan 304 döner. Tam sayfa önbelleğindeki görünümlerde hesaplanan
+doğrulayıcılar da sayfa anahtarı, içerik sürümü ve silme sürümleriyle
+önbelleğe konur; sıcak istek (200 ya da 304) veritabanına hiç inmez. Silinen kayıt en yeni zamanı değiştirmeyebilir; silme
+sürümünü signals.py'deki post_delete ilerletir (bkz. cache.silme_surumleri).
+Giriş yapmış kullanıcılara ve bekleyen mesajı olan
+isteklere doğrulayıcı verilmez: sayfa kullanıcıya özgüdür, mesaj da 304 ile
+hiç gösterilmeden kaybolurdu.
+"""
+import hashlib
+import os
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache, wraps
+from operator import itemgetter
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db.models import IntegerField, Max, Value
+from django.views.decorators.http import condition
+
+from .cache import SAYFA_ONBELLEK_SURESI, icerik_surumu, sayfa_anahtari, silme_surumleri
+from .rendering import GOVDE_SURUMU
+
+DOGRULAYICI_ANAHTARI = 'haberler:dogrulayici:{ozet}'
+
+
+@lru_cache(maxsize=None)
+def sablon_damgasi():
+    """(en yeni şablon dosyasının zamanı, şablon sayısı); süreç başına bir kez okunur."""
+    damgalar = []
+    for dizin in settings.TEMPLATES[0]['DIRS']:
+        for kok, _, dosyalar in os.walk(dizin):
+            damgalar.extend(os.path.getmtime(os.path.join(kok, dosya)) for dosya in dosyalar)
+    return max(damgalar, default=0.0), len(damgalar)
+
+
+def kaynak_durumlari(kaynaklar):
+    """Her sorgu kümesinin son güncellenme zamanı; tek sorguda."""
+    if not kaynaklar:
+        return []
+    sorgular = [
+        queryset.order_by().annotate(kaynak_sirasi=Value(i, output_field=IntegerField())).values('kaynak_sirasi')
+        .annotate(son=Max('guncellenme_tarihi')).values_list('kaynak_sirasi', 'son')
+        for i, queryset in enumerate(kaynaklar)
+    ]
+    birlesik = sorgular[0].union(*sorgular[1:], all=True) if len(sorgular) > 1 else sorgular[0]
+    return [son for _, son in sorted(birlesik, key=itemgetter(0))]
+
+
+def _ozet(deger):
+    return hashlib.md5(repr(deger).encode('utf-8')).hexdigest()
+
+
+def _dogrulayici(request, kaynaklar, imza, onbellekli, args, kwargs):
+    """(etag, son_degisiklik) ya da None; ETag ve Last-Modified için bir kez hesaplanır."""
+    if hasattr(request, '_dogrulayici'):
+        return request._dogrulayici
+    request._dogrulayici = None
+    if request.method not in ('GET', 'HEAD') or request.user.is_authenticated or len(get_messages(request)):
+        return None
+
+    from .views import global_context
+
+    kaynak_listesi = kaynaklar(request, *args, **kwargs)
+    silmeler = silme_surumleri(sorted({queryset.model for queryset in kaynak_listesi}, key=lambda model: model._meta.label))
+    ek_imza = imza(request, *args, **kwargs) if imza else None
+    surum = icerik_surumu()
+    sablon_zamani, sablon_adedi = sablon_damgasi()
+    surumler = (silmeler, ek_imza, surum, sablon_zamani, sablon_adedi, GOVDE_SURUMU)
+
+    anahtar = None
+    if onbellekli:
+        # Sayfa önbellekteyken gösterdiği kayıtlar da değişmemiştir (değişseydi
+        # sayfa anahtarı değişirdi); doğrulayıcılar yeniden hesaplanmaz
+        anahtar = DOGRULAYICI_ANAHTARI.format(ozet=_ozet((sayfa_anahtari(request), surumler)))
+        request._dogrulayici = cache.get(anahtar)
+        if request._dogrulayici is not None:
+            return request._dogrulayici
+
+    durumlar = kaynak_durumlari(kaynak_listesi)
+    son_dakika = [haber.pk for haber in global_context(request)['son_dakika']]
+    etag = _ozet((durumlar, son_dakika, surumler))
+    zamanlar = [son for son in durumlar if son] + [
+        datetime.fromtimestamp(silme / 1e9, tz=dt_timezone.utc) for silme in silmeler
+    ] + [
+        datetime.fromtimestamp(surum / 1000, tz=dt_timezone.utc),
+        datetime.fromtimestamp(sablon_zamani, tz=dt_timezone.utc),
+    ]
+    request._dogrulayici = (etag, max(zamanlar))
+    if anahtar:
+        cache.set(anahtar, request._dogrulayici, SAYFA_ONBELLEK_SURESI)
+    return request._dogrulayici
+
+
+def kosullu_get(kaynaklar, *, isabette=None, imza=None):
+    """
+    `kaynaklar(request, *args, **kwargs)` sayfadaki kayıtların sorgu
+    kümelerini döner. `imza` verilirse aynı argümanlarla çağrılır ve sonucu
+    ETag'e katılır; veritabanına sorulmadan bilinen değişiklikler için
+    (örn. önbellekteki rozet dizini). `isabette` verilirse 304 yanıtlarda da
+    çağrılır (örn. okunma sayacı). anonim_sayfa_onbellegi'nin dışına konmalıdır ki
+    304 sayfa önbelleğine bile uğramadan dönsün; o zaman doğrulayıcılar da
+    önbellekten okunur.
+
+        @kosullu_get(lambda request, pk: [Haber.objects.filter(pk=pk)])
+    """
+    def decorator(view_func):
+        onbellekli = getattr(view_func, 'sayfa_onbellekli', False)
+
+        def etag(request, *args, **kwargs):
+            dogrulayici = _dogrulayici(request, kaynaklar, imza, onbellekli, args, kwargs)
+            return dogrulayici[0] if dogrulayici else None
+
+        def son_degisiklik(request, *args, **kwargs):
+            dogrulayici = _dogrulayici(request, kaynaklar, imza, onbellekli, args, kwargs)
+            return dogrulayici[1] if dogrulayici else None
+
+        kosullu = condition(etag_func=etag, last_modified_func=son_degisiklik)(view_func)
+
+        @wraps(view_func)
+        def sarmalayici(request, *args, **kwargs):
+            response = kosullu(request, *args, **kwargs)
+            if response.status_code == 304 and isabette:
+                isabette(request, *args, **kwargs)
+            return response
+        return sarmalayici
+    return decorator
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from haberler.models import Haber, KoseYazisi, Siir, TarihiYer
+from haberler.search import dizin_kullanilabilir, dizini_yeniden_olustur
+
+
+class Command(BaseCommand):
+    help = "Site içi arama dizinini (FTS5) tüm aktif içeriklerden yeniden oluşturur."
+
+    def handle(self, *args, **options):
+        if not dizin_kullanilabilir():
+            raise CommandError("Arama tablosu yok (SQLite/FTS5 gerekli, önce migrate çalıştırın).")
+        toplam = dizini_yeniden_olustur({
+            'haber': Haber, 'yazi': KoseYazisi, 'siir': Siir, 'tarihi_yer': TarihiYer,
+        })
+        self.stdout.write(self.style.SUCCESS(f"{toplam} içerik dizine eklendi."))
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from haberler.images import gorsel_islerini_calistir
+
+
+class Command(BaseCommand):
+    help = "Yüklenen görselleri (boyutlandırma, Instagram postu) kuyruktan alıp işler."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bir-kez', action='store_true', help="Bekleyen işleri bitirip çık (cron için).")
+        parser.add_argument('--aralik', type=float, default=2.0, help="Kuyruk boşken bekleme süresi (saniye).")
+
+    def handle(self, *args, **options):
+        if options['bir_kez']:
+            adet = gorsel_islerini_calistir()
+            self.stdout.write(self.style.SUCCESS(f"{adet} görsel işi çalıştırıldı."))
+            return
+
+        self.stdout.write("Görsel işçisi başladı, durdurmak için Ctrl+C.")
+        try:
+            while True:
+                adet = gorsel_islerini_calistir()
+                if adet:
+                    self.stdout.write(f"{adet} görsel işi çalıştırıldı.")
+                else:
+                    connection.close()
+                    time.sleep(options['aralik'])
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,91 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from haberler.images import ErtelenmisGorselAlani, bekliyor_mu, varyantlar_guncel_mi, varyantlari_uret
+
+RESIM_UZANTILARI = ('.jpg', '.jpeg', '.png', '.webp')
+
+
+def _isle(gorev):
+    """Alt süreçte çalışır; veritabanına dokunmaz, yalnızca depolama kullanır."""
+    isim, zorla = gorev
+    try:
+        if not zorla and varyantlar_guncel_mi(isim, default_storage):
+            return 'guncel', isim, ''
+        varyantlari_uret(isim, default_storage)
+        return 'uretildi', isim, ''
+    except Exception as e:
+        return 'hata', isim, str(e)
+
+
+def _dizini_gez(storage, dizin):
+    dizinler, dosyalar = storage.listdir(dizin)
+    for dosya in dosyalar:
+        yield f'{dizin}{dosya}'
+    for alt in dizinler:
+        yield from _dizini_gez(storage, f'{dizin}{alt}/')
+
+
+class Command(BaseCommand):
+    help = (
+        "Tüm görsel alanları ve CKEditor yüklemeleri için eksik/eski duyarlı varyantları "
+        "paralel olarak üretir. Yarıda kesilirse yeniden çalıştırmak yeterlidir: "
+        "tamamlananlar içerik özetinden tanınıp atlanır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--isci', type=int, default=os.cpu_count() or 1, help="Süreç sayısı (varsayılan: çekirdek sayısı).")
+        parser.add_argument('--zorla', action='store_true', help="Güncel olanlar dahil hepsini yeniden üret.")
+        parser.add_argument('--yuklemeler-haric', action='store_true', help="CKEditor uploads/ klasörünü atla.")
+
+    def _isimler(self, yuklemeler_haric):
+        isimler = set()
+        for model in apps.get_app_config('haberler').get_models():
+            for alan in model._meta.fields:
+                if not isinstance(alan, ErtelenmisGorselAlani):
+                    continue
+                degerler = model.objects.exclude(**{alan.attname: ''}).exclude(**{f'{alan.attname}__isnull': True})
+                isimler.update(isim for isim in degerler.values_list(alan.attname, flat=True) if not bekliyor_mu(isim))
+
+        yukleme_dizini = getattr(settings, 'CKEDITOR_UPLOAD_PATH', 'uploads/')
+        if not yuklemeler_haric and default_storage.exists(yukleme_dizini):
+            for isim in _dizini_gez(default_storage, yukleme_dizini.rstrip('/') + '/'):
+                govde, uzanti = os.path.splitext(isim)
+                # CKEditor'ün kendi küçük resimleri atlanır
+                if uzanti.lower() in RESIM_UZANTILARI and not govde.endswith('_thumb'):
+                    isimler.add(isim)
+
+        # Kayıtta adı geçip diskte olmayan dosyalar hata olarak sayılmasın
+        return sorted(isim for isim in isimler if default_storage.exists(isim))
+
+    def handle(self, *args, **options):
+        isimler = self._isimler(options['yuklemeler_haric'])
+        self.stdout.write(f"{len(isimler)} görsel bulundu, {options['isci']} süreçle işleniyor...")
+
+        # Alt süreçler fork ile ana sürecin açık bağlantısını devralmasın
+        connections.close_all()
+        sayac = {'uretildi': 0, 'guncel': 0, 'hata': 0}
+        baslangic = time.perf_counter()
+        gorevler = [(isim, options['zorla']) for isim in isimler]
+        with ProcessPoolExecutor(max_workers=max(1, options['isci'])) as havuz:
+            for i, (durum, isim, hata) in enumerate(havuz.map(_isle, gorevler, chunksize=8), 1):
+                sayac[durum] += 1
+                if durum == 'hata':
+                    self.stderr.write(f"HATA {isim}: {hata}")
+                if i % 100 == 0:
+                    gecen = time.perf_counter() - baslangic
+                    self.stdout.write(f"  {i}/{len(isimler)} ({i / gecen:.1f} görsel/sn)")
+
+        gecen = time.perf_counter() - baslangic
+        hiz = len(isimler) / gecen if gecen else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"{sayac['uretildi']} üretildi, {sayac['guncel']} zaten günceldi, {sayac['hata']} hatalı; "
+            f"{gecen:.1f} sn, {hiz:.1f} görsel/sn."
+        ))
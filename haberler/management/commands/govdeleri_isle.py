@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from haberler.cache import tum_sayfalari_temizle
+from haberler.models import Haber, KoseYazisi, Siir
+
+PARCA_BOYUTU = 200
+
+
+class Command(BaseCommand):
+    help = (
+        "Haber, köşe yazısı ve şiir gövdelerinin işlenmiş (video gömmeleri açılmış) "
+        "hâlini yeniden üretir. Yalnızca özeti tutmayanlar yazılır; gömme şablonu "
+        "değiştiğinde rendering.GOVDE_SURUMU artırılıp bu komut çalıştırılır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--zorla', action='store_true', help="Özeti tutanlar dahil hepsini yeniden üret.")
+
+    def handle(self, *args, **options):
+        toplam = 0
+        for model in (Haber, KoseYazisi, Siir):
+            alanlar = ('id', model.GOVDE_ALANI, 'islenmis_govde_ozeti')
+            degisen = []
+            for nesne in model.objects.only(*alanlar).iterator(chunk_size=PARCA_BOYUTU):
+                if options['zorla']:
+                    nesne.islenmis_govde_ozeti = ''
+                if nesne.govdeyi_guncelle():
+                    degisen.append(nesne)
+                if len(degisen) >= PARCA_BOYUTU:
+                    model.objects.bulk_update(degisen, ['islenmis_govde', 'islenmis_govde_ozeti'])
+                    toplam += len(degisen)
+                    degisen = []
+            if degisen:
+                model.objects.bulk_update(degisen, ['islenmis_govde', 'islenmis_govde_ozeti'])
+                toplam += len(degisen)
+            self.stdout.write(f"{model._meta.verbose_name_plural} tamam.")
+
+        if toplam:
+            # bulk_update sinyal göndermez; önbellekteki sayfalar eski gövdeyi göstermesin
+            tum_sayfalari_temizle()
+        self.stdout.write(self.style.SUCCESS(f"{toplam} gövde yeniden işlendi."))
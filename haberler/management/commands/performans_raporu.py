@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from haberler.benchmark import benzerlik_olc, olcum_istemcisi, ornek_veri_olustur, tum_adresleri_olc
+
+
+class GeriAl(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Herkese açık her adres için sorgu sayısı ve render süresini tablo olarak yazdırır; "
+        "sorgu ya da süre bütçesini aşan görünüm varsa hata koduyla çıkar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tohumla', action='store_true',
+            help="Ölçümden önce örnek veri oluşturur; iş bitince tüm değişiklikler geri alınır.",
+        )
+        parser.add_argument('--haber-sayisi', type=int, default=3000)
+        parser.add_argument(
+            '--benzerlik', type=int, metavar='BELGE',
+            help="Adresler yerine benzerlik dizininin tam kurulumunu bu kadar yapay belgeyle ölçer.",
+        )
+
+    def handle(self, *args, **options):
+        if options['benzerlik']:
+            olcum = benzerlik_olc(options['benzerlik'])
+            self.stdout.write(
+                f"{olcum.belge} belge, {olcum.terim} terim: vektörleştirme {olcum.vektorlestirme_sn:.1f} sn, "
+                f"komşular {olcum.komsu_sn:.1f} sn, tepe bellek {olcum.tepe_bellek_mb:.0f} MB"
+            )
+            return
+
+        try:
+            with transaction.atomic():
+                if options['tohumla']:
+                    ornek_veri_olustur(haber_sayisi=options['haber_sayisi'])
+                olcumler = tum_adresleri_olc(olcum_istemcisi())
+                if options['tohumla']:
+                    raise GeriAl
+        except GeriAl:
+            pass
+
+        self.stdout.write(
+            f"{'Görünüm':<24} {'Durum':>5} {'Sorgu':>6} {'Bütçe':>6} {'Tekrar':>6} "
+            f"{'Süre ms':>9} {'Sıcak sorgu':>11} {'Sıcak ms':>9}"
+        )
+        asim = 0
+        for olcum in olcumler:
+            butce_sorgu, butce_ms = olcum.butce or (None, None)
+            asti = butce_sorgu is not None and (olcum.sorgu > butce_sorgu or olcum.sure_ms > butce_ms)
+            asim += asti
+            satir = (
+                f"{olcum.ad:<24} {olcum.durum:>5} {olcum.sorgu:>6} {butce_sorgu or '-':>6} "
+                f"{olcum.tekrarlanan:>6} {olcum.sure_ms:>9.1f} {olcum.sicak_sorgu:>11} {olcum.sicak_sure_ms:>9.1f}"
+            )
+            self.stdout.write(self.style.ERROR(satir) if asti else satir)
+
+        if asim:
+            raise CommandError(f"{asim} görünüm bütçeyi aştı.")
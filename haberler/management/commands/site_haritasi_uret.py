@@ -0,0 +1,26 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from haberler.site_haritasi import tumunu_uret
+
+
+class Command(BaseCommand):
+    help = (
+        "sitemap.xml parçalarını ve Google News haritasını önceden üretir. "
+        "Yalnızca kayıtları değişen parçalar yeniden yazılır; cron'dan sık çağrılabilir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dizin', default=settings.SITE_HARITASI_DIZINI)
+
+    def handle(self, *args, **options):
+        baslangic = time.perf_counter()
+        uretilen, degismeyen, silinen = tumunu_uret(options['dizin'])
+        for ad in uretilen:
+            self.stdout.write(f"  yazıldı: {ad}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(uretilen)} parça yazıldı, {degismeyen} parça değişmedi, {len(silinen)} dosya silindi; "
+            f"{time.perf_counter() - baslangic:.1f} sn."
+        ))
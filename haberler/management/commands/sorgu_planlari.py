@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from haberler.benchmark import olcum_istemcisi, ornek_veri_olustur, sorgu_planlarini_denetle
+from haberler.management.commands.performans_raporu import GeriAl
+
+
+class Command(BaseCommand):
+    help = (
+        "Herkese açık her adresin sorgularını EXPLAIN QUERY PLAN ile inceler; büyük "
+        "tablolarda tam tarama (SCAN) ve geçici sıralama (TEMP B-TREE) yapanları listeler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tohumla', action='store_true',
+            help="Denetimden önce örnek veri oluşturur; iş bitince tüm değişiklikler geri alınır.",
+        )
+        parser.add_argument('--haber-sayisi', type=int, default=3000)
+        parser.add_argument('--kati', action='store_true', help="Tam tarama bulunursa hata koduyla çık (CI için).")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("EXPLAIN QUERY PLAN çıktısı yalnızca SQLite için yorumlanıyor.")
+        try:
+            with transaction.atomic():
+                if options['tohumla']:
+                    ornek_veri_olustur(haber_sayisi=options['haber_sayisi'])
+                bulgular = sorgu_planlarini_denetle(olcum_istemcisi())
+                if options['tohumla']:
+                    raise GeriAl
+        except GeriAl:
+            pass
+
+        tam_tarama = 0
+        for bulgu in bulgular:
+            stil = self.style.ERROR if bulgu.tam_taramalar else self.style.WARNING
+            etiket = f"TAM TARAMA ({', '.join(bulgu.tam_taramalar)})" if bulgu.tam_taramalar else "GEÇİCİ SIRALAMA"
+            tam_tarama += bool(bulgu.tam_taramalar)
+            self.stdout.write(stil(f"[{bulgu.ad}] {etiket}"))
+            self.stdout.write(f"  {bulgu.sql[:400]}")
+            for satir in bulgu.plan:
+                self.stdout.write(f"    {satir}")
+
+        ozet = f"{tam_tarama} sorguda tam tarama, {len(bulgular) - tam_tarama} sorguda yalnızca geçici sıralama."
+        if tam_tarama and options['kati']:
+            raise CommandError(ozet)
+        self.stdout.write(self.style.SUCCESS(ozet) if not bulgular else ozet)
@@ -0,0 +1,30 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from haberler.statik import disa_aktar
+
+
+class Command(BaseCommand):
+    help = (
+        "Herkese açık sayfaların tam işlenmiş HTML kopyasını nginx'in doğrudan sunabileceği "
+        "bir dizine yazar. Yalnızca kaynak kayıtları değişen sayfalar yeniden üretilir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dizin', default=settings.STATIK_KOPYA_DIZINI)
+        parser.add_argument('--isci', type=int, default=os.cpu_count() or 1, help="Süreç sayısı (varsayılan: çekirdek sayısı).")
+        parser.add_argument('--zorla', action='store_true', help="İmzası değişmeyenler dahil tüm sayfaları yeniden üret.")
+
+    def handle(self, *args, **options):
+        baslangic = time.perf_counter()
+        sonuc = disa_aktar(options['dizin'], isci=max(1, options['isci']), zorla=options['zorla'])
+        for adres, durum in sonuc.hatali:
+            self.stderr.write(f"HATA {adres}: HTTP {durum}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(sonuc.uretilen)} sayfa yazıldı, {sonuc.degismeyen} sayfanın çıktısı aynı kaldı, "
+            f"{sonuc.atlanan} sayfa atlandı, {len(sonuc.silinen)} sayfa silindi, {len(sonuc.hatali)} hatalı; "
+            f"{time.perf_counter() - baslangic:.1f} sn."
+        ))
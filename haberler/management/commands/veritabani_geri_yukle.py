@@ -0,0 +1,28 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from haberler.yedekleme import YedekHatasi, geri_yukle
+
+
+class Command(BaseCommand):
+    help = (
+        "veritabani_yedekle ile alınmış tam (.sqlite3.gz) ya da fark (.fark.gz) yedeğini "
+        "yeni bir SQLite dosyasına açar ve bütünlüğünü denetler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('yedek')
+        parser.add_argument('hedef', help="Oluşturulacak veritabanı dosyası.")
+        parser.add_argument('--zorla', action='store_true', help="Hedef dosya varsa üzerine yaz.")
+
+    def handle(self, *args, **options):
+        if not os.path.exists(options['yedek']):
+            raise CommandError(f"Yedek bulunamadı: {options['yedek']}")
+        if os.path.exists(options['hedef']) and not options['zorla']:
+            raise CommandError(f"{options['hedef']} zaten var; üzerine yazmak için --zorla verin.")
+        try:
+            geri_yukle(options['yedek'], options['hedef'])
+        except YedekHatasi as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f"Geri yüklendi: {options['hedef']}"))
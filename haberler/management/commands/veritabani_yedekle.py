@@ -0,0 +1,54 @@
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from haberler.yedekleme import YedekHatasi, eskileri_sil, yedekle
+
+VARSAYILAN_DIZIN = os.path.join(os.path.expanduser('~'), 'db_backups', 'artvizyon-haber')
+
+
+class Command(BaseCommand):
+    help = (
+        "SQLite veritabanını site çalışırken yedekleme API'siyle tutarlı biçimde yedekler, "
+        "bütünlüğünü denetler, gzip'ler ve eski yedekleri siler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dizin', default=os.getenv('YEDEK_DIZINI', VARSAYILAN_DIZIN))
+        parser.add_argument(
+            '--artimli', action='store_true',
+            help="Son tam yedekten bu yana yalnızca değişen sayfaları yaz.",
+        )
+        parser.add_argument('--tam-aralik', type=int, default=7, help="Artımlıda en fazla bu kadar günde bir tam yedek.")
+        parser.add_argument('--gun', type=int, default=30, help="Bu kadar günden eski yedekler silinir.")
+        parser.add_argument('--sayfa', type=int, default=1024, help="Her adımda kopyalanan sayfa sayısı.")
+        parser.add_argument('--bekleme', type=float, default=0.05, help="Adımlar arası bekleme (saniye).")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("Bu komut yalnızca SQLite içindir; PostgreSQL için pg_dump kullanın.")
+        veritabani = str(connection.settings_dict['NAME'])
+        if not os.path.exists(veritabani):
+            raise CommandError(f"Veritabanı bulunamadı: {veritabani}")
+
+        baslangic = time.perf_counter()
+        try:
+            with closing(sqlite3.connect(veritabani)) as kaynak:
+                sonuc = yedekle(
+                    kaynak, options['dizin'], artimli=options['artimli'], tam_aralik_gun=options['tam_aralik'],
+                    sayfa=options['sayfa'], bekleme=options['bekleme'],
+                )
+        except (YedekHatasi, sqlite3.Error) as e:
+            raise CommandError(f"Yedekleme başarısız: {e}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{sonuc.tur} yedek: {os.path.join(options['dizin'], sonuc.dosya)} "
+            f"({sonuc.boyut / 1024:.0f} KB, {sonuc.degisen_sayfa}/{sonuc.toplam_sayfa} sayfa, "
+            f"{time.perf_counter() - baslangic:.1f} sn)"
+        ))
+        for ad in eskileri_sil(options['dizin'], gun=options['gun']):
+            self.stdout.write(f"  silindi: {ad}")
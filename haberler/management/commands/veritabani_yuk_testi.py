@@ -0,0 +1,78 @@
+import os
+import tempfile
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.test.utils import override_settings
+
+from haberler.benchmark import eszamanli_yuk_olc, ornek_veri_olustur
+
+# SQLite'ın (ve Django'nun) kendi varsayılanları
+SQLITE_VARSAYILANLARI = {'journal_mode': 'DELETE', 'synchronous': 'FULL', 'mmap_size': 0}
+
+
+class Command(BaseCommand):
+    help = (
+        "Eşzamanlı okuma/yazma iş parçacıklarıyla veritabanı yapılandırmalarını karşılaştırır. "
+        "Ölçüm geçici bir test veritabanında yapılır; asıl veriye dokunulmaz."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--okuyucu', type=int, default=4)
+        parser.add_argument('--yazici', type=int, default=2)
+        parser.add_argument('--sure', type=float, default=5.0, help="Yapılandırma başına saniye.")
+        parser.add_argument('--haber-sayisi', type=int, default=500)
+
+    def _yapilandirmalar(self):
+        """(etiket, ayar değişiklikleri, bağlantı ayarı değişiklikleri) listesi."""
+        ayarlar = connection.settings_dict
+        if connection.vendor == 'sqlite':
+            return [
+                ('SQLite varsayılan (DELETE, FULL)', {'SQLITE_PRAGMALARI': SQLITE_VARSAYILANLARI}, {'CONN_MAX_AGE': 0}),
+                ('SQLite WAL + NORMAL + mmap', {}, {}),
+            ]
+        havuzsuz = {k: v for k, v in ayarlar['OPTIONS'].items() if k != 'pool'}
+        if 'pool' in ayarlar['OPTIONS']:
+            etiket = 'bağlantı havuzu'
+        else:
+            etiket = f"kalıcı bağlantı (CONN_MAX_AGE={ayarlar['CONN_MAX_AGE']})"
+        return [
+            (f'{connection.vendor}: istek başına bağlantı', {}, {'CONN_MAX_AGE': 0, 'OPTIONS': havuzsuz}),
+            (f'{connection.vendor}: {etiket}', {}, {}),
+        ]
+
+    def handle(self, *args, **options):
+        ayarlar = connection.settings_dict
+        gecici_dizin = None
+        if connection.vendor == 'sqlite':
+            # Bellek içi test veritabanı iş parçacıkları arasında paylaşılamaz
+            gecici_dizin = tempfile.mkdtemp(prefix='artvizyon-yuk-')
+            ayarlar['TEST']['NAME'] = os.path.join(gecici_dizin, 'yuk.sqlite3')
+        eski_ad = ayarlar['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            ornek_veri_olustur(haber_sayisi=options['haber_sayisi'])
+            olcumler = [self._olc(etiket, degisiklik, baglanti, options) for etiket, degisiklik, baglanti in self._yapilandirmalar()]
+        finally:
+            connections.close_all()
+            connection.creation.destroy_test_db(eski_ad, verbosity=0)
+            if gecici_dizin:
+                os.rmdir(gecici_dizin)
+
+        self.stdout.write(f"{'Yapılandırma':<40} {'Okuma/sn':>9} {'Yazma/sn':>9} {'Kilit hatası':>12}")
+        for olcum in olcumler:
+            satir = f"{olcum.yapilandirma:<40} {olcum.okuma_hizi:>9.1f} {olcum.yazma_hizi:>9.1f} {olcum.kilit_hatasi:>12}"
+            self.stdout.write(self.style.ERROR(satir) if olcum.kilit_hatasi else satir)
+
+    def _olc(self, etiket, degisiklik, baglanti, options):
+        ayarlar = connection.settings_dict
+        onceki = {anahtar: ayarlar[anahtar] for anahtar in baglanti}
+        # Yeni iş parçacıklarının bağlantıları da aynı ayar sözlüğünden açılır
+        ayarlar.update(baglanti)
+        connections.close_all()
+        try:
+            with override_settings(**degisiklik):
+                return eszamanli_yuk_olc(etiket, options['okuyucu'], options['yazici'], options['sure'])
+        finally:
+            connections.close_all()
+            ayarlar.update(onceki)
@@ -0,0 +1,83 @@
+"""
+Ana sayfa manşet şeridi.
+
+Manşetteki haberler ve köşe yazıları tek bir UNION ALL sorgusuyla, yayın
+tarihine göre sıralanıp LIMIT ile okunur; iki tablonun bütün manşetleri
+Python'a taşınıp sıralanmaz. Satırlar yalnızca şeridin gösterdiği sütunları
+taşır: yazı gövdesinin tamamı değil, özet için ilk OZET_KAYNAGI karakteri
+okunur.
+
+MANSET_GECERLILIK_GUNU verilirse manşet işareti kaldırılmayı unutulan eski
+kayıtlar o kadar günden sonra şeritten düşer; varsayılan olarak (None ya da 0)
+süre sınırı yoktur. Sorgu
+manset_mi=True kısmi indekslerini (haber_manset_idx, yazi_manset_idx) kullanır.
+"""
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import CharField, F, Value
+from django.db.models.functions import Substr
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from .models import Haber, KoseYazisi
+from .rendering import duz_metin
+
+MANSET_SINIRI = 10
+OZET_KAYNAGI = 1000
+OZET_UZUNLUGU = 110
+
+# Her iki yarının SELECT listesi aynı sırada olmalı
+SUTUNLAR = ('tur', 'kayit_id', 'baslik_metni', 'ozet_metni', 'gorsel', 'yazar_adi', 'tarih')
+
+
+@dataclass(frozen=True)
+class MansetOgesi:
+    tur: str
+    pk: int
+    baslik: str
+    ozet: str
+    resim: object
+    yazar_adi: str
+
+    @property
+    def adres(self):
+        return reverse('yazi_detay' if self.tur == 'yazi' else 'haber_detay', args=[self.pk])
+
+
+def _manset_sorgusu(model, **sutunlar):
+    queryset = model.objects.filter(aktif_mi=True, manset_mi=True)
+    gun = getattr(settings, 'MANSET_GECERLILIK_GUNU', None)
+    if gun:
+        queryset = queryset.filter(yayin_tarihi__gte=timezone.now() - timedelta(days=gun))
+    return queryset.order_by().annotate(**sutunlar).values_list(*SUTUNLAR)
+
+
+def mansetler(sinir=MANSET_SINIRI):
+    """Şeritteki en yeni `sinir` manşet, MansetOgesi olarak."""
+    metin = CharField()
+    haberler = _manset_sorgusu(
+        Haber, tur=Value('haber', output_field=metin), kayit_id=F('pk'), baslik_metni=F('baslik'),
+        ozet_metni=F('ozet'), gorsel=F('resim'), yazar_adi=Value('', output_field=metin), tarih=F('yayin_tarihi'),
+    )
+    yazilar = _manset_sorgusu(
+        KoseYazisi, tur=Value('yazi', output_field=metin), kayit_id=F('pk'), baslik_metni=F('baslik'),
+        ozet_metni=Substr('icerik', 1, OZET_KAYNAGI), gorsel=F('manset_resmi'), yazar_adi=F('yazar__ad_soyad'),
+        tarih=F('yayin_tarihi'),
+    )
+    satirlar = haberler.union(yazilar, all=True).order_by('-tarih', '-kayit_id')[:sinir]
+
+    haber_resmi = Haber._meta.get_field('resim')
+    yazi_resmi = KoseYazisi._meta.get_field('manset_resmi')
+    ogeler = []
+    for tur, pk, baslik, ozet, gorsel, yazar_adi, _ in satirlar:
+        alan = yazi_resmi if tur == 'yazi' else haber_resmi
+        ogeler.append(MansetOgesi(
+            tur=tur, pk=pk, baslik=baslik,
+            ozet=Truncator(duz_metin(ozet)).chars(OZET_UZUNLUGU) if tur == 'yazi' else ozet,
+            resim=alan.attr_class(None, alan, gorsel or None),
+            yazar_adi=yazar_adi,
+        ))
+    return ogeler
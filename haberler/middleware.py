@@ -0,0 +1,178 @@
+"""
+İstek profilleme middleware'i.
+
+Örneklenen her istek için toplam süre, SQL süresi, sorgu sayısı, tekrarlanan
+sorgular (N+1 belirtisi), şablon render süresi ve görünüm adı ölçülür. Eşiği
+aşan istekler dönen bir JSONL dosyasına yazılır; görünüm başına yüzdelikler
+yöneticilere /artvizyon-sami/profil-ozeti/ adresinden sunulur.
+
+Ayarlar:
+    PROFIL_ORNEKLEME_ORANI  0.0-1.0 arası, ölçülecek isteklerin oranı
+    PROFIL_YAVAS_ESIK_MS    bu süreyi aşan istekler günlüğe yazılır
+    PROFIL_GUNLUK_DOSYASI   JSONL dosyasının yolu
+"""
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from logging.handlers import RotatingFileHandler
+
+from django.conf import settings
+from django.db import connection
+from django.template.backends.django import Template as DjangoTemplate
+from django.utils import timezone
+
+logger = logging.getLogger('haberler.yavas_istekler')
+
+# Görünüm başına saklanan son ölçüm sayısı (yüzdelikler bunlardan hesaplanır)
+OZET_PENCERESI = 500
+# Görünüme çözülemeyen istekler (tarayıcı botlarının 404'leri gibi) tek anahtarda
+# toplanır; yol başına anahtar açılsaydı bellek sınırsız büyürdü
+COZUMLENEMEYEN = '<cozumlenemeyen>'
+
+_aktif_profil = contextvars.ContextVar('istek_profili', default=None)
+_ozetler = defaultdict(lambda: deque(maxlen=OZET_PENCERESI))
+_ozet_kilidi = threading.Lock()
+
+
+class IstekProfili:
+    def __init__(self):
+        self.sql_ms = 0.0
+        self.sablon_ms = 0.0
+        self.sqller = Counter()
+        self.sql_parametreleri = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        baslangic = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_ms += (time.perf_counter() - baslangic) * 1000
+            self.sqller[sql] += 1
+            self.sql_parametreleri[(sql, repr(params))] += 1
+
+    @property
+    def sorgu_sayisi(self):
+        return sum(self.sqller.values())
+
+    @property
+    def tekrarlanan(self):
+        """Aynı parametrelerle birebir tekrarlanan sorgu sayısı."""
+        return sum(adet - 1 for adet in self.sql_parametreleri.values())
+
+    def benzer_sorgular(self, en_fazla=5):
+        """Farklı parametrelerle tekrar eden sorgu kalıpları (N+1 adayları)."""
+        return [
+            {'sql': sql[:300], 'adet': adet}
+            for sql, adet in self.sqller.most_common(en_fazla) if adet > 1
+        ]
+
+
+_orijinal_render = DjangoTemplate.render
+
+
+def _olculen_render(self, context=None, request=None):
+    profil = _aktif_profil.get()
+    if profil is None:
+        return _orijinal_render(self, context, request)
+    baslangic = time.perf_counter()
+    try:
+        return _orijinal_render(self, context, request)
+    finally:
+        profil.sablon_ms += (time.perf_counter() - baslangic) * 1000
+
+
+# Yalnızca üst düzey şablon render'ı ölçülür (extends/include ayrıca sayılmaz).
+# Sarmalayıcı modül yüklenirken bir kez ve yalnızca profilleme açıksa kurulur;
+# örneklenmeyen isteklerde bir bağlam değişkeni okumaktan fazlasını yapmaz.
+if getattr(settings, 'PROFIL_ORNEKLEME_ORANI', 0.05) > 0:
+    DjangoTemplate.render = _olculen_render
+
+
+def _gunlugu_hazirla(dosya):
+    dosya = os.path.abspath(dosya)
+    if any(getattr(handler, 'baseFilename', None) == dosya for handler in logger.handlers):
+        return
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    os.makedirs(os.path.dirname(dosya), exist_ok=True)
+    handler = RotatingFileHandler(dosya, maxBytes=5 * 1024 * 1024, backupCount=5, encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class IstekProfiliMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.oran = getattr(settings, 'PROFIL_ORNEKLEME_ORANI', 0.05)
+        self.esik_ms = getattr(settings, 'PROFIL_YAVAS_ESIK_MS', 1000)
+        self.dosya = getattr(settings, 'PROFIL_GUNLUK_DOSYASI', os.path.join(settings.BASE_DIR, 'logs', 'yavas_istekler.jsonl'))
+
+    def __call__(self, request):
+        if self.oran <= 0 or random.random() >= self.oran:
+            return self.get_response(request)
+
+        profil = IstekProfili()
+        token = _aktif_profil.set(profil)
+        baslangic = time.perf_counter()
+        try:
+            with connection.execute_wrapper(profil):
+                response = self.get_response(request)
+        finally:
+            _aktif_profil.reset(token)
+        toplam_ms = (time.perf_counter() - baslangic) * 1000
+
+        match = getattr(request, 'resolver_match', None)
+        gorunum = match.view_name if match else COZUMLENEMEYEN
+        with _ozet_kilidi:
+            _ozetler[gorunum].append((toplam_ms, profil.sql_ms, profil.sorgu_sayisi, profil.sablon_ms))
+
+        if toplam_ms >= self.esik_ms:
+            _gunlugu_hazirla(self.dosya)
+            logger.info(json.dumps({
+                'zaman': timezone.now().isoformat(),
+                'gorunum': gorunum,
+                'yol': request.get_full_path(),
+                'metot': request.method,
+                'durum': response.status_code,
+                'toplam_ms': round(toplam_ms, 1),
+                'sql_ms': round(profil.sql_ms, 1),
+                'sablon_ms': round(profil.sablon_ms, 1),
+                'sorgu': profil.sorgu_sayisi,
+                'tekrarlanan': profil.tekrarlanan,
+                'benzer_sorgular': profil.benzer_sorgular(),
+            }, ensure_ascii=False))
+        return response
+
+
+def _yuzdelik(sirali, oran):
+    if not sirali:
+        return 0.0
+    return sirali[min(len(sirali) - 1, int(len(sirali) * oran))]
+
+
+def profil_ozeti():
+    """Bu süreçte ölçülen görünümler için yüzdelik özet."""
+    with _ozet_kilidi:
+        kopya = {gorunum: list(olcumler) for gorunum, olcumler in _ozetler.items()}
+    ozet = {}
+    for gorunum, olcumler in kopya.items():
+        sureler = sorted(olcum[0] for olcum in olcumler)
+        adet = len(olcumler)
+        ozet[gorunum] = {
+            'adet': adet,
+            'p50_ms': round(_yuzdelik(sureler, 0.50), 1),
+            'p90_ms': round(_yuzdelik(sureler, 0.90), 1),
+            'p99_ms': round(_yuzdelik(sureler, 0.99), 1),
+            'ort_sql_ms': round(sum(olcum[1] for olcum in olcumler) / adet, 1),
+            'ort_sorgu': round(sum(olcum[2] for olcum in olcumler) / adet, 1),
+            'ort_sablon_ms': round(sum(olcum[3] for olcum in olcumler) / adet, 1),
+        }
+    return ozet
@@ -0,0 +1,36 @@
+# Site içi arama için SQLite FTS5 sanal tablosu (bkz. haberler/search.py).
+# Göç yalnızca boş tabloyu oluşturur; mevcut içerik göçten sonra
+# `python manage.py arama_dizinini_olustur` ile dizine eklenir. Göç uygulama
+# koduna bağlı kalmasın diye tablo adı ve şeması burada sabittir.
+
+from django.db import OperationalError, migrations
+
+TABLO = 'haberler_arama'
+
+
+def dizini_olustur(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    try:
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLO} USING fts5(baslik, govde, tokenize='unicode61')"
+        )
+    except OperationalError:
+        # FTS5 derlenmemiş SQLite: arama icontains'e düşer
+        pass
+
+
+def dizini_kaldir(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {TABLO}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0021_haber_okunma_sayisi_koseyazisi_okunma_sayisi_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(dizini_olustur, dizini_kaldir),
+    ]
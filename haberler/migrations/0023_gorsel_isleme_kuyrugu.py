@@ -0,0 +1,89 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:54
+
+import haberler.images
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0022_arama_dizini'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GorselIsi',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_etiketi', models.CharField(max_length=100, verbose_name='Model')),
+                ('nesne_id', models.PositiveIntegerField(verbose_name='Kayıt No')),
+                ('alan', models.CharField(max_length=50, verbose_name='Alan')),
+                ('kaynak', models.CharField(blank=True, max_length=255, verbose_name='Ham Dosya')),
+                ('tur', models.CharField(choices=[('turev', 'Boyutlandırma'), ('instagram', 'Instagram Postu')], default='turev', max_length=20, verbose_name='İş Türü')),
+                ('durum', models.CharField(choices=[('bekliyor', 'Sırada'), ('isleniyor', 'İşleniyor'), ('tamam', 'Tamamlandı'), ('hata', 'Hatalı')], db_index=True, default='bekliyor', max_length=20, verbose_name='Durum')),
+                ('deneme', models.PositiveSmallIntegerField(default=0, verbose_name='Deneme Sayısı')),
+                ('hata', models.TextField(blank=True, verbose_name='Hata Ayrıntısı')),
+                ('olusturulma_tarihi', models.DateTimeField(auto_now_add=True)),
+                ('guncellenme_tarihi', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Görsel İşleme Kuyruğu',
+                'ordering': ['-id'],
+            },
+        ),
+        migrations.AlterField(
+            model_name='galeri',
+            name='kapak_resmi',
+            field=haberler.images.ErtelenmisGorselAlani(upload_to='galeri_kapak/', verbose_name='Kapak Resmi'),
+        ),
+        migrations.AlterField(
+            model_name='galeriresim',
+            name='resim',
+            field=haberler.images.ErtelenmisGorselAlani(upload_to='galeri_resimleri/'),
+        ),
+        migrations.AlterField(
+            model_name='haber',
+            name='resim',
+            field=haberler.images.ErtelenmisGorselAlani(blank=True, upload_to='haber_resimleri/', verbose_name='Haber Resmi'),
+        ),
+        migrations.AlterField(
+            model_name='koseyazari',
+            name='resim',
+            field=haberler.images.ErtelenmisGorselAlani(upload_to='yazarlar/', verbose_name='Yazar Resmi'),
+        ),
+        migrations.AlterField(
+            model_name='koseyazisi',
+            name='manset_resmi',
+            field=haberler.images.ErtelenmisGorselAlani(blank=True, null=True, upload_to='manset_yazilari/', verbose_name='Manşet Görseli (Yatay)'),
+        ),
+        migrations.AlterField(
+            model_name='ozelgun',
+            name='kapak_resmi',
+            field=haberler.images.ErtelenmisGorselAlani(blank=True, upload_to='ozel_gunler/', verbose_name='Sayfa Kapak Resmi'),
+        ),
+        migrations.AlterField(
+            model_name='profil',
+            name='resim',
+            field=haberler.images.ErtelenmisGorselAlani(blank=True, null=True, upload_to='profil_resimleri/', verbose_name='Profil Resmi'),
+        ),
+        migrations.AlterField(
+            model_name='siir',
+            name='resim',
+            field=haberler.images.ErtelenmisGorselAlani(blank=True, upload_to='siir_resimleri/', verbose_name='Şiir Görseli'),
+        ),
+        migrations.AlterField(
+            model_name='tarihiyer',
+            name='harita_ikonu',
+            field=haberler.images.ErtelenmisGorselAlani(blank=True, help_text='Arka planı şeffaf, izometrik/3D görünümlü bir PNG yükleyin.', null=True, upload_to='harita_ikonlari/', verbose_name='Harita İkonu (3D Görünümlü PNG)'),
+        ),
+        migrations.AlterField(
+            model_name='tarihiyer',
+            name='resim',
+            field=haberler.images.ErtelenmisGorselAlani(upload_to='tarihi_yerler/', verbose_name='Kapak Fotoğrafı'),
+        ),
+        migrations.AlterField(
+            model_name='tebrikmesaji',
+            name='resim',
+            field=haberler.images.ErtelenmisGorselAlani(upload_to='tebrikler/', verbose_name='Kişi Fotoğrafı'),
+        ),
+    ]
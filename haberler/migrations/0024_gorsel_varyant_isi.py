@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0023_gorsel_isleme_kuyrugu'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='gorselisi',
+            name='tur',
+            field=models.CharField(choices=[('turev', 'Boyutlandırma'), ('instagram', 'Instagram Postu'), ('varyant', 'Duyarlı Varyantlar')], default='turev', max_length=20, verbose_name='İş Türü'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-18 08:59
+#
+# Sütunlar boş eklenir: gövdeyi işleyen kod (haberler.rendering) göçe
+# bağlanmasın diye doldurma burada yapılmaz. Mevcut kayıtlar doldurulana kadar
+# her görüntülemede yeniden işlenir; göçten sonra bir kez çalıştırın:
+#
+#     python manage.py govdeleri_isle
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0024_gorsel_varyant_isi'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='haber',
+            name='islenmis_govde',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='haber',
+            name='islenmis_govde_ozeti',
+            field=models.CharField(blank=True, editable=False, max_length=40),
+        ),
+        migrations.AddField(
+            model_name='koseyazisi',
+            name='islenmis_govde',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='koseyazisi',
+            name='islenmis_govde_ozeti',
+            field=models.CharField(blank=True, editable=False, max_length=40),
+        ),
+        migrations.AddField(
+            model_name='siir',
+            name='islenmis_govde',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='siir',
+            name='islenmis_govde_ozeti',
+            field=models.CharField(blank=True, editable=False, max_length=40),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0025_islenmis_govde'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='destekci',
+            index=models.Index(condition=models.Q(('aktif_mi', True)), fields=['bitis_tarihi'], name='destekci_aktif_bitis_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galeri',
+            index=models.Index(fields=['-yayin_tarihi'], name='galeri_tarih_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galeriresim',
+            index=models.Index(condition=models.Q(('haftanin_fotografi_mi', True)), fields=['id'], name='galeriresim_haftanin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='haber',
+            index=models.Index(condition=models.Q(('aktif_mi', True)), fields=['-yayin_tarihi', '-id'], name='haber_aktif_tarih_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='haber',
+            index=models.Index(condition=models.Q(('aktif_mi', True)), fields=['kategori', '-yayin_tarihi', '-id'], name='haber_kategori_tarih_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='haber',
+            index=models.Index(condition=models.Q(('aktif_mi', True)), fields=['ilce', '-yayin_tarihi', '-id'], name='haber_ilce_tarih_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='haber',
+            index=models.Index(condition=models.Q(('aktif_mi', True), ('manset_mi', True)), fields=['-yayin_tarihi'], name='haber_manset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='haber',
+            index=models.Index(condition=models.Q(('aktif_mi', True), ('son_dakika', True)), fields=['-yayin_tarihi'], name='haber_son_dakika_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='haber',
+            index=models.Index(condition=models.Q(('aktif_mi', True), ('roportaj_mi', True)), fields=['-yayin_tarihi', '-id'], name='haber_roportaj_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='koseyazisi',
+            index=models.Index(condition=models.Q(('aktif_mi', True)), fields=['-yayin_tarihi', '-id'], name='yazi_aktif_tarih_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='koseyazisi',
+            index=models.Index(condition=models.Q(('aktif_mi', True)), fields=['yazar', '-yayin_tarihi', '-id'], name='yazi_yazar_tarih_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='koseyazisi',
+            index=models.Index(condition=models.Q(('aktif_mi', True), ('manset_mi', True)), fields=['-yayin_tarihi'], name='yazi_manset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='siir',
+            index=models.Index(condition=models.Q(('aktif_mi', True)), fields=['-yayin_tarihi', '-id'], name='siir_aktif_tarih_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='siir',
+            index=models.Index(condition=models.Q(('aktif_mi', True), ('gunun_siiri_mi', True)), fields=['-yayin_tarihi'], name='siir_gunun_siiri_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='yorum',
+            index=models.Index(condition=models.Q(('aktif', True)), fields=['haber', '-olusturulma_tarihi'], name='yorum_haber_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='yorum',
+            index=models.Index(condition=models.Q(('aktif', True)), fields=['kose_yazisi', '-olusturulma_tarihi'], name='yorum_yazi_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='yorum',
+            index=models.Index(condition=models.Q(('aktif', True)), fields=['siir', '-olusturulma_tarihi'], name='yorum_siir_idx'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0026_sicak_yol_indeksleri'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='destekci',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='eczanelinki',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='galeri',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='galeriresim',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='haber',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='koseyazari',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='koseyazisi',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='ozelgun',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='siir',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='tarihiyer',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='tebrikmesaji',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+        migrations.AddField(
+            model_name='yorum',
+            name='guncellenme_tarihi',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:23
+
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+
+def _sayi(metin, sinir):
+    """'41,1828 ' gibi elle girilmiş metni sayıya çevirir; geçersizse None."""
+    try:
+        deger = Decimal((metin or '').strip().replace(',', '.'))
+    except InvalidOperation:
+        return None
+    if not deger.is_finite() or abs(deger) > sinir:
+        return None
+    return str(deger.quantize(Decimal('0.000001')))
+
+
+def koordinatlari_temizle(apps, schema_editor):
+    # Sütun türü değişmeden önce sayıya çevrilemeyen değerler boşaltılır
+    TarihiYer = apps.get_model('haberler', 'TarihiYer')
+    for pk, enlem, boylam in TarihiYer.objects.values_list('pk', 'enlem', 'boylam'):
+        TarihiYer.objects.filter(pk=pk).update(enlem=_sayi(enlem, 90), boylam=_sayi(boylam, 180))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0027_guncellenme_tarihi'),
+    ]
+
+    operations = [
+        migrations.RunPython(koordinatlari_temizle, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='tarihiyer',
+            name='boylam',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Örn: 41.8183', max_digits=9, null=True, verbose_name='Boylam (Longitude)'),
+        ),
+        migrations.AlterField(
+            model_name='tarihiyer',
+            name='enlem',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Örn: 41.1828', max_digits=9, null=True, verbose_name='Enlem (Latitude)'),
+        ),
+        migrations.AddIndex(
+            model_name='tarihiyer',
+            index=models.Index(condition=models.Q(('aktif_mi', True)), fields=['enlem', 'boylam'], name='tarihi_yer_konum_idx'),
+        ),
+    ]
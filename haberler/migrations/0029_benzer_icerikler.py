@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0028_tarihi_yer_koordinatlari'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BenzerIcerik',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guncellenme_tarihi', models.DateTimeField(auto_now=True, db_index=True, verbose_name='Son Güncelleme')),
+                ('kaynak_tur', models.CharField(choices=[('haber', 'Haber'), ('yazi', 'Köşe Yazısı')], max_length=5)),
+                ('kaynak_id', models.PositiveIntegerField()),
+                ('hedef_tur', models.CharField(choices=[('haber', 'Haber'), ('yazi', 'Köşe Yazısı')], max_length=5)),
+                ('hedef_id', models.PositiveIntegerField()),
+                ('skor', models.FloatField()),
+                ('baslik', models.CharField(max_length=200)),
+                ('resim', models.CharField(blank=True, max_length=100)),
+                ('yayin_tarihi', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name_plural': 'Benzer İçerikler',
+                'indexes': [models.Index(fields=['hedef_tur', 'hedef_id'], name='benzer_icerik_hedef_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kaynak_tur', 'kaynak_id', 'hedef_tur', 'hedef_id'), name='benzer_icerik_tekil')],
+            },
+        ),
+        migrations.CreateModel(
+            name='BenzerlikVektoru',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tur', models.CharField(choices=[('haber', 'Haber'), ('yazi', 'Köşe Yazısı')], max_length=5)),
+                ('nesne_id', models.PositiveIntegerField()),
+                ('terimler', models.JSONField(default=dict)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('tur', 'nesne_id'), name='benzerlik_vektoru_tekil')],
+            },
+        ),
+    ]
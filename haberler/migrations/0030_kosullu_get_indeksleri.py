@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('haberler', '0029_benzer_icerikler'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='haber',
+            index=models.Index(fields=['kategori', 'guncellenme_tarihi'], name='haber_kategori_guncel_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='haber',
+            index=models.Index(fields=['ilce', 'guncellenme_tarihi'], name='haber_ilce_guncel_idx'),
+        ),
+    ]
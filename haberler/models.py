@@ -1,8 +1,12 @@
 from django.db import models
+from django.db.models.functions import Substr
+from django.urls import reverse
 from django.utils import timezone
 from ckeditor_uploader.fields import RichTextUploadingField
 from django.core.files.base import ContentFile
 from django.utils.text import slugify 
+from django.utils.functional import cached_property
+from django.utils.safestring import mark_safe
 import textwrap
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont, ImageOps
@@ -10,49 +14,11 @@ import re
 from django.contrib.auth.models import User
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from imagekit.models import ProcessedImageField
 from imagekit.processors import ResizeToFit, ResizeToFill
-from urllib.parse import urlparse, parse_qs, urlencode
+from .images import ErtelenmisGorselAlani, arka_planda_mi, gorsel_isi_ekle
 
-# --- YARDIMCI FONKSİYON: YOUTUBE EMBED ÇEVİRİCİ ---
-YOUTUBE_ID_REGEX = re.compile(r'(?:youtu\.be/|youtube\.com/(?:watch\?v=|shorts/|live/|embed/)|v=)([A-Za-z0-9_-]{11})')
-
-def get_youtube_embed(url):
-    """
-    YouTube linklerini (watch, shorts, live, youtu.be) embed formatına çevirir.
-    Geçerli bir video ID bulunamazsa None döner.
-    """
-    if not url:
-        return None
-
-    match = YOUTUBE_ID_REGEX.search(url)
-    if not match:
-        return None
-
-    video_id = match.group(1)
-
-    # Başlangıç parametresi varsa koru
-    parsed = urlparse(url)
-    query = parse_qs(parsed.query)
-    start = None
-    if 'start' in query:
-        try: start = int(query['start'][0])
-        except (ValueError, TypeError): pass
-    elif 't' in query:
-        raw_t = query['t'][0]
-        try: start = int(str(raw_t).rstrip('s'))
-        except (ValueError, TypeError): pass
-
-    params = {
-        'rel': '0',
-        'modestbranding': '1',
-        'playsinline': '1',
-    }
-    if start is not None:
-        params['start'] = str(start)
-
-    query_string = urlencode(params)
-    return f"https://www.youtube.com/embed/{video_id}?{query_string}"
+# YouTube embed çevirici ve gövde işleme haberler/rendering.py'de
+from .rendering import duz_metin, get_youtube_embed, html_basi, govde_ozeti, govdeyi_isle
 
 class FotoKaynakMixin(models.Model):
     """
@@ -68,6 +34,61 @@ class FotoKaynakMixin(models.Model):
 
     class Meta:
         abstract = True # Bu sınıfı veritabanında tablo olarak oluşturma, sadece miras alınsın
+
+class GuncellenmeMixin(models.Model):
+    """
+    Sayfada görünen içeriğin son değişiklik zamanı (bkz. haberler/kosullu.py).
+    `save(update_fields=...)` ile yapılan kısmi kayıtlar da zamanı günceller;
+    okunma sayacı gibi update() ile yazılan alanlar güncellemez.
+    """
+    guncellenme_tarihi = models.DateTimeField(auto_now=True, db_index=True, verbose_name="Son Güncelleme")
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'guncellenme_tarihi'}
+        super().save(*args, **kwargs)
+
+class IslenmisGovdeMixin(models.Model):
+    """
+    Gövdenin video gömmeleri açılmış hâlini kayıt anında üretip saklar.
+    `govde_html` saklanan sonucu verir; kaynak metin save() dışında
+    (update() vb.) değiştiyse ya da GOVDE_SURUMU arttıysa özet tutmaz ve
+    sonuç o an yeniden üretilir.
+    """
+    GOVDE_ALANI = 'icerik'
+
+    islenmis_govde = models.TextField(blank=True, editable=False)
+    islenmis_govde_ozeti = models.CharField(max_length=40, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def govdeyi_guncelle(self):
+        """Gerekirse işlenmiş gövdeyi yeniler; değiştiyse True döner."""
+        kaynak = getattr(self, self.GOVDE_ALANI)
+        ozet = govde_ozeti(kaynak)
+        if ozet == self.islenmis_govde_ozeti:
+            return False
+        self.islenmis_govde = govdeyi_isle(kaynak)
+        self.islenmis_govde_ozeti = ozet
+        return True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        ertelenmis = self.get_deferred_fields()
+        if self.GOVDE_ALANI not in ertelenmis and (update_fields is None or self.GOVDE_ALANI in update_fields):
+            if self.govdeyi_guncelle() and update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'islenmis_govde', 'islenmis_govde_ozeti'}
+        super().save(*args, **kwargs)
+
+    @property
+    def govde_html(self):
+        self.govdeyi_guncelle()
+        return mark_safe(self.islenmis_govde)
         
 class Kategori(models.Model):
     isim = models.CharField(max_length=100, verbose_name="Kategori Adı")
@@ -90,10 +111,29 @@ class Ilce(models.Model):
 # ✍️ KÖŞE YAZARLARI VE YAZILARI
 # ==========================================
 
-class KoseYazari(models.Model):
+# Liste kartları gövdenin tamamını değil, özet için yalnızca bu kadar karakterini okur
+KART_GOVDE_BASI = 600
+
+class KoseYazariQuerySet(models.QuerySet):
+    def son_yazilariyla(self):
+        """
+        Her yazarın en son aktif yazısını tek bir ek sorguyla getirir;
+        `son_yazisi` artık yazar başına sorgu atmaz.
+        """
+        en_son = (
+            KoseYazisi.objects.filter(yazar=models.OuterRef('yazar'), aktif_mi=True)
+            .order_by('-yayin_tarihi', '-id').values('id')[:1]
+        )
+        son_yazilar = (
+            KoseYazisi.objects.filter(aktif_mi=True, id=models.Subquery(en_son))
+            .only('id', 'baslik', 'yazar_id', 'yayin_tarihi')
+        )
+        return self.prefetch_related(models.Prefetch('yazilar', queryset=son_yazilar, to_attr='_son_yazilar'))
+
+class KoseYazari(GuncellenmeMixin, models.Model):
     ad_soyad = models.CharField(max_length=100, verbose_name="Ad Soyad")
     
-    resim = ProcessedImageField(
+    resim = ErtelenmisGorselAlani(
         upload_to='yazarlar/',
         processors=[ResizeToFit(500, 500)],
         format='JPEG',
@@ -109,11 +149,27 @@ class KoseYazari(models.Model):
         verbose_name = "Yazar"
         verbose_name_plural = "Yazarlar"
     
-    @property
-    def son_yazisi(self):
-        return self.yazilar.filter(aktif_mi=True).order_by('-yayin_tarihi').first()
+    objects = KoseYazariQuerySet.as_manager()
 
-class KoseYazisi(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
+    @cached_property
+    def son_yazisi(self):
+        if hasattr(self, '_son_yazilar'):
+            return self._son_yazilar[0] if self._son_yazilar else None
+        return self.yazilar.filter(aktif_mi=True).order_by('-yayin_tarihi', '-id').first()
+
+class KoseYazisiQuerySet(models.QuerySet):
+    def kartlar(self):
+        """
+        Liste kartları için izdüşüm: kartta görünen alanlar ve yazar adı tek
+        sorguda; gövde yerine `govde_basi` (ilk KART_GOVDE_BASI karakter).
+        """
+        return (
+            self.select_related('yazar')
+            .only('baslik', 'manset_resmi', 'yayin_tarihi', 'aktif_mi', 'yazar__ad_soyad', 'yazar__resim')
+            .annotate(govde_basi=Substr('icerik', 1, KART_GOVDE_BASI))
+        )
+
+class KoseYazisi(FotoKaynakMixin, IslenmisGovdeMixin, GuncellenmeMixin, models.Model): # <-- Buraya Mixin eklendi
     yazar = models.ForeignKey(KoseYazari, on_delete=models.CASCADE, related_name='yazilar', verbose_name="Yazar")
     baslik = models.CharField(max_length=200, verbose_name="Yazı Başlığı")
     icerik = RichTextUploadingField(verbose_name="Yazı İçeriği")
@@ -121,7 +177,7 @@ class KoseYazisi(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
     
     manset_mi = models.BooleanField(default=False, verbose_name="Manşette Gösterilsin mi?")
     
-    manset_resmi = ProcessedImageField(
+    manset_resmi = ErtelenmisGorselAlani(
         upload_to='manset_yazilari/',
         processors=[ResizeToFit(800, 600)],
         format='JPEG',
@@ -134,8 +190,18 @@ class KoseYazisi(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
     aktif_mi = models.BooleanField(default=True, verbose_name="Yayında mı?")
     video_link = models.URLField(blank=True, null=True, verbose_name="Video Linki (YouTube)")
 
+    objects = KoseYazisiQuerySet.as_manager()
+
     def __str__(self): return f"{self.yazar.ad_soyad} - {self.baslik}"
-    class Meta: verbose_name_plural = "Köşe Yazıları"; ordering = ['-yayin_tarihi']
+    class Meta:
+        verbose_name_plural = "Köşe Yazıları"
+        ordering = ['-yayin_tarihi']
+        indexes = [
+            models.Index(fields=['-yayin_tarihi', '-id'], condition=models.Q(aktif_mi=True), name='yazi_aktif_tarih_idx'),
+            # Yazar şeridindeki "en son yazı" alt sorgusu
+            models.Index(fields=['yazar', '-yayin_tarihi', '-id'], condition=models.Q(aktif_mi=True), name='yazi_yazar_tarih_idx'),
+            models.Index(fields=['-yayin_tarihi'], condition=models.Q(aktif_mi=True, manset_mi=True), name='yazi_manset_idx'),
+        ]
     
     @property
     def embed_video_url(self): return get_youtube_embed(self.video_link)
@@ -143,13 +209,28 @@ class KoseYazisi(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
 # 📰 HABER MODELİ
 # ==========================================
 
-class Haber(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
+class HaberQuerySet(models.QuerySet):
+    def kartlar(self):
+        """
+        Liste kartları için izdüşüm: kartta görünen alanlar, kategori ve ilçe
+        adı tek sorguda; gövde yerine `govde_basi` (ilk KART_GOVDE_BASI karakter).
+        """
+        return (
+            self.select_related('kategori', 'ilce')
+            .only(
+                'baslik', 'ozet', 'resim', 'video_link', 'roportaj_mi', 'yayin_tarihi', 'aktif_mi',
+                'kategori__isim', 'ilce__isim',
+            )
+            .annotate(govde_basi=Substr('icerik', 1, KART_GOVDE_BASI))
+        )
+
+class Haber(FotoKaynakMixin, IslenmisGovdeMixin, GuncellenmeMixin, models.Model): # <-- Buraya Mixin eklendi
     baslik = models.CharField(max_length=200, verbose_name="Haber Başlığı")
     ozet = models.TextField(verbose_name="Kısa Özet", blank=True)
     icerik = RichTextUploadingField(verbose_name="Haber İçeriği")
     okunma_sayisi = models.PositiveIntegerField(default=0, verbose_name="Okunma Sayısı")
     
-    resim = ProcessedImageField(
+    resim = ErtelenmisGorselAlani(
         upload_to='haber_resimleri/',
         processors=[ResizeToFit(800, 600)],
         format='JPEG',
@@ -173,23 +254,92 @@ class Haber(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
     yayin_tarihi = models.DateTimeField(default=timezone.now, verbose_name="Yayınlanma Tarihi")
     aktif_mi = models.BooleanField(default=True, verbose_name="Yayında mı?")
 
+    objects = HaberQuerySet.as_manager()
+
     def __str__(self): return self.baslik
-    class Meta: verbose_name_plural = "Haberler"; ordering = ['-yayin_tarihi']
+    class Meta:
+        verbose_name_plural = "Haberler"
+        ordering = ['-yayin_tarihi']
+        # Yayındaki haberler hep en yeniden eskiye listelenir; kısmi indeksler yalnızca
+        # aktif satırları tutar (SQLite ve PostgreSQL; desteklemeyen veritabanı atlar)
+        indexes = [
+            models.Index(fields=['-yayin_tarihi', '-id'], condition=models.Q(aktif_mi=True), name='haber_aktif_tarih_idx'),
+            models.Index(fields=['kategori', '-yayin_tarihi', '-id'], condition=models.Q(aktif_mi=True), name='haber_kategori_tarih_idx'),
+            models.Index(fields=['ilce', '-yayin_tarihi', '-id'], condition=models.Q(aktif_mi=True), name='haber_ilce_tarih_idx'),
+            models.Index(fields=['-yayin_tarihi'], condition=models.Q(aktif_mi=True, manset_mi=True), name='haber_manset_idx'),
+            models.Index(fields=['-yayin_tarihi'], condition=models.Q(aktif_mi=True, son_dakika=True), name='haber_son_dakika_idx'),
+            models.Index(fields=['-yayin_tarihi', '-id'], condition=models.Q(aktif_mi=True, roportaj_mi=True), name='haber_roportaj_idx'),
+            # Kategori/ilçe sayfalarının koşullu GET'i: MAX(guncellenme_tarihi) tek indeks aramasıdır
+            models.Index(fields=['kategori', 'guncellenme_tarihi'], name='haber_kategori_guncel_idx'),
+            models.Index(fields=['ilce', 'guncellenme_tarihi'], name='haber_ilce_guncel_idx'),
+        ]
 
     @property
     def youtube_embed_url(self):
         return get_youtube_embed(self.video_link)
 
+    @property
+    def kart_ozeti(self):
+        """Özet; boşsa gövdenin başından düz metin (kartlar() ile gelen `govde_basi`)."""
+        return self.ozet or duz_metin(self.govde_basi if hasattr(self, 'govde_basi') else self.icerik)
+
+# ==========================================
+# 🔗 BENZER İÇERİKLER (bkz. haberler/benzerlik.py)
+# ==========================================
+
+BENZERLIK_TURLERI = (('haber', 'Haber'), ('yazi', 'Köşe Yazısı'))
+
+class BenzerIcerik(GuncellenmeMixin, models.Model):
+    """
+    Bir haber ya da köşe yazısının en benzer içeriklerinden biri. Hedefin kart
+    alanları satıra kopyalanır; detay sayfası listeyi tek sorguyla okur.
+    """
+    kaynak_tur = models.CharField(max_length=5, choices=BENZERLIK_TURLERI)
+    kaynak_id = models.PositiveIntegerField()
+    hedef_tur = models.CharField(max_length=5, choices=BENZERLIK_TURLERI)
+    hedef_id = models.PositiveIntegerField()
+    skor = models.FloatField()
+    baslik = models.CharField(max_length=200)
+    resim = models.CharField(max_length=100, blank=True)
+    yayin_tarihi = models.DateTimeField()
+
+    def __str__(self): return f"{self.kaynak_tur}:{self.kaynak_id} -> {self.hedef_tur}:{self.hedef_id}"
+    class Meta:
+        verbose_name_plural = "Benzer İçerikler"
+        constraints = [
+            models.UniqueConstraint(fields=['kaynak_tur', 'kaynak_id', 'hedef_tur', 'hedef_id'], name='benzer_icerik_tekil'),
+        ]
+        indexes = [models.Index(fields=['hedef_tur', 'hedef_id'], name='benzer_icerik_hedef_idx')]
+
+    @property
+    def adres(self):
+        return reverse('yazi_detay' if self.hedef_tur == 'yazi' else 'haber_detay', args=[self.hedef_id])
+
+    @property
+    def gorsel(self):
+        # Tüm görsel alanları varsayılan depolamayı kullanır; dosya nesnesi için herhangi biri yeter
+        alan = Haber._meta.get_field('resim')
+        return alan.attr_class(None, alan, self.resim or None)
+
+class BenzerlikVektoru(models.Model):
+    """Son tam kurulumdan beri metni değişen belgelerin TF-IDF vektörü {terim no: ağırlık}."""
+    tur = models.CharField(max_length=5, choices=BENZERLIK_TURLERI)
+    nesne_id = models.PositiveIntegerField()
+    terimler = models.JSONField(default=dict)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['tur', 'nesne_id'], name='benzerlik_vektoru_tekil')]
+
 # ==========================================
 # 🎄 ÖZEL GÜN VE TEBRİK MESAJLARI
 # ==========================================
 
-class OzelGun(models.Model):
+class OzelGun(GuncellenmeMixin, models.Model):
     baslik = models.CharField(max_length=200, verbose_name="Özel Gün Adı (Örn: 2025 Yılbaşı)")
     slug = models.SlugField(unique=True, verbose_name="Link Uzantısı (Otomatik)")
     aciklama = models.TextField(blank=True, verbose_name="Sayfa Üst Yazısı / Artvizyon Mesajı")
     
-    kapak_resmi = ProcessedImageField(
+    kapak_resmi = ErtelenmisGorselAlani(
         upload_to='ozel_gunler/',
         processors=[ResizeToFit(1000, 800)],
         format='JPEG',
@@ -205,13 +355,13 @@ class OzelGun(models.Model):
     def __str__(self): return self.baslik
     class Meta: verbose_name_plural = "Özel Gün Yönetimi"
 
-class TebrikMesaji(models.Model):
+class TebrikMesaji(GuncellenmeMixin, models.Model):
     ozel_gun = models.ForeignKey(OzelGun, on_delete=models.CASCADE, related_name='mesajlar')
     ad_soyad = models.CharField(max_length=100, verbose_name="Kişi / Kurum Adı")
     unvan = models.CharField(max_length=150, blank=True, verbose_name="Ünvanı")
     mesaj_metni = models.TextField(blank=True, verbose_name="Mesajı")
     
-    resim = ProcessedImageField(
+    resim = ErtelenmisGorselAlani(
         upload_to='tebrikler/',
         processors=[ResizeToFit(600, 600)],
         format='JPEG',
@@ -231,8 +381,12 @@ class TebrikMesaji(models.Model):
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
-        if self.resim and not self.instagram_gorseli:
-            self.instagram_gorseli_olustur()
+        # Kişi fotoğrafı henüz işleniyorsa post, fotoğraf hazır olunca (işçinin kaydında) kuyruğa girer
+        if self.resim and self.resim.hazir_mi and not self.instagram_gorseli:
+            if arka_planda_mi():
+                gorsel_isi_ekle(self, 'instagram_gorseli', tur='instagram')
+            else:
+                self.instagram_gorseli_olustur()
 
     def instagram_gorseli_olustur(self):
         try:
@@ -288,9 +442,9 @@ class TebrikMesaji(models.Model):
 # 🎭 DİĞER MODELLER
 # ==========================================
 
-class Galeri(models.Model):
+class Galeri(GuncellenmeMixin, models.Model):
     baslik = models.CharField(max_length=200, verbose_name="Galeri Başlığı")
-    kapak_resmi = ProcessedImageField(
+    kapak_resmi = ErtelenmisGorselAlani(
         upload_to='galeri_kapak/',
         processors=[ResizeToFit(800, 600)],
         format='JPEG',
@@ -299,11 +453,13 @@ class Galeri(models.Model):
     )
     yayin_tarihi = models.DateTimeField(default=timezone.now)
     def __str__(self): return self.baslik
-    class Meta: verbose_name_plural = "Fotoğraf Galerileri"
+    class Meta:
+        verbose_name_plural = "Fotoğraf Galerileri"
+        indexes = [models.Index(fields=['-yayin_tarihi'], name='galeri_tarih_idx')]
 
-class GaleriResim(models.Model):
+class GaleriResim(GuncellenmeMixin, models.Model):
     galeri = models.ForeignKey(Galeri, on_delete=models.CASCADE, related_name='resimler')
-    resim = ProcessedImageField(
+    resim = ErtelenmisGorselAlani(
         upload_to='galeri_resimleri/',
         processors=[ResizeToFit(1024, 768)], 
         format='JPEG',
@@ -312,12 +468,35 @@ class GaleriResim(models.Model):
     aciklama = models.CharField(max_length=200, blank=True, verbose_name="Resim Açıklaması (Opsiyonel)")
     haftanin_fotografi_mi = models.BooleanField(default=False, verbose_name="Haftanın Fotoğrafı")
 
+    class Meta:
+        indexes = [
+            # .first() id'ye göre sıraladığı için indeks de id üzerinde
+            models.Index(fields=['id'], condition=models.Q(haftanin_fotografi_mi=True), name='galeriresim_haftanin_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
         if self.haftanin_fotografi_mi:
             self.__class__.objects.exclude(pk=self.pk).update(haftanin_fotografi_mi=False)
 
-class Siir(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
+class SiirQuerySet(models.QuerySet):
+    def kartlar(self):
+        """
+        Liste kartları için izdüşüm: kartta görünen alanlar ve yazar tek sorguda;
+        şiir metni yerine `govde_basi` (ilk KART_GOVDE_BASI karakter).
+        """
+        return (
+            self.select_related('yazar')
+            .only(
+                'baslik', 'sair', 'resim', 'gunun_siiri_mi', 'yayin_tarihi', 'aktif_mi',
+                'yazar__ad_soyad', 'yazar__resim',
+            )
+            .annotate(govde_basi=Substr('siir_metni', 1, KART_GOVDE_BASI))
+        )
+
+class Siir(FotoKaynakMixin, IslenmisGovdeMixin, GuncellenmeMixin, models.Model): # <-- Buraya Mixin eklendi
+    GOVDE_ALANI = 'siir_metni'
+
     baslik = models.CharField(max_length=200, verbose_name="Şiir Başlığı")
     yazar = models.ForeignKey(
         KoseYazari,
@@ -329,7 +508,7 @@ class Siir(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
     siir_metni = RichTextUploadingField(verbose_name="Şiir Metni")
     okunma_sayisi = models.PositiveIntegerField(default=0, verbose_name="Okunma Sayısı")
     
-    resim = ProcessedImageField(
+    resim = ErtelenmisGorselAlani(
         upload_to='siir_resimleri/',
         processors=[ResizeToFit(600, 600)],
         format='JPEG',
@@ -343,10 +522,18 @@ class Siir(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
     yayin_tarihi = models.DateTimeField(default=timezone.now, verbose_name="Eklenme Tarihi")
     aktif_mi = models.BooleanField(default=True, verbose_name="Yayında mı?")
 
+    objects = SiirQuerySet.as_manager()
+
     def __str__(self):
         yazar_adi = self.yazar.ad_soyad if self.yazar else self.sair
         return f"{yazar_adi} - {self.baslik}" if yazar_adi else self.baslik
-    class Meta: verbose_name_plural = "Şiir Köşesi"; ordering = ['-yayin_tarihi']
+    class Meta:
+        verbose_name_plural = "Şiir Köşesi"
+        ordering = ['-yayin_tarihi']
+        indexes = [
+            models.Index(fields=['-yayin_tarihi', '-id'], condition=models.Q(aktif_mi=True), name='siir_aktif_tarih_idx'),
+            models.Index(fields=['-yayin_tarihi'], condition=models.Q(aktif_mi=True, gunun_siiri_mi=True), name='siir_gunun_siiri_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if self.gunun_siiri_mi:
@@ -355,14 +542,19 @@ class Siir(FotoKaynakMixin, models.Model): # <-- Buraya Mixin eklendi
             self.sair = self.yazar.ad_soyad
         super().save(*args, **kwargs)
 
-class EczaneLinki(models.Model):
+    @property
+    def kart_metni(self):
+        """Kartta kısaltılarak gösterilen HTML; kartlar() ile gelen `govde_basi` varsa o."""
+        return html_basi(self.govde_basi) if hasattr(self, 'govde_basi') else self.siir_metni
+
+class EczaneLinki(GuncellenmeMixin, models.Model):
     ilce_adi = models.CharField(max_length=50, verbose_name="İlçe Adı (Örn: Hopa)")
     url = models.URLField(verbose_name="Eczane Listesi Linki")
     sira = models.PositiveIntegerField(default=0)
     def __str__(self): return self.ilce_adi
     class Meta: verbose_name_plural = "Nöbetçi Eczane Linkleri"; ordering = ['sira']
 
-class Yorum(models.Model):
+class Yorum(GuncellenmeMixin, models.Model):
     haber = models.ForeignKey(Haber, on_delete=models.CASCADE, related_name='yorumlar', null=True, blank=True)
     kose_yazisi = models.ForeignKey(KoseYazisi, on_delete=models.CASCADE, related_name='yorumlar', null=True, blank=True)
     siir = models.ForeignKey(Siir, on_delete=models.CASCADE, related_name='yorumlar', null=True, blank=True)
@@ -375,8 +567,15 @@ class Yorum(models.Model):
     class Meta:
         ordering = ['-olusturulma_tarihi']
         verbose_name_plural = "Yorumlar"
-
-class Destekci(models.Model):
+        # Django `aktif=True`yu "aktif = 1" değil çıplak "aktif" olarak yazar; sütun
+        # eşitliği aranmadığı için bileşik indeks yerine kısmi indeks kullanılır
+        indexes = [
+            models.Index(fields=['haber', '-olusturulma_tarihi'], condition=models.Q(aktif=True), name='yorum_haber_idx'),
+            models.Index(fields=['kose_yazisi', '-olusturulma_tarihi'], condition=models.Q(aktif=True), name='yorum_yazi_idx'),
+            models.Index(fields=['siir', '-olusturulma_tarihi'], condition=models.Q(aktif=True), name='yorum_siir_idx'),
+        ]
+
+class Destekci(GuncellenmeMixin, models.Model):
     PAKETLER = (('okur', 'Okur Destekçisi'), ('gonul', 'Gönül Dostu'), ('sponsor', 'Ana Sponsor'))
     isim = models.CharField(max_length=100, verbose_name="Destekçi Adı / Firma")
     email = models.EmailField(blank=True)
@@ -385,12 +584,20 @@ class Destekci(models.Model):
     bitis_tarihi = models.DateTimeField(null=True, blank=True, verbose_name="Destek Bitiş Tarihi")
     aktif_mi = models.BooleanField(default=False)
     def __str__(self): return self.isim
-    class Meta: verbose_name_plural = "Aboneler ve Destekçiler"
+    class Meta:
+        verbose_name_plural = "Aboneler ve Destekçiler"
+        indexes = [models.Index(fields=['bitis_tarihi'], condition=models.Q(aktif_mi=True), name='destekci_aktif_bitis_idx')]
 
 # ==========================================
 # 🏛️ TARİHİ VE TURİSTİK YERLER (GÜNCELLENDİ)
 # ==========================================
-class TarihiYer(models.Model):
+class TarihiYerQuerySet(models.QuerySet):
+    def kutu_icinde(self, guney, bati, kuzey, dogu):
+        """Koordinatı verilen enlem/boylam kutusunun içinde kalan yerler."""
+        return self.filter(enlem__gte=guney, enlem__lte=kuzey, boylam__gte=bati, boylam__lte=dogu)
+
+
+class TarihiYer(GuncellenmeMixin, models.Model):
     # --- YENİ EKLENEN İLÇE SEÇENEKLERİ ---
     ILCE_SECENEKLERI = (
         ('Merkez', 'Merkez'),
@@ -418,10 +625,10 @@ class TarihiYer(models.Model):
 
     ozet = models.TextField(verbose_name="Kısa Tanıtım (Listede görünür)", blank=True)
     icerik = RichTextUploadingField(verbose_name="Detaylı Bilgi")
-    enlem = models.CharField(max_length=50, verbose_name="Enlem (Latitude)", blank=True, null=True, help_text="Örn: 41.1828")
-    boylam = models.CharField(max_length=50, verbose_name="Boylam (Longitude)", blank=True, null=True, help_text="Örn: 41.8183")
+    enlem = models.DecimalField(max_digits=9, decimal_places=6, verbose_name="Enlem (Latitude)", blank=True, null=True, help_text="Örn: 41.1828")
+    boylam = models.DecimalField(max_digits=9, decimal_places=6, verbose_name="Boylam (Longitude)", blank=True, null=True, help_text="Örn: 41.8183")
     
-    harita_ikonu = ProcessedImageField(
+    harita_ikonu = ErtelenmisGorselAlani(
         upload_to='harita_ikonlari/',
         processors=[ResizeToFit(200, 200)], 
         format='PNG', 
@@ -431,7 +638,7 @@ class TarihiYer(models.Model):
         help_text="Arka planı şeffaf, izometrik/3D görünümlü bir PNG yükleyin."
     )
     
-    resim = ProcessedImageField(
+    resim = ErtelenmisGorselAlani(
         upload_to='tarihi_yerler/',
         processors=[ResizeToFit(1000, 800)],
         format='JPEG',
@@ -443,14 +650,47 @@ class TarihiYer(models.Model):
     sira = models.PositiveIntegerField(default=0, verbose_name="Sıralama (Önce çıkması için)")
     aktif_mi = models.BooleanField(default=True)
 
+    objects = TarihiYerQuerySet.as_manager()
+
     def __str__(self): return f"{self.baslik} ({self.ilce})"
-    class Meta: verbose_name_plural = "Tarihi ve Turistik Yerler"; ordering = ['sira']
+    class Meta:
+        verbose_name_plural = "Tarihi ve Turistik Yerler"
+        ordering = ['sira']
+        # Haritanın görünen alanı (kutu_icinde) enlem aralığıyla aranır
+        indexes = [models.Index(fields=['enlem', 'boylam'], condition=models.Q(aktif_mi=True), name='tarihi_yer_konum_idx')]
 
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.baslik)
         super().save(*args, **kwargs)
 
+# ==========================================
+# 🖼️ GÖRSEL İŞLEME KUYRUĞU (bkz. haberler/images.py)
+# ==========================================
+class GorselIsi(models.Model):
+    BEKLIYOR, ISLENIYOR, TAMAM, HATA = 'bekliyor', 'isleniyor', 'tamam', 'hata'
+    DURUMLAR = (
+        (BEKLIYOR, 'Sırada'),
+        (ISLENIYOR, 'İşleniyor'),
+        (TAMAM, 'Tamamlandı'),
+        (HATA, 'Hatalı'),
+    )
+    TURLER = (('turev', 'Boyutlandırma'), ('instagram', 'Instagram Postu'), ('varyant', 'Duyarlı Varyantlar'))
+
+    model_etiketi = models.CharField(max_length=100, verbose_name="Model")
+    nesne_id = models.PositiveIntegerField(verbose_name="Kayıt No")
+    alan = models.CharField(max_length=50, verbose_name="Alan")
+    kaynak = models.CharField(max_length=255, blank=True, verbose_name="Ham Dosya")
+    tur = models.CharField(max_length=20, choices=TURLER, default='turev', verbose_name="İş Türü")
+    durum = models.CharField(max_length=20, choices=DURUMLAR, default=BEKLIYOR, db_index=True, verbose_name="Durum")
+    deneme = models.PositiveSmallIntegerField(default=0, verbose_name="Deneme Sayısı")
+    hata = models.TextField(blank=True, verbose_name="Hata Ayrıntısı")
+    olusturulma_tarihi = models.DateTimeField(auto_now_add=True)
+    guncellenme_tarihi = models.DateTimeField(auto_now=True)
+
+    def __str__(self): return f"{self.model_etiketi}#{self.nesne_id} {self.alan} ({self.get_durum_display()})"
+    class Meta: verbose_name_plural = "Görsel İşleme Kuyruğu"; ordering = ['-id']
+
         # ==========================================
 # 👤 KULLANICI PROFİL MODELİ (Eksik Olan Bu)
 # ==========================================
@@ -459,7 +699,7 @@ class Profil(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profil', verbose_name="Kullanıcı")
     
     # Profil Resmi (Otomatik kırpılır)
-    resim = ProcessedImageField(
+    resim = ErtelenmisGorselAlani(
         upload_to='profil_resimleri/',
         processors=[ResizeToFill(300, 300)], # 300x300 kare yapar
         format='JPEG',
@@ -0,0 +1,155 @@
+"""
+İmleçli (keyset) sayfalama.
+
+Django'nun Paginator'ı her sayfada COUNT(*) ve OFFSET sorgusu atar; ikisi de
+arşivin derinine inildikçe yavaşlar. Burada sayfa, son görülen kaydın
+(yayin_tarihi, id) ikilisinden sonrası olarak istenir:
+
+    ?eski=<imleç>   imleçten daha eski kayıtlar (Sonraki sayfa)
+    ?yeni=<imleç>   imleçten daha yeni kayıtlar (Önceki sayfa)
+
+Sorgu her derinlikte aynı indeks aralığını okur. Eski `?page=N` adresleri
+eşdeğer imlece kalıcı olarak yönlendirilir. Yönlendirme adresi içerik sürümüne
+bağlı olarak önbellekte tutulur, aynı eski adres OFFSET sorgusunu bir kez
+çalıştırır. Paginator.get_page gibi listenin sonundan sonraki (ya da 1'den
+küçük) numaralar son sayfaya gider; ESKI_SAYFA_SINIRI'ndan derin numaralar 404
+döner.
+"""
+import hashlib
+from datetime import datetime, timedelta, timezone as dt_timezone
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.http import Http404, HttpResponsePermanentRedirect
+
+from .cache import icerik_surumu
+
+_EPOK = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+ESKI_SAYFA_SINIRI = 10000
+ESKI_SAYFA_ANAHTARI = 'haberler:eski_sayfa:{surum}:{ozet}'
+ESKI_SAYFA_SURESI = 24 * 3600
+
+
+def imleci_kodla(tarih, pk):
+    mikro = (tarih - _EPOK) // timedelta(microseconds=1)
+    return f'{mikro}.{pk}'
+
+
+def imleci_coz(imlec):
+    """Geçersiz imleçte None döner (ilk sayfa gösterilir)."""
+    try:
+        mikro, pk = imlec.split('.', 1)
+        return _EPOK + timedelta(microseconds=int(mikro)), int(pk)
+    except (AttributeError, ValueError, OverflowError):
+        return None
+
+
+class ImlecSayfasi:
+    """Şablonların Page nesnesinden kullandığı arayüzün imleçli karşılığı."""
+
+    def __init__(self, nesneler, onceki_var, sonraki_var, tarih_alani, yonlendirme=None):
+        self.object_list = nesneler
+        self.has_previous = onceki_var
+        self.has_next = sonraki_var
+        self.tarih_alani = tarih_alani
+        self.yonlendirme = yonlendirme
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_other_pages(self):
+        return self.has_previous or self.has_next
+
+    def _imlec(self, nesne):
+        return imleci_kodla(getattr(nesne, self.tarih_alani), nesne.pk)
+
+    @property
+    def onceki_adresi(self):
+        if not self.has_previous:
+            return ''
+        return '?' + urlencode({'yeni': self._imlec(self.object_list[0])})
+
+    @property
+    def sonraki_adresi(self):
+        if not self.has_next:
+            return ''
+        return '?' + urlencode({'eski': self._imlec(self.object_list[-1])})
+
+
+def _eskiler(queryset, tarih_alani, imlec):
+    tarih, pk = imlec
+    return queryset.filter(Q(**{f'{tarih_alani}__lt': tarih}) | Q(**{tarih_alani: tarih, 'pk__lt': pk}))
+
+
+def _yeniler(queryset, tarih_alani, imlec):
+    tarih, pk = imlec
+    return queryset.filter(Q(**{f'{tarih_alani}__gt': tarih}) | Q(**{tarih_alani: tarih, 'pk__gt': pk}))
+
+
+def _ilk_sayfa(queryset, boyut, tarih_alani):
+    satirlar = list(queryset.order_by(f'-{tarih_alani}', '-pk')[:boyut + 1])
+    return ImlecSayfasi(satirlar[:boyut], False, len(satirlar) > boyut, tarih_alani)
+
+
+def _eski_sayfa_adresi(request, queryset, boyut, tarih_alani):
+    try:
+        numara = int(request.GET['page'])
+    except (TypeError, ValueError):
+        numara = 1
+    if numara > ESKI_SAYFA_SINIRI:
+        raise Http404('Sayfa bulunamadı.')
+    parametreler = request.GET.copy()
+    del parametreler['page']
+    sirali = queryset.order_by(f'-{tarih_alani}', '-pk').values_list(tarih_alani, 'pk')
+    sinir = []
+    if numara > 1:
+        konum = (numara - 1) * boyut - 1
+        sinir = list(sirali[konum:konum + 1])
+    if numara < 1 or (numara > 1 and not sinir):
+        # Sondan sonrası: get_page gibi son sayfa; COUNT yalnızca burada atılır
+        konum = (queryset.count() - 1) // boyut * boyut - 1
+        sinir = list(sirali[konum:konum + 1]) if konum >= 0 else []
+    if sinir:
+        parametreler['eski'] = imleci_kodla(*sinir[0])
+    return request.path + (f'?{parametreler.urlencode()}' if parametreler else '')
+
+
+def _eski_sayfa_yonlendirmesi(request, queryset, boyut, tarih_alani):
+    """?page=N -> N-1. sayfanın son kaydından sonrasını gösteren imleç."""
+    anahtar = ESKI_SAYFA_ANAHTARI.format(
+        surum=icerik_surumu(), ozet=hashlib.md5(request.get_full_path().encode('utf-8')).hexdigest(),
+    )
+    adres = cache.get(anahtar)
+    if adres is None:
+        adres = _eski_sayfa_adresi(request, queryset, boyut, tarih_alani)
+        cache.set(anahtar, adres, ESKI_SAYFA_SURESI)
+    return HttpResponsePermanentRedirect(adres)
+
+
+def imlecli_sayfala(request, queryset, boyut, tarih_alani='yayin_tarihi'):
+    """
+    İsteğe göre bir ImlecSayfasi döner. Eski `?page=` adreslerinde sayfanın
+    `yonlendirme` özelliği doludur; görünüm onu döndürmelidir.
+    """
+    if 'page' in request.GET:
+        yonlendirme = _eski_sayfa_yonlendirmesi(request, queryset, boyut, tarih_alani)
+        return ImlecSayfasi([], False, False, tarih_alani, yonlendirme=yonlendirme)
+
+    eski = imleci_coz(request.GET.get('eski'))
+    if eski:
+        satirlar = list(_eskiler(queryset, tarih_alani, eski).order_by(f'-{tarih_alani}', '-pk')[:boyut + 1])
+        return ImlecSayfasi(satirlar[:boyut], True, len(satirlar) > boyut, tarih_alani)
+
+    yeni = imleci_coz(request.GET.get('yeni'))
+    if yeni:
+        satirlar = list(_yeniler(queryset, tarih_alani, yeni).order_by(tarih_alani, 'pk')[:boyut + 1])
+        if len(satirlar) > boyut:
+            return ImlecSayfasi(list(reversed(satirlar[:boyut])), True, True, tarih_alani)
+        # En başa ulaşıldı: sayfa boyutu bozulmasın diye ilk sayfa gösterilir
+
+    return _ilk_sayfa(queryset, boyut, tarih_alani)
@@ -0,0 +1,133 @@
+"""
+Yazı gövdelerinin (haber, köşe yazısı, şiir) sunuma hazır HTML'e çevrilmesi.
+
+Editörlerin kullandığı iki video sözdizimi de burada YouTube iframe'ine açılır:
+
+    (video: https://youtu.be/...)      -> 16:9 Bootstrap kutusu
+    [video=https://youtube.com/...]    -> eski gömme kutusu
+
+Sonuç kayıt anında bir kez üretilip modelde saklanır (bkz. IslenmisGovdeMixin);
+detay sayfaları her okumada regex çalıştırmaz. Gömme şablonları değişirse
+GOVDE_SURUMU artırılıp şu komut çalıştırılır; 0025 göçü uygulandıktan sonra da
+mevcut kayıtları doldurmak için bir kez çalıştırılmalıdır:
+
+    python manage.py govdeleri_isle
+"""
+import hashlib
+import html
+import re
+from functools import lru_cache
+from urllib.parse import urlencode, parse_qs, urlparse
+
+from django.utils.html import strip_tags
+
+# Gömme HTML'i değiştiğinde artırın: tüm kayıtların özeti geçersiz olur
+GOVDE_SURUMU = 1
+
+YOUTUBE_ID_REGEX = re.compile(r'(?:youtu\.be/|youtube\.com/(?:watch\?v=|shorts/|live/|embed/)|v=)([A-Za-z0-9_-]{11})')
+VIDEO_BLOGU_REGEX = re.compile(r'\(\s*video\s*:(.*?)\)', re.DOTALL | re.IGNORECASE)
+VIDEO_ETIKETI_REGEX = re.compile(r'\[video=(.*?)\]')
+
+VIDEO_BLOGU_SABLONU = '''
+        <div class="ratio ratio-16x9 my-4 shadow rounded border" style="width: 100%; display: block;">
+            <iframe src="{embed_url}" title="Video" loading="lazy"
+                allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share"
+                referrerpolicy="strict-origin-when-cross-origin" allowfullscreen style="border:0;"></iframe>
+        </div>
+        '''
+
+VIDEO_ETIKETI_SABLONU = '''
+        <div class="video-container" style="position: relative; padding-bottom: 56.25%; height: 0; overflow: hidden; max-width: 100%; margin: 30px 0; border-radius: 8px; border: 1px solid #eee; background-color: #000;">
+            <iframe
+                src="{embed_url}"
+                style="position: absolute; top: 0; left: 0; width: 100%; height: 100%;"
+                frameborder="0" loading="lazy"
+                allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share"
+                referrerpolicy="strict-origin-when-cross-origin"
+                allowfullscreen>
+            </iframe>
+        </div>
+        '''
+
+
+@lru_cache(maxsize=1024)
+def get_youtube_embed(url):
+    """
+    YouTube linklerini (watch, shorts, live, youtu.be) embed formatına çevirir.
+    Geçerli bir video ID bulunamazsa None döner.
+    """
+    if not url:
+        return None
+
+    match = YOUTUBE_ID_REGEX.search(url)
+    if not match:
+        return None
+
+    video_id = match.group(1)
+
+    # Başlangıç parametresi varsa koru
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    start = None
+    if 'start' in query:
+        try: start = int(query['start'][0])
+        except (ValueError, TypeError): pass
+    elif 't' in query:
+        raw_t = query['t'][0]
+        try: start = int(str(raw_t).rstrip('s'))
+        except (ValueError, TypeError): pass
+
+    params = {
+        'rel': '0',
+        'modestbranding': '1',
+        'playsinline': '1',
+    }
+    if start is not None:
+        params['start'] = str(start)
+
+    query_string = urlencode(params)
+    return f"https://www.youtube.com/embed/{video_id}?{query_string}"
+
+
+def _gomucu(sablon, temizle=False):
+    def degistir(match):
+        adres = match.group(1)
+        embed_url = get_youtube_embed(adres.strip() if temizle else adres)
+        return sablon.format(embed_url=embed_url) if embed_url else ""
+    return degistir
+
+
+def video_bloklarini_gom(icerik):
+    """(video: ...) bloğu içindeki 11 haneli YouTube ID'sini çeker."""
+    if not icerik:
+        return ""
+    return VIDEO_BLOGU_REGEX.sub(_gomucu(VIDEO_BLOGU_SABLONU), icerik)
+
+
+def video_etiketlerini_gom(icerik):
+    """[video=LINK] etiketlerini YouTube (Normal + Shorts) iframe koduna çevirir."""
+    if not icerik:
+        return ""
+    return VIDEO_ETIKETI_REGEX.sub(_gomucu(VIDEO_ETIKETI_SABLONU, temizle=True), icerik)
+
+
+def govdeyi_isle(icerik):
+    return video_etiketlerini_gom(video_bloklarini_gom(icerik))
+
+
+def govde_ozeti(icerik):
+    return hashlib.sha1(f'{GOVDE_SURUMU}:{icerik or ""}'.encode('utf-8')).hexdigest()
+
+
+def html_basi(govde_basi):
+    """Gövdenin baştan kesilmiş bir parçası (bkz. kartlar()); kesim yüzünden yarım kalan son etiket atılır."""
+    if not govde_basi:
+        return ""
+    if govde_basi.rfind('<') > govde_basi.rfind('>'):
+        govde_basi = govde_basi[:govde_basi.rfind('<')]
+    return govde_basi
+
+
+def duz_metin(govde_basi):
+    """Gövdenin baştan kesilmiş bir parçasından (bkz. html_basi) düz metin."""
+    return html.unescape(strip_tags(html_basi(govde_basi))).strip()
@@ -0,0 +1,85 @@
+"""
+Yorumlardaki destekçi rozetleri.
+
+Süresi dolmamış her aktif destekçinin paketi, e-posta özetine göre ayrı bir
+önbellek anahtarında tutulur. Anahtarlar dizinin kuruluş damgasıyla
+sürümlenir; damga da kendi küçük anahtarındadır. Destekci kaydedildiğinde ya da
+silindiğinde signals.py damgayı düşürür. Ayrıca damga en yakın `bitis_tarihi`
+anında kendiliğinden düşer, böylece süresi dolan abonelik rozetini kaybeder.
+
+Detay sayfaları her istekte yalnızca damgayı okur (koşullu GET imzası).
+Rozetler için de yalnızca sayfadaki yorumların e-postaları tek `get_many` ile
+aranır. Hiçbir sayfa Destekci tablosuna sorgu atmaz; dizin yeniden kurulurken
+atılan tek sorgu bunun dışındadır. E-postalar büyük/küçük harf ve baştaki ya da
+sondaki boşluklar gözetilmeden eşleşir.
+"""
+import hashlib
+import math
+import time
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import Destekci
+
+ROZET_DAMGASI_ANAHTARI = 'haberler:destekci_rozetleri'
+ROZET_ANAHTARI = 'haberler:destekci_rozeti:{damga}:{ozet}'
+# Hiç bitiş tarihi yaklaşmasa da dizin en geç bu kadar saniyede yenilenir
+ROZET_DIZINI_EN_UZUN_SURE = 24 * 3600
+
+
+def eposta_ozeti(email):
+    return hashlib.sha256(email.strip().lower().encode('utf-8')).hexdigest()[:20]
+
+
+def _dizini_kur():
+    simdi = timezone.now()
+    satirlar = list(
+        Destekci.objects.filter(aktif_mi=True, bitis_tarihi__gte=simdi).exclude(email='')
+        .values_list('email', 'paket', 'bitis_tarihi')
+    )
+    en_yakin = min((bitis for _, _, bitis in satirlar), default=None)
+    sure = ROZET_DIZINI_EN_UZUN_SURE
+    if en_yakin is not None:
+        sure = min(max(math.ceil((en_yakin - simdi).total_seconds()), 1), sure)
+    damga = time.time_ns()
+    # Rozetler damgadan önce yazılır: damgayı gören istek rozetleri de bulur
+    cache.set_many({
+        ROZET_ANAHTARI.format(damga=damga, ozet=eposta_ozeti(email)): paket for email, paket, _ in satirlar
+    }, sure)
+    cache.set(ROZET_DAMGASI_ANAHTARI, damga, sure)
+    return damga
+
+
+def rozet_damgasi():
+    """Dizinin kuruluş damgası; önbellekte yoksa dizin tek sorguyla yeniden kurulur."""
+    damga = cache.get(ROZET_DAMGASI_ANAHTARI)
+    if damga is None:
+        damga = _dizini_kur()
+    return damga
+
+
+def rozet_imzasi(request, *args, **kwargs):
+    """Koşullu GET için: dizin yeniden kurulunca değişir (bkz. kosullu_get)."""
+    return rozet_damgasi()
+
+
+def rozet_dizinini_temizle():
+    cache.delete(ROZET_DAMGASI_ANAHTARI)
+
+
+def destekci_paketleri(epostalar):
+    """Verilen e-postalardan destekçi olanların {e-posta: paket} sözlüğü."""
+    if not epostalar:
+        return {}
+    damga = rozet_damgasi()
+    anahtarlar = {ROZET_ANAHTARI.format(damga=damga, ozet=eposta_ozeti(email)): email for email in epostalar}
+    return {anahtarlar[anahtar]: paket for anahtar, paket in cache.get_many(list(anahtarlar)).items()}
+
+
+def yorumlara_rozet_ekle(yorumlar):
+    """Her yoruma `destekci_tipi` (paket ya da None) ekler."""
+    paketler = destekci_paketleri({yorum.email for yorum in yorumlar if yorum.email})
+    for yorum in yorumlar:
+        yorum.destekci_tipi = paketler.get(yorum.email)
+    return yorumlar
@@ -0,0 +1,262 @@
+"""
+Site içi arama (SQLite FTS5).
+
+Haber, köşe yazısı, şiir ve tarihi yer metinleri HTML'den arındırılıp Türkçe
+harf kurallarına göre normalleştirilerek (İ/ı, ş, ğ, ç, ö, ü) `haberler_arama`
+sanal tablosunda tutulur. Sıralama BM25 ile yapılır; başlıktaki eşleşme gövdedeki
+eşleşmeden daha değerlidir. Dizin, model kaydedildikçe sinyallerle güncellenir
+(bkz. haberler/signals.py). Tabloyu göç boş oluşturur; ilk kurulumdan sonra
+ve toptan yeniden kurmak için:
+
+    python manage.py arama_dizinini_olustur
+
+Veritabanı SQLite değilse ya da FTS5 yoksa eski `icontains` aramasına düşülür.
+"""
+import html
+import re
+from dataclasses import dataclass
+
+from django.db import OperationalError, connection
+from django.db.models import Q
+from django.urls import reverse
+from django.utils.html import strip_tags
+
+from .rendering import duz_metin
+
+TABLO = 'haberler_arama'
+
+# rowid = nesne_id * TUR_SAYISI + tür kodu; silme/güncelleme rowid ile O(log n) kalır
+TUR_KODLARI = {'haber': 0, 'yazi': 1, 'siir': 2, 'tarihi_yer': 3}
+TUR_SAYISI = 4
+TUR_ADLARI = {'haber': 'Haber', 'yazi': 'Köşe Yazısı', 'siir': 'Şiir', 'tarihi_yer': 'Artvin Rehberi'}
+
+# bm25 sütun ağırlıkları: (baslik, govde)
+BASLIK_AGIRLIGI = 10.0
+GOVDE_AGIRLIGI = 1.0
+
+_TURKCE_KATLAMA = str.maketrans('çğıöşüâîû', 'cgiosuaiu')
+_KELIME = re.compile(r'\w+', re.UNICODE)
+
+
+def normallestir(metin):
+    """HTML'i temizler, Türkçe kurallarla küçük harfe çevirir ve aksanları katlar."""
+    if not metin:
+        return ''
+    metin = html.unescape(strip_tags(metin))
+    metin = metin.replace('İ', 'i').replace('I', 'ı').lower()
+    return metin.translate(_TURKCE_KATLAMA)
+
+
+def _tur(model_adi):
+    return {
+        'haber': 'haber', 'koseyazisi': 'yazi', 'siir': 'siir', 'tarihiyer': 'tarihi_yer',
+    }.get(model_adi.lower())
+
+
+def _belge(tur, nesne):
+    """(başlık, gövde) ikilisi; dizine girmemesi gerekiyorsa None."""
+    if not nesne.aktif_mi:
+        return None
+    if tur == 'haber':
+        return nesne.baslik, f'{nesne.ozet} {nesne.icerik}'
+    if tur == 'yazi':
+        return nesne.baslik, f'{nesne.yazar.ad_soyad} {nesne.icerik}'
+    if tur == 'siir':
+        return nesne.baslik, f'{nesne.sair} {nesne.siir_metni}'
+    return nesne.baslik, f'{nesne.ilce} {nesne.ozet} {nesne.icerik}'
+
+
+def _rowid(tur, pk):
+    return pk * TUR_SAYISI + TUR_KODLARI[tur]
+
+
+_tablo_var = {}
+
+
+def dizin_kullanilabilir():
+    if connection.vendor != 'sqlite':
+        return False
+    # Tablo göçle oluşturulur; veritabanı başına bir kez kontrol etmek yeterli
+    ad = connection.settings_dict['NAME']
+    if ad not in _tablo_var:
+        _tablo_var[ad] = TABLO in connection.introspection.table_names()
+    return _tablo_var[ad]
+
+
+def dizini_guncelle(nesne):
+    tur = _tur(nesne._meta.model_name)
+    if tur is None or not dizin_kullanilabilir():
+        return
+    belge = _belge(tur, nesne)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLO} WHERE rowid = %s', [_rowid(tur, nesne.pk)])
+        if belge:
+            cursor.execute(
+                f'INSERT INTO {TABLO} (rowid, baslik, govde) VALUES (%s, %s, %s)',
+                [_rowid(tur, nesne.pk), normallestir(belge[0]), normallestir(belge[1])],
+            )
+
+
+def dizinden_sil(nesne):
+    tur = _tur(nesne._meta.model_name)
+    if tur is None or not dizin_kullanilabilir():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLO} WHERE rowid = %s', [_rowid(tur, nesne.pk)])
+
+
+def dizini_yeniden_olustur(modeller, parca_boyutu=500):
+    """
+    Tabloyu boşaltıp tüm aktif içerikleri yeniden ekler. `modeller` tür adından
+    modele eşlemedir (göç dosyasında tarihsel modeller de verilebilir).
+    """
+    toplam = 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLO}')
+        for tur, model in modeller.items():
+            qs = model.objects.filter(aktif_mi=True)
+            if tur == 'yazi':
+                qs = qs.select_related('yazar')
+            satirlar = []
+            for nesne in qs.iterator(chunk_size=parca_boyutu):
+                baslik, govde = _belge(tur, nesne)
+                satirlar.append((_rowid(tur, nesne.pk), normallestir(baslik), normallestir(govde)))
+                if len(satirlar) >= parca_boyutu:
+                    cursor.executemany(f'INSERT INTO {TABLO} (rowid, baslik, govde) VALUES (%s, %s, %s)', satirlar)
+                    toplam += len(satirlar)
+                    satirlar = []
+            if satirlar:
+                cursor.executemany(f'INSERT INTO {TABLO} (rowid, baslik, govde) VALUES (%s, %s, %s)', satirlar)
+                toplam += len(satirlar)
+        cursor.execute(f"INSERT INTO {TABLO} ({TABLO}) VALUES ('optimize')")
+    return toplam
+
+
+def _eslesme_ifadesi(sorgu):
+    """Her kelime önek olarak aranır ve tümü eşleşmelidir: "artvin"* "kale"*"""
+    kelimeler = _KELIME.findall(normallestir(sorgu))
+    return ' '.join(f'"{kelime}"*' for kelime in kelimeler)
+
+
+@dataclass
+class AramaSonucu:
+    tur: str
+    nesne: object
+
+    @property
+    def tur_adi(self):
+        return TUR_ADLARI[self.tur]
+
+    @property
+    def url(self):
+        if self.tur == 'haber':
+            return reverse('haber_detay', args=[self.nesne.pk])
+        if self.tur == 'yazi':
+            return reverse('yazi_detay', args=[self.nesne.pk])
+        if self.tur == 'siir':
+            return reverse('siir_detay', args=[self.nesne.pk])
+        return reverse('tarihi_yer_detay', args=[self.nesne.slug])
+
+    @property
+    def gorsel(self):
+        if self.tur == 'yazi':
+            return self.nesne.manset_resmi or self.nesne.yazar.resim
+        return self.nesne.resim or None
+
+    @property
+    def ozet(self):
+        ozet = getattr(self.nesne, 'ozet', '')
+        if ozet:
+            return ozet
+        if self.tur == 'siir':
+            return html.unescape(strip_tags(self.nesne.siir_metni))
+        # Haber ve yazılar kartlar() ile gövdenin yalnızca başıyla gelir
+        return duz_metin(self.nesne.govde_basi if hasattr(self.nesne, 'govde_basi') else self.nesne.icerik)
+
+
+class AramaSonuclari:
+    """
+    Paginator'ın beklediği arayüz (count + dilimleme). Her sayfa için yalnızca
+    o sayfanın satırları LIMIT/OFFSET ile alınır ve nesnelere dönüştürülür.
+    """
+
+    def __init__(self, sorgu):
+        self.eslesme = _eslesme_ifadesi(sorgu)
+        self._adet = None
+
+    def count(self):
+        if self._adet is None:
+            self._adet = 0
+            if self.eslesme:
+                with connection.cursor() as cursor:
+                    cursor.execute(f'SELECT count(*) FROM {TABLO} WHERE {TABLO} MATCH %s', [self.eslesme])
+                    self._adet = cursor.fetchone()[0]
+        return self._adet
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, dilim):
+        if not isinstance(dilim, slice):
+            return self[dilim:dilim + 1][0]
+        if not self.eslesme:
+            return []
+        baslangic = dilim.start or 0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {TABLO} WHERE {TABLO} MATCH %s '
+                f'ORDER BY bm25({TABLO}, {BASLIK_AGIRLIGI}, {GOVDE_AGIRLIGI}) LIMIT %s OFFSET %s',
+                [self.eslesme, dilim.stop - baslangic, baslangic],
+            )
+            rowidler = [satir[0] for satir in cursor.fetchall()]
+        return _nesnelere_donustur(rowidler)
+
+
+def _nesnelere_donustur(rowidler):
+    from .models import Haber, KoseYazisi, Siir, TarihiYer
+
+    modeller = {'haber': Haber, 'yazi': KoseYazisi, 'siir': Siir, 'tarihi_yer': TarihiYer}
+    kodlar = {kod: tur for tur, kod in TUR_KODLARI.items()}
+    anahtarlar = [(kodlar[rowid % TUR_SAYISI], rowid // TUR_SAYISI) for rowid in rowidler]
+
+    nesneler = {}
+    for tur, model in modeller.items():
+        pkler = [pk for t, pk in anahtarlar if t == tur]
+        if not pkler:
+            continue
+        qs = model.objects.all() if tur == 'tarihi_yer' else model.objects.kartlar()
+        for pk, nesne in qs.in_bulk(pkler).items():
+            nesneler[(tur, pk)] = nesne
+    return [AramaSonucu(tur, nesneler[(tur, pk)]) for tur, pk in anahtarlar if (tur, pk) in nesneler]
+
+
+def ara(sorgu):
+    """Sayfalanabilir sonuç listesi döner."""
+    if dizin_kullanilabilir():
+        try:
+            sonuclar = AramaSonuclari(sorgu)
+            sonuclar.count()
+            return sonuclar
+        except OperationalError:
+            pass
+
+    from .models import Haber
+    haberler = (
+        Haber.objects.filter(Q(baslik__icontains=sorgu) | Q(icerik__icontains=sorgu), aktif_mi=True)
+        .kartlar().order_by('-yayin_tarihi')
+    )
+    return _SarmalanmisQuerySet(haberler)
+
+
+class _SarmalanmisQuerySet:
+    def __init__(self, queryset):
+        self.queryset = queryset
+
+    def count(self):
+        return self.queryset.count()
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, dilim):
+        return [AramaSonucu('haber', haber) for haber in self.queryset[dilim]]
@@ -0,0 +1,225 @@
+"""
+Önbellek geçersiz kılma sinyalleri.
+
+Menüde, son dakika bandında veya "var mı?" kontrollerinde görünen modellerden
+biri değiştiğinde içerik sürümü, anasayfa parçalarından birinin modeli
+değiştiğinde o parçanın sürümü güncellenir. Yeni sürümle gelen ilk sayfa
+isteği, her sayfada görünen menünün ya da son dakika bandının gerçekten
+değişip değişmediğine (örn. ilk galeri) bakar ve gerekirse tüm sayfaların
+önbelleğini düşürür. Haber, yazı, şiir ve yorum
+kaydedildiğinde ise yalnızca etkilenen sayfaların ve RSS/Atom beslemelerinin
+tam sayfa önbelleği temizlenir ve arama dizini güncellenir. Haber ve yazılarda
+benzerlik dizini de güncellenir; benzer listesi değişen detay sayfaları
+temizlenir. Destekçi değişince yorum rozetlerinin dizini düşürülür.
+"""
+from allauth.socialaccount.models import SocialApp
+from django.apps import apps
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.urls import reverse
+
+from .beslemeler import besleme_yollari
+from .benzerlik import belgeyi_guncelle, dizinden_cikar
+from .cache import (
+    icerik_surumunu_artir, parca_surumunu_artir, sayfalari_temizle, silme_surumunu_artir, tum_sayfalari_temizle,
+)
+from .models import (
+    BenzerIcerik, Destekci, GuncellenmeMixin, Galeri, Haber, Ilce, Kategori, KoseYazari, KoseYazisi, OzelGun, Siir, TarihiYer, TebrikMesaji, Yorum,
+)
+from .rozetler import rozet_dizinini_temizle
+from .search import dizini_guncelle, dizinden_sil
+
+NAVIGASYON_MODELLERI = (Kategori, Ilce, Haber, Galeri, Siir, TarihiYer, SocialApp)
+
+
+def _icerik_degisti(sender, **kwargs):
+    if kwargs.get('raw'):
+        return
+    # Menü gerçekten değiştiyse tüm sayfaları temizlemek sonraki isteğe kalır (bkz. cache.py)
+    icerik_surumunu_artir()
+
+
+for _model in NAVIGASYON_MODELLERI:
+    post_save.connect(_icerik_degisti, sender=_model, dispatch_uid=f'surum_kayit_{_model.__name__}')
+    post_delete.connect(_icerik_degisti, sender=_model, dispatch_uid=f'surum_silme_{_model.__name__}')
+
+
+def _kayit_silindi(sender, **kwargs):
+    silme_surumunu_artir(sender)
+
+
+# Koşullu GET kaynağı olabilecek her model. BenzerIcerik toplu silinir; alıcı
+# bağlamak Django'nun hızlı silmesini kapatırdı, sürümü benzerlik.py ilerletir.
+for _model in apps.get_app_config('haberler').get_models():
+    if issubclass(_model, GuncellenmeMixin) and _model is not BenzerIcerik:
+        post_delete.connect(_kayit_silindi, sender=_model, dispatch_uid=f'silme_surumu_{_model.__name__}')
+
+
+@receiver(m2m_changed, sender=SocialApp.sites.through)
+def sosyal_uygulama_siteleri_degisti(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        icerik_surumunu_artir()
+        tum_sayfalari_temizle()
+
+
+# --- ŞABLON PARÇALARI: HER PARÇA YALNIZCA GÖSTERDİĞİ MODELLERLE YENİLENİR ---
+PARCA_BAGIMLILIKLARI = {
+    'manset': (Haber, KoseYazisi, KoseYazari),
+    'yazarlar': (KoseYazari, KoseYazisi),
+    'ozel_gun': (OzelGun, TebrikMesaji),
+}
+
+
+def _parca_degisti(sender, **kwargs):
+    if kwargs.get('raw'):
+        return
+    parca_surumunu_artir(*[ad for ad, modeller in PARCA_BAGIMLILIKLARI.items() if sender in modeller])
+
+
+for _model in {model for modeller in PARCA_BAGIMLILIKLARI.values() for model in modeller}:
+    post_save.connect(_parca_degisti, sender=_model, dispatch_uid=f'parca_kayit_{_model.__name__}')
+    post_delete.connect(_parca_degisti, sender=_model, dispatch_uid=f'parca_silme_{_model.__name__}')
+
+
+# --- TAM SAYFA ÖNBELLEĞİ: YAYINDA ETKİLENEN ADRESLERİ TEMİZLE ---
+
+def _haber_yollari(kategori_id, ilce_id, pk):
+    yollar = [reverse('anasayfa'), reverse('haber_detay', args=[pk]), *besleme_yollari('rss_haberler')]
+    if kategori_id:
+        yollar.append(reverse('kategori_haberleri', args=[kategori_id]))
+        yollar += besleme_yollari('rss_kategori', kategori_id)
+    if ilce_id:
+        yollar.append(reverse('ilce_haberleri', args=[ilce_id]))
+        yollar += besleme_yollari('rss_ilce', ilce_id)
+    return yollar
+
+
+@receiver(pre_save, sender=Haber)
+def haber_eski_degerleri_sakla(sender, instance, raw=False, **kwargs):
+    # Kategori/ilçe değiştiyse eski listeler de temizlenmeli
+    instance._onceki_degerler = None
+    if raw or not instance.pk:
+        return
+    instance._onceki_degerler = (
+        Haber.objects.filter(pk=instance.pk).values('kategori_id', 'ilce_id', 'son_dakika').first()
+    )
+
+
+@receiver(post_save, sender=Haber)
+@receiver(post_delete, sender=Haber)
+def haber_sayfalarini_temizle(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    yollar = _haber_yollari(instance.kategori_id, instance.ilce_id, instance.pk)
+    onceki = getattr(instance, '_onceki_degerler', None)
+    if onceki:
+        yollar += _haber_yollari(onceki['kategori_id'], onceki['ilce_id'], instance.pk)
+    sayfalari_temizle(*set(yollar))
+
+    # Son dakika bandı her sayfada görünür
+    if instance.son_dakika or (onceki and onceki['son_dakika']):
+        tum_sayfalari_temizle()
+
+
+@receiver(post_save, sender=KoseYazisi)
+@receiver(post_delete, sender=KoseYazisi)
+def yazi_sayfalarini_temizle(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    sayfalari_temizle(
+        reverse('anasayfa'), reverse('yazi_detay', args=[instance.pk]),
+        *besleme_yollari('rss_yazar', instance.yazar_id),
+    )
+
+
+@receiver(post_save, sender=Siir)
+@receiver(post_delete, sender=Siir)
+def siir_sayfalarini_temizle(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    sayfalari_temizle(reverse('anasayfa'), reverse('siir_detay', args=[instance.pk]), *besleme_yollari('rss_siir'))
+
+
+@receiver(post_save, sender=Yorum)
+@receiver(post_delete, sender=Yorum)
+def yorum_sayfasini_temizle(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if instance.haber_id:
+        sayfalari_temizle(reverse('haber_detay', args=[instance.haber_id]))
+    if instance.kose_yazisi_id:
+        sayfalari_temizle(reverse('yazi_detay', args=[instance.kose_yazisi_id]))
+    if instance.siir_id:
+        sayfalari_temizle(reverse('siir_detay', args=[instance.siir_id]))
+
+
+@receiver(post_save, sender=TarihiYer)
+@receiver(post_delete, sender=TarihiYer)
+def tarihi_yer_verisini_temizle(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    sayfalari_temizle(reverse('tarihi_yer_isaretleri'), reverse('tarihi_yer_icerigi', args=[instance.pk]))
+
+
+@receiver(post_save, sender=Destekci)
+@receiver(post_delete, sender=Destekci)
+def destekci_rozetlerini_temizle(sender, instance, raw=False, **kwargs):
+    # Rozet hangi sayfalarda göründüğü bilinmez; destekçi değişikliği seyrektir
+    if raw:
+        return
+    rozet_dizinini_temizle()
+    tum_sayfalari_temizle()
+
+
+# Menüde görünen kategori/ilçe adları ve giriş sağlayıcıları her sayfayı etkiler
+def _menu_degisti(sender, **kwargs):
+    if kwargs.get('raw'):
+        return
+    tum_sayfalari_temizle()
+
+
+for _model in (Kategori, Ilce, SocialApp):
+    post_save.connect(_menu_degisti, sender=_model, dispatch_uid=f'sayfa_kayit_{_model.__name__}')
+    post_delete.connect(_menu_degisti, sender=_model, dispatch_uid=f'sayfa_silme_{_model.__name__}')
+
+
+# --- ARAMA DİZİNİ ---
+
+@receiver(post_save, sender=Haber)
+@receiver(post_save, sender=KoseYazisi)
+@receiver(post_save, sender=Siir)
+@receiver(post_save, sender=TarihiYer)
+def arama_dizinini_guncelle(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    dizini_guncelle(instance)
+
+
+@receiver(post_delete, sender=Haber)
+@receiver(post_delete, sender=KoseYazisi)
+@receiver(post_delete, sender=Siir)
+@receiver(post_delete, sender=TarihiYer)
+def arama_dizininden_sil(sender, instance, **kwargs):
+    dizinden_sil(instance)
+
+
+# --- BENZER İÇERİKLER ---
+
+def _benzer_sayfalarini_temizle(etkilenen):
+    sayfalari_temizle(*(
+        reverse('yazi_detay' if tur == 'yazi' else 'haber_detay', args=[pk]) for tur, pk in etkilenen
+    ))
+
+
+@receiver(post_save, sender=Haber)
+@receiver(post_save, sender=KoseYazisi)
+def benzerlik_dizinini_guncelle(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    _benzer_sayfalarini_temizle(belgeyi_guncelle(instance, update_fields))
+
+
+@receiver(post_delete, sender=Haber)
+@receiver(post_delete, sender=KoseYazisi)
+def benzerlik_dizininden_sil(sender, instance, **kwargs):
+    _benzer_sayfalarini_temizle(dizinden_cikar('haber' if sender is Haber else 'yazi', instance.pk))
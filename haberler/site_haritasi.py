@@ -0,0 +1,227 @@
+"""
+sitemap.xml ve Google News site haritası.
+
+Her bölüm (haber, yazı, şiir, galeri, tarihi yer) birincil anahtar aralıklarına
+bölünür: `haber-3.xml`, pk'si 3*PARCA_BOYUTU ile 4*PARCA_BOYUTU arasındaki
+yayındaki haberleri listeler, yani hiçbir parça 50.000 adres sınırını aşamaz.
+Aralıklar sabit olduğundan yeni bir haber yalnızca son parçayı, eski bir haberin
+düzeltilmesi de yalnızca kendi parçasını değiştirir.
+
+Parçanın imzası aralıktaki kayıtların (MAX(guncellenme_tarihi), COUNT) ikilisidir
+ve dosya adına yazılır (`haber-3.<imza>.xml`). İmzası aynı kalan parça diskten
+olduğu gibi sunulur; değişen parça veritabanından satır satır okunarak yeniden
+yazılır, bellekte bütün olarak hiç kurulmaz. Last-Modified parçadaki en yeni
+güncellemedir, böylece tarayıcılar değişmeyen parçalar için 304 alır.
+
+`python manage.py site_haritasi_uret` tüm parçaları önceden üretir; cron'dan
+çağrılırsa okuyucu hiçbir zaman üretimi beklemez.
+"""
+import glob
+import hashlib
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import Count, F, Max
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Galeri, Haber, KoseYazisi, Siir, TarihiYer
+
+PARCA_BOYUTU = 50000
+HABER_HARITASI = 'haberler'
+# Google News yalnızca son iki günün en fazla 1000 haberini okur
+HABER_HARITASI_SURESI = timedelta(days=2)
+HABER_HARITASI_SINIRI = 1000
+YAYIN_ADI = 'Artvizyon Haber'
+YAYIN_DILI = 'tr'
+
+XML_BASI = '<?xml version="1.0" encoding="UTF-8"?>\n'
+URLSET_BASI = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+HABER_URLSET_BASI = (
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+    'xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">\n'
+)
+
+
+@dataclass(frozen=True)
+class Bolum:
+    ad: str
+    model: type
+    url_adi: str
+    anahtar: str = 'pk'
+    degisim_sikligi: str = 'monthly'
+
+    def yayindakiler(self):
+        queryset = self.model.objects.all()
+        if hasattr(self.model, 'aktif_mi'):
+            queryset = queryset.filter(aktif_mi=True)
+        if self.anahtar != 'pk':
+            queryset = queryset.exclude(**{f'{self.anahtar}__isnull': True}).exclude(**{self.anahtar: ''})
+        return queryset.order_by()
+
+    def adres(self, anahtar):
+        return reverse(self.url_adi, args=[anahtar])
+
+
+BOLUMLER = {
+    bolum.ad: bolum for bolum in (
+        Bolum('haber', Haber, 'haber_detay', degisim_sikligi='daily'),
+        Bolum('yazi', KoseYazisi, 'yazi_detay', degisim_sikligi='weekly'),
+        Bolum('siir', Siir, 'siir_detay'),
+        Bolum('galeri', Galeri, 'galeri_detay'),
+        Bolum('tarihi-yer', TarihiYer, 'tarihi_yer_detay', anahtar='slug'),
+    )
+}
+
+
+@dataclass
+class Parca:
+    bolum: str
+    no: int
+    son: object
+    adet: int
+
+    @property
+    def ad(self):
+        return f'{self.bolum}-{self.no}'
+
+    @property
+    def imza(self):
+        return hashlib.sha1(f'{self.son.isoformat() if self.son else ""}:{self.adet}'.encode()).hexdigest()[:12]
+
+
+def _site_adresi():
+    return settings.SITE_ADRESI.rstrip('/')
+
+
+def _tarih(zaman):
+    return timezone.localtime(zaman).isoformat(timespec='seconds')
+
+
+def _parca_durumlari(bolum, no=None):
+    queryset = bolum.yayindakiler()
+    if no is not None:
+        queryset = queryset.filter(pk__gte=no * PARCA_BOYUTU, pk__lt=(no + 1) * PARCA_BOYUTU)
+    satirlar = (
+        queryset.annotate(parca=F('pk') / PARCA_BOYUTU).values('parca')
+        .annotate(son=Max('guncellenme_tarihi'), adet=Count('pk')).order_by('parca')
+        .values_list('parca', 'son', 'adet')
+    )
+    return [Parca(bolum.ad, parca, son, adet) for parca, son, adet in satirlar]
+
+
+def parcalar():
+    """Yayında kaydı olan tüm parçalar; bölüm başına tek gruplu sorgu."""
+    return [parca for bolum in BOLUMLER.values() for parca in _parca_durumlari(bolum)]
+
+
+def parca_durumu(bolum_adi, no):
+    """Tek parçanın güncel durumu; parça boşsa ya da bölüm yoksa None."""
+    bolum = BOLUMLER.get(bolum_adi)
+    if bolum is None or no < 0:
+        return None
+    durumlar = _parca_durumlari(bolum, no)
+    return durumlar[0] if durumlar else None
+
+
+def haber_haritasi_durumu():
+    son = _haber_haritasi_kayitlari().aggregate(son=Max('guncellenme_tarihi'), adet=Count('pk'))
+    return Parca(HABER_HARITASI, 0, son['son'], son['adet'])
+
+
+def _haber_haritasi_kayitlari():
+    simdi = timezone.now()
+    return Haber.objects.filter(
+        aktif_mi=True, yayin_tarihi__gt=simdi - HABER_HARITASI_SURESI, yayin_tarihi__lte=simdi,
+    ).order_by()
+
+
+def dizin_xml(parca_listesi):
+    site = _site_adresi()
+    satirlar = [XML_BASI, '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+    for parca in parca_listesi:
+        adres = reverse('site_haritasi_parcasi', args=[parca.bolum, parca.no])
+        son = f'<lastmod>{_tarih(parca.son)}</lastmod>' if parca.son else ''
+        satirlar.append(f'<sitemap><loc>{escape(site + adres)}</loc>{son}</sitemap>\n')
+    satirlar.append('</sitemapindex>\n')
+    return ''.join(satirlar)
+
+
+def _parca_satirlari(parca):
+    site = _site_adresi()
+    if parca.bolum == HABER_HARITASI:
+        yield HABER_URLSET_BASI
+        kayitlar = (
+            _haber_haritasi_kayitlari().order_by('-yayin_tarihi', '-id')
+            .values_list('pk', 'baslik', 'yayin_tarihi')[:HABER_HARITASI_SINIRI]
+        )
+        for pk, baslik, yayin_tarihi in kayitlar.iterator(chunk_size=500):
+            yield (
+                f'<url><loc>{escape(site + reverse("haber_detay", args=[pk]))}</loc><news:news>'
+                f'<news:publication><news:name>{escape(YAYIN_ADI)}</news:name>'
+                f'<news:language>{YAYIN_DILI}</news:language></news:publication>'
+                f'<news:publication_date>{_tarih(yayin_tarihi)}</news:publication_date>'
+                f'<news:title>{escape(baslik)}</news:title></news:news></url>\n'
+            )
+    else:
+        bolum = BOLUMLER[parca.bolum]
+        yield URLSET_BASI
+        kayitlar = (
+            bolum.yayindakiler()
+            .filter(pk__gte=parca.no * PARCA_BOYUTU, pk__lt=(parca.no + 1) * PARCA_BOYUTU)
+            .order_by('pk').values_list(bolum.anahtar, 'guncellenme_tarihi')
+        )
+        for anahtar, guncellenme in kayitlar.iterator(chunk_size=2000):
+            yield (
+                f'<url><loc>{escape(site + bolum.adres(anahtar))}</loc>'
+                f'<lastmod>{_tarih(guncellenme)}</lastmod>'
+                f'<changefreq>{bolum.degisim_sikligi}</changefreq></url>\n'
+            )
+    yield '</urlset>\n'
+
+
+def parca_dosyasi(parca, dizin=None):
+    """
+    Parçanın diskteki dosyası; imzası değişmişse satır satır yeniden yazar ve
+    aynı parçanın eski dosyalarını siler.
+    """
+    dizin = dizin or settings.SITE_HARITASI_DIZINI
+    yol = os.path.join(dizin, f'{parca.ad}.{parca.imza}.xml')
+    if os.path.exists(yol):
+        return yol
+
+    os.makedirs(dizin, exist_ok=True)
+    gecici = f'{yol}.{os.getpid()}.tmp'
+    with open(gecici, 'w', encoding='utf-8') as dosya:
+        dosya.write(XML_BASI)
+        dosya.writelines(_parca_satirlari(parca))
+    os.replace(gecici, yol)
+    for eski in glob.glob(os.path.join(glob.escape(dizin), f'{glob.escape(parca.ad)}.*.xml')):
+        if eski != yol:
+            os.remove(eski)
+    return yol
+
+
+def tumunu_uret(dizin=None):
+    """
+    Tüm parçaları ve haber haritasını günceller, artık boş olan parçaları siler.
+    (yeniden yazılan parça adları, değişmeyen parça sayısı, silinen dosyalar) döner.
+    """
+    dizin = dizin or settings.SITE_HARITASI_DIZINI
+    uretilen, degismeyen, yollar = [], 0, set()
+    for parca in parcalar() + [haber_haritasi_durumu()]:
+        onceden_var = os.path.exists(os.path.join(dizin, f'{parca.ad}.{parca.imza}.xml'))
+        yollar.add(parca_dosyasi(parca, dizin))
+        if onceden_var:
+            degismeyen += 1
+        else:
+            uretilen.append(parca.ad)
+    silinen = []
+    for yol in glob.glob(os.path.join(glob.escape(dizin), '*.xml')):
+        if yol not in yollar:
+            os.remove(yol)
+            silinen.append(os.path.basename(yol))
+    return uretilen, degismeyen, silinen
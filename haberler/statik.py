@@ -0,0 +1,251 @@
+"""
+Herkese açık sitenin önceden üretilmiş statik kopyası.
+
+Sabit sayfalar, detay sayfaları, galeriler ve tarihi yerler nadiren değişir.
+`python manage.py statik_disa_aktar` bunları anonim bir okuyucunun göreceği
+haliyle <dizin>/<yol>/index.html dosyalarına yazar. nginx bu dosyaları Python'a
+hiç uğramadan sunabilir; uygulama sunucusu düşerse de site okunur kalır:
+
+    location / {
+        error_page 418 = @django;
+        if ($args) { return 418; }
+        if ($cookie_sessionid) { return 418; }
+        root /srv/artvizyon/statik_kopya;
+        try_files $uri/index.html @django;
+    }
+
+Her sayfa için kaynak nesnelerinden (kayıt, onaylı yorumlar, benzer haberler,
+menü verisi, şablon dosyaları) bir imza hesaplanır ve <dizin>/.manifest.json'da
+saklanır. Sonraki çalıştırmada yalnızca imzası değişen sayfalar yeniden üretilir;
+çıktısı aynı kalan dosyalara dokunulmaz. Liste sayfaları (anasayfa, kategori...)
+çok sayıda kayda bağlı olduğundan her seferinde üretilir. Okunma sayısı imzaya
+girmez; statik kopyadaki sayı bir sonraki üretime kadar eski kalır.
+"""
+import hashlib
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import (
+    BenzerIcerik, Destekci, Galeri, GaleriResim, Haber, Ilce, Kategori, KoseYazari, KoseYazisi,
+    OzelGun, Siir, TarihiYer, TebrikMesaji, Yorum,
+)
+from .kosullu import sablon_damgasi
+from .rendering import GOVDE_SURUMU
+
+MANIFEST = '.manifest.json'
+IMZA_DISI_ALANLAR = {'okunma_sayisi'}
+SABIT_SAYFALAR = (
+    'kimdir', 'iletisim', 'destek', 'tesekkur', 'hakkimizda', 'gizlilik_politikasi',
+    'hizmet_sartlari', 'teslimat_iade', 'mesafeli_satis',
+)
+LISTE_SAYFALARI = ('anasayfa', 'galeri_listesi', 'siir_listesi', 'roportaj_listesi', 'tarihi_yerler_listesi')
+BENZER_HABER_SAYISI = 5
+
+
+@dataclass
+class StatikSonuc:
+    uretilen: list = field(default_factory=list)
+    degismeyen: int = 0
+    atlanan: int = 0
+    silinen: list = field(default_factory=list)
+    hatali: list = field(default_factory=list)
+
+
+def _ozet(*parcalar):
+    return hashlib.sha1(repr(parcalar).encode('utf-8')).hexdigest()
+
+
+def _satir_ozetleri(queryset):
+    ozetler = {}
+    for satir in queryset.order_by().values():
+        for alan in IMZA_DISI_ALANLAR:
+            satir.pop(alan, None)
+        ozetler[satir['id']] = _ozet(sorted(satir.items()))
+    return ozetler
+
+
+def _gruplu_ozetler(queryset, anahtar_alani):
+    """Her üst kayıt için alt kayıtların (yorum, resim, mesaj) ortak özeti."""
+    gruplar = defaultdict(list)
+    for satir in queryset.order_by('id').values():
+        gruplar[satir[anahtar_alani]].append(sorted(satir.items()))
+    return {anahtar: _ozet(satirlar) for anahtar, satirlar in gruplar.items()}
+
+
+def _genel_imza():
+    """Her sayfada görünen menü/son dakika verisi ve şablonlar."""
+    from .views import _navigasyon_verisi, navigasyon_imzasi
+
+    return _ozet(navigasyon_imzasi(_navigasyon_verisi()), sablon_damgasi(), GOVDE_SURUMU)
+
+
+def sayfa_imzalari():
+    """
+    {adres: imza} sözlüğü. İmza None ise sayfa her çalıştırmada yeniden
+    üretilir (liste sayfaları).
+    """
+    genel = _genel_imza()
+    sayfalar = {reverse(ad): None for ad in LISTE_SAYFALARI}
+    for ad in SABIT_SAYFALAR:
+        sayfalar[reverse(ad)] = _ozet(genel)
+    for kategori_id in Kategori.objects.values_list('pk', flat=True):
+        sayfalar[reverse('kategori_haberleri', args=[kategori_id])] = None
+    for ilce_id in Ilce.objects.values_list('pk', flat=True):
+        sayfalar[reverse('ilce_haberleri', args=[ilce_id])] = None
+
+    yorumlar = {
+        tur: _gruplu_ozetler(Yorum.objects.filter(aktif=True, **{f'{tur}__isnull': False}), f'{tur}_id')
+        for tur in ('haber', 'kose_yazisi', 'siir')
+    }
+    rozetler = _ozet(sorted(
+        Destekci.objects.filter(aktif_mi=True, bitis_tarihi__gte=timezone.now()).values_list('email', 'paket')
+    ))
+    yazarlar = _satir_ozetleri(KoseYazari.objects.all())
+
+    aktif_haberler = Haber.objects.filter(aktif_mi=True)
+    haberler = _satir_ozetleri(aktif_haberler)
+    # Benzer haberler: benzerlik dizinindeki liste; liste yoksa kategorinin en
+    # yeni kayıtları (sayfanın kendisi hariç)
+    benzer_listeleri = _gruplu_ozetler(BenzerIcerik.objects.filter(kaynak_tur='haber'), 'kaynak_id')
+    en_yeniler = list(aktif_haberler.order_by('-yayin_tarihi').values_list('pk', flat=True)[:BENZER_HABER_SAYISI + 1])
+    kategori_yenileri = {}
+    for pk, kategori_id in aktif_haberler.values_list('pk', 'kategori_id'):
+        if pk in benzer_listeleri:
+            sayfalar[reverse('haber_detay', args=[pk])] = _ozet(
+                genel, haberler[pk], benzer_listeleri[pk], yorumlar['haber'].get(pk), rozetler,
+            )
+            continue
+        if kategori_id not in kategori_yenileri:
+            kategori_yenileri[kategori_id] = list(
+                aktif_haberler.filter(kategori_id=kategori_id).order_by('-yayin_tarihi')
+                .values_list('pk', flat=True)[:BENZER_HABER_SAYISI + 1]
+            )
+        benzerler = [i for i in kategori_yenileri[kategori_id] if i != pk][:BENZER_HABER_SAYISI]
+        if not benzerler:
+            benzerler = [i for i in en_yeniler if i != pk][:BENZER_HABER_SAYISI]
+        sayfalar[reverse('haber_detay', args=[pk])] = _ozet(
+            genel, haberler[pk], [haberler.get(i) for i in benzerler], yorumlar['haber'].get(pk), rozetler,
+        )
+
+    yazi_yazarlari = dict(KoseYazisi.objects.filter(aktif_mi=True).values_list('pk', 'yazar_id'))
+    for pk, ozet in _satir_ozetleri(KoseYazisi.objects.filter(aktif_mi=True)).items():
+        sayfalar[reverse('yazi_detay', args=[pk])] = _ozet(
+            genel, ozet, yazarlar.get(yazi_yazarlari[pk]), yorumlar['kose_yazisi'].get(pk), rozetler,
+        )
+    siir_yazarlari = dict(Siir.objects.filter(aktif_mi=True).values_list('pk', 'yazar_id'))
+    for pk, ozet in _satir_ozetleri(Siir.objects.filter(aktif_mi=True)).items():
+        sayfalar[reverse('siir_detay', args=[pk])] = _ozet(
+            genel, ozet, yazarlar.get(siir_yazarlari[pk]), yorumlar['siir'].get(pk), rozetler,
+        )
+
+    resimler = _gruplu_ozetler(GaleriResim.objects.all(), 'galeri_id')
+    for pk, ozet in _satir_ozetleri(Galeri.objects.all()).items():
+        sayfalar[reverse('galeri_detay', args=[pk])] = _ozet(genel, ozet, resimler.get(pk))
+
+    mesajlar = _gruplu_ozetler(TebrikMesaji.objects.all(), 'ozel_gun_id')
+    for ozel_gun in OzelGun.objects.filter(aktif_mi=True).exclude(slug__isnull=True).exclude(slug='').values():
+        sayfalar[reverse('ozel_gun_detay', args=[ozel_gun['slug']])] = _ozet(
+            genel, sorted(ozel_gun.items()), mesajlar.get(ozel_gun['id']),
+        )
+
+    # Tarihi yer detayı tüm listeyi de gösterir
+    yerler = TarihiYer.objects.filter(aktif_mi=True)
+    yerler_ozeti = _ozet(sorted(_satir_ozetleri(yerler).items()))
+    for slug in yerler.exclude(slug__isnull=True).exclude(slug='').values_list('slug', flat=True):
+        sayfalar[reverse('tarihi_yer_detay', args=[slug])] = _ozet(genel, yerler_ozeti)
+    return sayfalar
+
+
+_istemci = None
+
+
+def _sayfayi_uret(adres):
+    """Alt süreçte de çalışır; anonim bir okuyucu gibi sayfayı ister."""
+    global _istemci
+    if _istemci is None:
+        hostlar = [host for host in settings.ALLOWED_HOSTS if host != '*']
+        _istemci = Client(SERVER_NAME=hostlar[0].lstrip('.')) if hostlar else Client()
+    response = _istemci.get(adres, secure=True)
+    return adres, response.status_code, response.content if response.status_code == 200 else b''
+
+
+def _dosya_yolu(dizin, adres):
+    return os.path.join(dizin, adres.strip('/'), 'index.html')
+
+
+def _yaz(yol, icerik):
+    os.makedirs(os.path.dirname(yol), exist_ok=True)
+    with open(yol + '.tmp', 'wb') as dosya:
+        dosya.write(icerik)
+    os.replace(yol + '.tmp', yol)
+
+
+def _sil(dizin, adres):
+    yol = _dosya_yolu(dizin, adres)
+    if os.path.exists(yol):
+        os.remove(yol)
+    # Boşalan alt dizinleri de kaldır (dizinin kendisine dokunmadan)
+    alt = os.path.dirname(yol)
+    while os.path.abspath(alt) != os.path.abspath(dizin) and not os.listdir(alt):
+        os.rmdir(alt)
+        alt = os.path.dirname(alt)
+
+
+def disa_aktar(dizin, isci=1, zorla=False):
+    """Değişen sayfaları `dizin`e yazar, artık yayında olmayanları siler."""
+    os.makedirs(dizin, exist_ok=True)
+    manifest_yolu = os.path.join(dizin, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_yolu):
+        with open(manifest_yolu, encoding='utf-8') as dosya:
+            manifest = json.load(dosya)
+
+    sonuc = StatikSonuc()
+    imzalar = sayfa_imzalari()
+    gorevler = []
+    for adres, imza in imzalar.items():
+        onceki = manifest.get(adres)
+        if zorla or imza is None or not onceki or onceki['imza'] != imza \
+                or not os.path.exists(_dosya_yolu(dizin, adres)):
+            gorevler.append(adres)
+        else:
+            sonuc.atlanan += 1
+
+    if isci > 1:
+        # Alt süreçler fork ile ana sürecin açık bağlantısını devralmasın
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=isci) as havuz:
+            uretilenler = list(havuz.map(_sayfayi_uret, gorevler, chunksize=16))
+    else:
+        uretilenler = [_sayfayi_uret(adres) for adres in gorevler]
+
+    for adres, durum, icerik in uretilenler:
+        if durum != 200:
+            sonuc.hatali.append((adres, durum))
+            manifest.pop(adres, None)
+            _sil(dizin, adres)
+            continue
+        ozet = hashlib.sha1(icerik).hexdigest()
+        if manifest.get(adres, {}).get('ozet') == ozet and os.path.exists(_dosya_yolu(dizin, adres)):
+            sonuc.degismeyen += 1
+        else:
+            _yaz(_dosya_yolu(dizin, adres), icerik)
+            sonuc.uretilen.append(adres)
+        manifest[adres] = {'imza': imzalar[adres], 'ozet': ozet}
+
+    for adres in [adres for adres in manifest if adres not in imzalar]:
+        _sil(dizin, adres)
+        del manifest[adres]
+        sonuc.silinen.append(adres)
+
+    _yaz(manifest_yolu, json.dumps(manifest, ensure_ascii=False, indent=0).encode('utf-8'))
+    return sonuc
@@ -0,0 +1,42 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from haberler.images import varyant_bilgisi, varyant_url
+
+register = template.Library()
+
+BICIM_TURLERI = {'avif': 'image/avif', 'webp': 'image/webp'}
+
+
+@register.simple_tag
+def duyarli_gorsel(dosya, sizes='100vw', **nitelikler):
+    """
+    Görsel alanı için <picture> üretir: AVIF/WebP varyantları srcset olarak,
+    orijinal JPEG/PNG ise eski tarayıcılar için <img src> olarak sunulur.
+    Varyantlar henüz yoksa düz <img> döner. Diğer anahtar kelimeler (class,
+    alt, style...) <img>'e aktarılır; loading varsayılan olarak "lazy"dir.
+
+        {% duyarli_gorsel haber.resim sizes="(max-width: 768px) 100vw, 50vw" class="card-img-top" alt=haber.baslik %}
+    """
+    if not dosya:
+        return ''
+    nitelikler.setdefault('loading', 'lazy')
+    nitelikler.setdefault('decoding', 'async')
+    img_nitelikleri = format_html_join(
+        '', ' {}="{}"', ((ad.replace('_', '-'), deger) for ad, deger in nitelikler.items() if deger is not None)
+    )
+    bilgi = varyant_bilgisi(dosya.name, dosya.storage)
+    if not bilgi:
+        return format_html('<img src="{}"{}>', dosya.url, img_nitelikleri)
+
+    kaynaklar = format_html_join('', '<source type="{}" srcset="{}" sizes="{}">', (
+        (
+            BICIM_TURLERI[bicim],
+            ', '.join(f'{varyant_url(dosya.name, dosya.storage, g, bicim)} {g}w' for g in bilgi['genislikler']),
+            sizes,
+        )
+        for bicim in bilgi['bicimler']
+    ))
+    return format_html(
+        '<picture>{}<img src="{}"{}></picture>', kaynaklar, dosya.url, img_nitelikleri,
+    )
@@ -1,11 +1,44 @@
-from io import BytesIO
+import gzip
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from datetime import datetime, timedelta
+from io import BytesIO, StringIO
 
 from PIL import Image
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.db import connection, transaction
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
-from .models import Kategori, KoseYazari
+from .benchmark import benzerlik_olc, ornek_veri_olustur, sorgu_planlarini_denetle, tum_adresleri_olc
+from .benzerlik import benzer_icerikler, dizini_olustur
+from .cache import onbellek_istatistikleri, tum_sayfalari_temizle
+from .images import gorsel_islerini_calistir
+from .manset import mansetler
+from .counters import bekleyen_okunma, okunma_artir, okunmalari_yaz
+from .middleware import profil_ozeti
+from .models import (
+    KART_GOVDE_BASI, Destekci, EczaneLinki, Galeri, GorselIsi, Haber, Ilce, Kategori, KoseYazari, KoseYazisi, OzelGun,
+    Siir, TarihiYer, TebrikMesaji, Yorum,
+)
+from .rozetler import ROZET_ANAHTARI, ROZET_DAMGASI_ANAHTARI, destekci_paketleri, eposta_ozeti, rozet_damgasi
+from .search import normallestir
+from .statik import disa_aktar
+from .veritabani import yazma_islemi
+from .views import global_context
+from .yedekleme import eskileri_sil, geri_yukle, yedekle
 
 
 def make_test_image(name="test.jpg"):
@@ -17,14 +50,996 @@ def make_test_image(name="test.jpg"):
 
 
 class AnasayfaTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _anasayfa_sorgulari(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as sorgular:
+            response = self.client.get(reverse("anasayfa"))
+        self.assertEqual(response.status_code, 200)
+        return len(sorgular)
+
+    def _yazar_ekle(self, ad):
+        yazar = KoseYazari.objects.create(ad_soyad=ad, resim="yazarlar/test.jpg")
+        KoseYazisi.objects.create(yazar=yazar, baslik=f"{ad} yazisi", icerik="icerik")
+        return yazar
+
+    def test_yazar_seridi_sorgu_sayisi_yazar_sayisindan_bagimsiz(self):
+        Kategori.objects.create(isim="Gundem")
+        self._yazar_ekle("Tek Yazar")
+        tek_yazarla = self._anasayfa_sorgulari()
+
+        for i in range(6):
+            self._yazar_ekle(f"Yazar {i}")
+        yedi_yazarla = self._anasayfa_sorgulari()
+
+        self.assertEqual(tek_yazarla, yedi_yazarla)
+        self.assertLessEqual(yedi_yazarla, 20)
+
+    def test_son_yazisi_en_yeni_aktif_yaziyi_doner(self):
+        yazar = self._yazar_ekle("Yazar")
+        en_yeni = KoseYazisi.objects.create(yazar=yazar, baslik="En yeni", icerik="icerik")
+        KoseYazisi.objects.create(yazar=yazar, baslik="Taslak", icerik="icerik", aktif_mi=False)
+
+        yazar = KoseYazari.objects.son_yazilariyla().get(pk=yazar.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(yazar.son_yazisi, en_yeni)
+
     def test_anasayfa_ignores_yazar_without_son_yazisi(self):
         Kategori.objects.create(isim="Gundem")
-        KoseYazari.objects.create(
-            ad_soyad="Yazisi Olmayan Yazar",
-            resim=make_test_image(),
-            aktif_mi=True,
-        )
+        gecici = tempfile.TemporaryDirectory()
+        self.addCleanup(gecici.cleanup)
+        with override_settings(MEDIA_ROOT=gecici.name):
+            KoseYazari.objects.create(
+                ad_soyad="Yazisi Olmayan Yazar",
+                resim=make_test_image(),
+                aktif_mi=True,
+            )
 
         response = self.client.get(reverse("anasayfa"))
 
         self.assertEqual(response.status_code, 200)
+
+
+    def _ozel_gun_ekle(self):
+        ozel_gun = OzelGun.objects.create(baslik="Bayram", slug="bayram", aciklama="Kutlu olsun", anasayfada_goster=True)
+        for i in range(2):
+            TebrikMesaji.objects.create(ozel_gun=ozel_gun, ad_soyad=f"Kisi {i}", resim="tebrikler/test.jpg")
+        return ozel_gun
+
+    def test_soguk_sayfa_sicak_parcalardan_kurulur(self):
+        Kategori.objects.create(isim="Gundem")
+        yazar = self._yazar_ekle("Manset Yazari")
+        KoseYazisi.objects.filter(yazar=yazar).update(manset_mi=True)
+        self._ozel_gun_ekle()
+
+        with CaptureQueriesContext(connection) as ilk:
+            self.assertContains(self.client.get(reverse("anasayfa")), "Kisi 1")
+        mesaj_sorgulari = [q for q in ilk.captured_queries if '"haberler_tebrikmesaji"' in q["sql"]]
+        self.assertEqual(len(mesaj_sorgulari), 1)
+
+        tum_sayfalari_temizle()
+        with CaptureQueriesContext(connection) as ikinci:
+            response = self.client.get(reverse("anasayfa"))
+
+        self.assertContains(response, "Manset Yazari yazisi")
+        self.assertLess(len(ikinci), len(ilk))
+        # ETag için okunan MAX/COUNT birleşimi hariç
+        tablolar = " ".join(q["sql"] for q in ikinci.captured_queries if "kaynak_sirasi" not in q["sql"])
+        for tablo in ("haberler_tebrikmesaji", "haberler_ozelgun", "haberler_koseyazari"):
+            self.assertNotIn(f'FROM "{tablo}"', tablolar)
+
+    def test_parca_yalnizca_kendi_modeli_degisince_yenilenir(self):
+        yazar = self._yazar_ekle("Yazar")
+        self.client.get(reverse("anasayfa"))
+        yazi = yazar.yazilar.get()
+
+        yazi.baslik = "Yeni baslik"
+        yazi.save()
+
+        self.assertContains(self.client.get(reverse("anasayfa")), "Yeni baslik")
+
+
+class MansetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.kategori = Kategori.objects.create(isim="Gundem")
+        self.yazar = KoseYazari.objects.create(ad_soyad="Manset Yazari", resim="yazarlar/test.jpg")
+
+    def _haber(self, baslik, gun_once):
+        return Haber.objects.create(
+            baslik=baslik, icerik="icerik", kategori=self.kategori, manset_mi=True,
+            yayin_tarihi=timezone.now() - timedelta(days=gun_once),
+        )
+
+    def test_haber_ve_yazilar_tek_sorguda_tarihe_gore_birlesir(self):
+        for i in range(8):
+            self._haber(f"Haber {i}", gun_once=i * 2)
+        KoseYazisi.objects.create(
+            yazar=self.yazar, baslik="Yazi", manset_mi=True, yayin_tarihi=timezone.now() - timedelta(days=3),
+            icerik="<p>&Ccedil;ok uzun bir g&ouml;vde " + "kelime " * 500 + "</p>", manset_resmi="manset_yazilari/x.jpg",
+        )
+        Haber.objects.create(baslik="Manset degil", icerik="icerik", kategori=self.kategori)
+
+        with CaptureQueriesContext(connection) as sorgular:
+            ogeler = mansetler()
+
+        self.assertEqual(len(sorgular), 1)
+        self.assertIn("LIMIT 10", sorgular[0]["sql"])
+        self.assertEqual(len(ogeler), 9)
+        self.assertEqual([oge.baslik for oge in ogeler[:4]], ["Haber 0", "Haber 1", "Yazi", "Haber 2"])
+        yazi = ogeler[2]
+        self.assertEqual(yazi.yazar_adi, "Manset Yazari")
+        self.assertTrue(yazi.ozet.startswith("Çok uzun bir gövde"))
+        self.assertLessEqual(len(yazi.ozet), 110)
+        self.assertEqual(yazi.resim.name, "manset_yazilari/x.jpg")
+        self.assertEqual(yazi.adres, reverse("yazi_detay", args=[yazi.pk]))
+
+    @override_settings(MANSET_GECERLILIK_GUNU=5)
+    def test_suresi_gecen_manset_dusar(self):
+        self._haber("Taze", gun_once=1)
+        self._haber("Unutulmus", gun_once=40)
+
+        sayfa = self.client.get(reverse("anasayfa")).content.decode()
+        bas = sayfa.index('id="mansetSlider"')
+        serit = sayfa[bas:sayfa.index('class="carousel-control-prev"', bas)]
+
+        self.assertIn("Taze", serit)
+        self.assertNotIn("Unutulmus", serit)
+        self.assertEqual([oge.baslik for oge in mansetler()], ["Taze"])
+
+        with self.settings(MANSET_GECERLILIK_GUNU=None):
+            self.assertEqual([oge.baslik for oge in mansetler()], ["Taze", "Unutulmus"])
+
+    def test_varsayilan_olarak_eski_manset_dusmez(self):
+        self._haber("Unutulmus", gun_once=400)
+
+        self.assertIsNone(settings.MANSET_GECERLILIK_GUNU)
+        self.assertEqual([oge.baslik for oge in mansetler()], ["Unutulmus"])
+
+
+class KartSorgusuTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.kategori = Kategori.objects.create(isim="Gundem")
+
+    def _haber(self, i, **alanlar):
+        ilce = Ilce.objects.create(isim=f"Ilce {i}")
+        return Haber.objects.create(baslik=f"Haber {i}", kategori=self.kategori, ilce=ilce, **alanlar)
+
+    def _sayfa_sorgulari(self, adres):
+        cache.clear()
+        with CaptureQueriesContext(connection) as sorgular:
+            response = self.client.get(adres)
+        self.assertEqual(response.status_code, 200)
+        return len(sorgular)
+
+    def test_liste_sorgu_sayisi_kart_sayisindan_bagimsiz(self):
+        adresler = [reverse("anasayfa"), reverse("kategori_haberleri", args=[self.kategori.pk]), reverse("roportaj_listesi")]
+        self._haber(0, icerik="icerik", roportaj_mi=True)
+        tek_kartla = [self._sayfa_sorgulari(adres) for adres in adresler]
+
+        for i in range(1, 12):
+            self._haber(i, icerik="icerik", roportaj_mi=True)
+
+        self.assertEqual([self._sayfa_sorgulari(adres) for adres in adresler], tek_kartla)
+
+    def test_kartlar_govdeyi_okumadan_iliskili_adlari_getirir(self):
+        self._haber(0, icerik="<p>Giri&#351; paragraf&#305;</p>" + "<p>uzun govde</p>" * 2000, roportaj_mi=True)
+
+        haber = Haber.objects.kartlar().get()
+
+        self.assertTrue({"icerik", "islenmis_govde"} <= haber.get_deferred_fields())
+        self.assertLessEqual(len(haber.govde_basi), KART_GOVDE_BASI)
+        with self.assertNumQueries(0):
+            self.assertEqual((haber.kategori.isim, haber.ilce.isim), ("Gundem", "Ilce 0"))
+            self.assertTrue(haber.kart_ozeti.startswith("Giriş paragrafı"))
+        self.assertContains(self.client.get(reverse("roportaj_listesi")), "Giriş paragrafı")
+
+    def test_siir_kartlari_metnin_yalnizca_basini_okur(self):
+        Siir.objects.create(baslik="Siir", sair="Sair", siir_metni="<p>Ilk dize</p>" + "<p>uzun dize</p>" * 2000)
+
+        siir = Siir.objects.kartlar().get()
+
+        self.assertTrue({"siir_metni", "islenmis_govde"} <= siir.get_deferred_fields())
+        self.assertLessEqual(len(siir.kart_metni), KART_GOVDE_BASI)
+        self.assertFalse(siir.kart_metni.endswith("<"))
+        self.assertContains(self.client.get(reverse("siir_listesi")), "Ilk dize")
+
+
+class GlobalContextOnbellekTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get("/")
+
+    def test_sicak_onbellekte_sorgu_atilmaz(self):
+        Kategori.objects.create(isim="Gundem")
+        global_context(self.request)
+
+        with self.assertNumQueries(0):
+            veri = global_context(self.request)
+
+        self.assertEqual([k.isim for k in veri["global_kategoriler"]], ["Gundem"])
+        self.assertEqual(onbellek_istatistikleri()["navigasyon"], {"isabet": 1, "iska": 1})
+
+    def test_kategori_kaydi_surumu_gunceller(self):
+        global_context(self.request)
+        Kategori.objects.create(isim="Spor")
+
+        veri = global_context(self.request)
+
+        self.assertEqual([k.isim for k in veri["global_kategoriler"]], ["Spor"])
+
+    def test_kayit_navigasyonu_yazan_istekte_uretmez(self):
+        with CaptureQueriesContext(connection) as sorgular:
+            Galeri.objects.create(baslik="Galeri", kapak_resmi="galeri_kapak/g.jpg")
+
+        self.assertFalse([q for q in sorgular.captured_queries if '"haberler_kategori"' in q["sql"]])
+        self.assertEqual(onbellek_istatistikleri().get("navigasyon"), {"isabet": 0, "iska": 0})
+
+
+class SayfaOnbellegiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        okunmalari_yaz()
+        self.kategori = Kategori.objects.create(isim="Gundem")
+        self.haber = Haber.objects.create(baslik="Ilk Baslik", icerik="<p>icerik</p>", kategori=self.kategori)
+
+    def test_anonim_detay_sayfasi_onbellekten_sunulur(self):
+        url = reverse("haber_detay", args=[self.haber.pk])
+        self.client.get(url)
+        Haber.objects.filter(pk=self.haber.pk).update(baslik="Sessiz Degisiklik")
+
+        response = self.client.get(url)
+
+        self.assertContains(response, "Ilk Baslik")
+        self.assertEqual(bekleyen_okunma(Haber, self.haber.pk), 2)
+
+    def test_menu_bayragi_degisince_tum_sayfalar_temizlenir(self):
+        adres = reverse("anasayfa")
+        self.assertNotContains(self.client.get(adres), "Foto Galeri")
+
+        Galeri.objects.create(baslik="Ilk Galeri", kapak_resmi="galeri_kapak/ilk.jpg")
+
+        self.assertContains(self.client.get(adres), "Foto Galeri")
+
+    def test_toplu_onaylanan_yorumlar_onbellekteki_sayfada_gorunur(self):
+        from django.contrib.admin.sites import site
+        from django.contrib.auth.models import User
+
+        detay_url = reverse("haber_detay", args=[self.haber.pk])
+        Yorum.objects.bulk_create([
+            Yorum(haber=self.haber, isim=f"Okur {i}", email=f"okur{i}@example.com", govde=f"Bekleyen yorum {i}")
+            for i in range(2)
+        ])
+        self.assertNotContains(self.client.get(detay_url), "Bekleyen yorum 0")
+
+        self.client.force_login(User.objects.create_superuser("editor", "editor@example.com", "x"))
+        self.client.post(reverse("admin:haberler_yorum_changelist"), {
+            "action": "yorumlari_onayla", "_selected_action": list(Yorum.objects.values_list("pk", flat=True)),
+        })
+        self.client.logout()
+
+        response = self.client.get(detay_url)
+        self.assertContains(response, "Bekleyen yorum 0")
+        self.assertContains(response, "Bekleyen yorum 1")
+
+    def test_haber_kaydi_detay_ve_kategori_sayfalarini_temizler(self):
+        detay_url = reverse("haber_detay", args=[self.haber.pk])
+        kategori_url = reverse("kategori_haberleri", args=[self.kategori.pk])
+        self.client.get(detay_url)
+        self.client.get(kategori_url + "?utm_source=test")
+
+        self.haber.baslik = "Guncel Baslik"
+        self.haber.save()
+
+        self.assertContains(self.client.get(detay_url), "Guncel Baslik")
+        self.assertContains(self.client.get(kategori_url + "?utm_source=test"), "Guncel Baslik")
+
+
+class ImlecliSayfalamaTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.kategori = Kategori.objects.create(isim="Gundem")
+        simdi = timezone.now()
+        # Aynı saniyede yayımlanan haberler id ile ayrışmalı
+        self.haberler = [
+            Haber.objects.create(baslik=f"Haber {i}", icerik="icerik", kategori=self.kategori,
+                                 yayin_tarihi=simdi - timedelta(minutes=i // 3))
+            for i in range(30)
+        ]
+        self.url = reverse("kategori_haberleri", args=[self.kategori.pk])
+
+    def test_ileri_geri_gezinme_her_haberi_bir_kez_gosterir(self):
+        gorulen, adres, sayfalar = [], "", []
+        while True:
+            sayfa = self.client.get(self.url + adres).context["haberler"]
+            sayfalar.append(adres)
+            gorulen += [haber.pk for haber in sayfa]
+            if not sayfa.has_next:
+                break
+            adres = sayfa.sonraki_adresi
+
+        beklenen = [h.pk for h in sorted(self.haberler, key=lambda h: (h.yayin_tarihi, h.pk), reverse=True)]
+        self.assertEqual(gorulen, beklenen)
+        self.assertEqual(len(sayfalar), 3)
+
+        son_sayfanin_oncesi = self.client.get(self.url + sayfa.onceki_adresi).context["haberler"]
+        self.assertEqual([h.pk for h in son_sayfanin_oncesi], beklenen[12:24])
+
+    def test_eski_sayfa_adresi_imlece_yonlendirilir(self):
+        response = self.client.get(self.url + "?page=2")
+
+        self.assertEqual(response.status_code, 301)
+        ilk = self.client.get(self.url).context["haberler"]
+        self.assertEqual(response["Location"], self.url + ilk.sonraki_adresi)
+        self.assertRedirects(self.client.get(self.url + "?page=1"), self.url, status_code=301)
+
+    def test_eski_sayfa_yonlendirmesi_onbellekten_gelir(self):
+        with CaptureQueriesContext(connection) as sorgular:
+            response = self.client.get(self.url + "?page=2")
+            tekrar = self.client.get(self.url + "?page=2")
+        self.assertEqual(tekrar["Location"], response["Location"])
+        self.assertEqual(len([q for q in sorgular.captured_queries if "OFFSET" in q["sql"]]), 1)
+
+    def test_sondan_sonraki_eski_sayfa_son_sayfaya_gider_asiri_derin_sayfa_404(self):
+        son_sayfa = self.client.get(self.url + "?page=3")["Location"]
+        for numara in ("4", "0", "-2"):
+            response = self.client.get(self.url + f"?page={numara}")
+            self.assertEqual(response.status_code, 301)
+            self.assertEqual(response["Location"], son_sayfa)
+        self.assertEqual(len(self.client.get(son_sayfa).context["haberler"]), 6)
+
+        for numara in ("10001", "9223372036854775807", "99999999999999999999"):
+            self.assertEqual(self.client.get(self.url + f"?page={numara}").status_code, 404)
+
+
+class OkunmaSayaciTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        okunmalari_yaz()
+        kategori = Kategori.objects.create(isim="Gundem")
+        self.haberler = [
+            Haber.objects.create(baslik=f"Haber {i}", icerik="icerik", kategori=kategori)
+            for i in range(3)
+        ]
+
+    def test_artislar_tek_seferde_yazilir(self):
+        for haber in self.haberler:
+            for _ in range(haber.pk):
+                okunma_artir(Haber, haber.pk)
+        self.assertEqual(Haber.objects.filter(okunma_sayisi__gt=0).count(), 0)
+
+        with self.assertNumQueries(3):  # SAVEPOINT + UPDATE + RELEASE
+            okunmalari_yaz()
+
+        for haber in self.haberler:
+            haber.refresh_from_db()
+            self.assertEqual(haber.okunma_sayisi, haber.pk)
+        self.assertEqual(bekleyen_okunma(Haber, self.haberler[0].pk), 0)
+
+    def test_detay_sayfasi_bekleyen_artisi_gosterir(self):
+        haber = self.haberler[0]
+        okunma_artir(Haber, haber.pk, adet=41)
+
+        response = self.client.get(reverse("haber_detay", args=[haber.pk]))
+
+        self.assertEqual(response.context["haber"].okunma_sayisi, 42)
+        haber.refresh_from_db()
+        self.assertEqual(haber.okunma_sayisi, 0)
+
+
+class AramaTests(TestCase):
+    def setUp(self):
+        kategori = Kategori.objects.create(isim="Gundem")
+        self.baslikta = Haber.objects.create(
+            baslik="Şavşat'ta Karagöl festivali", icerik="<p>Yayla şenliği</p>", kategori=kategori,
+        )
+        self.govdede = Haber.objects.create(
+            baslik="Yayla yolları açıldı", icerik="<p>Karagöl yolu <b>kardan</b> temizlendi</p>", kategori=kategori,
+        )
+        yazar = KoseYazari.objects.create(ad_soyad="Sami Özçelik", resim="yazarlar/test.jpg")
+        self.yazi = KoseYazisi.objects.create(yazar=yazar, baslik="Kış notları", icerik="<p>ARTVİN ve kar</p>")
+
+    def test_turkce_normallestirme(self):
+        self.assertEqual(normallestir("<p>İSTANBUL Işık Şavşat</p>"), "istanbul isik savsat")
+
+    def test_baslik_eslesmesi_once_gelir_ve_aksansiz_arama_calisir(self):
+        response = self.client.get(reverse("arama"), {"q": "karagol"})
+
+        sonuclar = [sonuc.nesne for sonuc in response.context["sonuclar"]]
+        self.assertEqual(sonuclar, [self.baslikta, self.govdede])
+
+    def test_kose_yazilari_da_aranir_ve_pasif_icerik_dusurulur(self):
+        response = self.client.get(reverse("arama"), {"q": "artvin"})
+        self.assertEqual([s.nesne for s in response.context["sonuclar"]], [self.yazi])
+
+        self.yazi.aktif_mi = False
+        self.yazi.save()
+        response = self.client.get(reverse("arama"), {"q": "artvin"})
+        self.assertEqual(list(response.context["sonuclar"]), [])
+
+
+class KosulluGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        okunmalari_yaz()
+        self.haber = Haber.objects.create(baslik="Ilk Baslik", icerik="<p>icerik</p>", kategori=Kategori.objects.create(isim="Gundem"))
+        self.url = reverse("haber_detay", args=[self.haber.pk])
+
+    def test_ayni_etag_304_doner_ve_okunma_sayilir(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(bekleyen_okunma(Haber, self.haber.pk), 2)
+
+    def test_kayit_degisince_etag_degisir(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.haber.baslik = "Guncel Baslik"
+        self.haber.save(update_fields=["baslik"])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertContains(response, "Guncel Baslik")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_en_yeni_olmayan_kaydin_silinmesi_etagi_degistirir(self):
+        eski = EczaneLinki.objects.create(ilce_adi="Hopa", url="https://example.com/hopa", sira=1)
+        EczaneLinki.objects.create(ilce_adi="Arhavi", url="https://example.com/arhavi", sira=2)
+        EczaneLinki.objects.filter(pk=eski.pk).update(guncellenme_tarihi=timezone.now() - timedelta(days=1))
+        adres = reverse("kategori_haberleri", args=[self.haber.kategori_id])
+        etag = self.client.get(adres)["ETag"]
+
+        eski.delete()
+
+        self.assertNotEqual(self.client.get(adres, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_liste_dogrulayicisi_indeks_aramasi_sicak_sayfa_sorgusuz(self):
+        adres = reverse("kategori_haberleri", args=[self.haber.kategori_id])
+        with CaptureQueriesContext(connection) as sorgular:
+            etag = self.client.get(adres)["ETag"]
+
+        sql = [q["sql"] for q in sorgular.captured_queries if "kaynak_sirasi" in q["sql"]]
+        self.assertEqual(len(sql), 1)
+        self.assertNotIn("COUNT(", sql[0])
+        self.assertIn(f'"kategori_id" = {self.haber.kategori_id}', sql[0])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(adres)["ETag"], etag)
+            self.assertEqual(self.client.get(adres, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_giris_yapmis_kullaniciya_dogrulayici_verilmez(self):
+        from django.contrib.auth.models import User
+        self.client.force_login(User.objects.create_user("okur", password="x"))
+
+        self.assertFalse(self.client.get(self.url).has_header("ETag"))
+
+
+class DestekciRozetiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.haber = Haber.objects.create(baslik="Haber", icerik="icerik", kategori=Kategori.objects.create(isim="Gundem"))
+        self.url = reverse("haber_detay", args=[self.haber.pk])
+        for email in ("Okur@Example.com", "baskasi@example.com"):
+            Yorum.objects.create(haber=self.haber, isim="Okur", email=email, govde="Yorum", aktif=True)
+
+    def _destekci(self, saniye, paket="okur"):
+        return Destekci.objects.create(
+            isim="Okur", email="okur@example.com", paket=paket, aktif_mi=True,
+            bitis_tarihi=timezone.now() + timedelta(seconds=saniye),
+        )
+
+    def _rozetler(self):
+        tum_sayfalari_temizle()
+        with CaptureQueriesContext(connection) as sorgular:
+            response = self.client.get(self.url)
+        destekci_sorgulari = [q for q in sorgular.captured_queries if '"haberler_destekci"' in q["sql"]]
+        return [yorum.destekci_tipi for yorum in response.context["yorumlar"]], len(destekci_sorgulari), response["ETag"]
+
+    def test_dizin_onbellekten_okunur_ve_destekci_degisince_yenilenir(self):
+        destekci = self._destekci(3600)
+
+        rozetler, sorgu, _ = self._rozetler()
+        self.assertEqual((sorted(rozetler, key=str), sorgu), ([None, "okur"], 1))
+        rozetler, sorgu, etag = self._rozetler()
+        self.assertEqual((sorted(rozetler, key=str), sorgu), ([None, "okur"], 0))
+
+        destekci.paket = "sponsor"
+        destekci.save()
+
+        rozetler, _, yeni_etag = self._rozetler()
+        self.assertIn("sponsor", rozetler)
+        self.assertNotEqual(yeni_etag, etag)
+
+    def test_dizin_en_yakin_bitis_tarihinde_duser(self):
+        self._destekci(1)
+        self.assertEqual(destekci_paketleri({" OKUR@example.com"}), {" OKUR@example.com": "okur"})
+
+        time.sleep(1.1)
+
+        self.assertEqual(destekci_paketleri({" OKUR@example.com"}), {})
+
+    def test_damga_ve_rozetler_ayri_anahtarlarda_tutulur(self):
+        self._destekci(3600)
+
+        damga = rozet_damgasi()
+
+        self.assertIsInstance(cache.get(ROZET_DAMGASI_ANAHTARI), int)
+        anahtar = ROZET_ANAHTARI.format(damga=damga, ozet=eposta_ozeti("okur@example.com"))
+        self.assertEqual(cache.get(anahtar), "okur")
+
+
+class BeslemeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.kategori = Kategori.objects.create(isim="Gundem")
+        self.haber = Haber.objects.create(
+            baslik="Ilk Haber", icerik="<p>[video=https://youtu.be/dQw4w9WgXcQ]</p>", kategori=self.kategori,
+        )
+
+    def test_govde_islenmis_halinden_gelir(self):
+        for ad in ("rss_haberler", "atom_haberler"):
+            with self.subTest(ad=ad):
+                response = self.client.get(reverse(ad))
+                self.assertContains(response, "Ilk Haber")
+                self.assertContains(response, "youtube.com/embed/dQw4w9WgXcQ")
+
+    def test_yeni_haber_onbellekteki_beslemeyi_dusurur_ve_304_doner(self):
+        adres = reverse("rss_kategori", args=[self.kategori.pk])
+        etag = self.client.get(adres)["ETag"]
+        self.assertEqual(self.client.get(adres, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Haber.objects.create(baslik="Yeni Haber", icerik="<p>x</p>", kategori=self.kategori)
+
+        self.assertContains(self.client.get(adres, HTTP_IF_NONE_MATCH=etag), "Yeni Haber")
+
+
+class TarihiYerHaritasiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.kale = TarihiYer.objects.create(
+            baslik="Artvin Kalesi", icerik="<p>Kale metni</p>", enlem="41.182800", boylam="41.818300",
+            resim="tarihi_yerler/kale.jpg",
+        )
+        self.gol = TarihiYer.objects.create(
+            baslik="Karagol", icerik="<p>Gol metni</p>", ilce="Borçka", enlem="41.390000", boylam="41.860000",
+            resim="tarihi_yerler/gol.jpg",
+        )
+
+    def test_isaretler_gorunen_alana_gore_suzulur(self):
+        tumu = self.client.get(reverse("tarihi_yer_isaretleri"), HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(tumu["Content-Encoding"], "gzip")
+        self.assertEqual(len(json.loads(gzip.decompress(tumu.content))["yerler"]), 2)
+
+        veri = self.client.get(reverse("tarihi_yer_isaretleri"), {"kutu": "41.7,41.1,41.9,41.3"}).json()
+
+        self.assertEqual([yer["id"] for yer in veri["yerler"]], [self.kale.pk])
+        self.assertEqual((veri["yerler"][0]["lat"], veri["yerler"][0]["lng"]), (41.1828, 41.8183))
+        self.assertIsNone(veri["sonraki"])
+        for kutu in ("x", "nan,nan,nan,nan", "inf,41.1,41.9,41.3", "41.7,41.1,1e400,41.3", "41.7,-91,41.9,41.3",
+                     "181,41.1,41.9,41.3"):
+            self.assertEqual(self.client.get(reverse("tarihi_yer_isaretleri"), {"kutu": kutu}).status_code, 400, kutu)
+
+    def test_sayfa_govdeleri_tasimaz_ve_govde_istenince_gelir(self):
+        response = self.client.get(reverse("tarihi_yer_detay", args=[self.kale.slug]))
+
+        self.assertContains(response, "Kale metni")
+        self.assertNotContains(response, "Gol metni")
+        icerik = self.client.get(reverse("tarihi_yer_icerigi", args=[self.gol.pk])).json()
+        self.assertEqual(icerik["icerik"], "<p>Gol metni</p>")
+
+    def test_kayit_degisince_isaretler_yenilenir(self):
+        adres = reverse("tarihi_yer_isaretleri")
+        self.client.get(adres)
+        self.gol.enlem = "41.400000"
+        self.gol.save()
+
+        enlemler = {yer["id"]: yer["lat"] for yer in self.client.get(adres).json()["yerler"]}
+
+        self.assertEqual(enlemler[self.gol.pk], 41.4)
+
+
+class PerformansButcesiTests(TestCase):
+    """
+    Her herkese açık görünüm için soğuk önbellekte sorgu bütçesi. Süre bütçesi
+    makineye bağlı olduğundan `manage.py performans_raporu` ile denetlenir.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        ornek_veri_olustur()
+
+    def setUp(self):
+        okunmalari_yaz()
+
+    def test_gorunumler_butce_icinde(self):
+        for olcum in tum_adresleri_olc(self.client):
+            with self.subTest(gorunum=olcum.ad):
+                self.assertEqual(olcum.durum, 200)
+                self.assertIsNotNone(olcum.butce, f"{olcum.ad} için bütçe tanımlanmamış")
+                en_fazla_sorgu, _ = olcum.butce
+                self.assertLessEqual(olcum.sorgu, en_fazla_sorgu)
+
+    def test_sicak_sorgular_tam_tarama_yapmaz(self):
+        taramalar = [(b.ad, b.tam_taramalar) for b in sorgu_planlarini_denetle(self.client) if b.tam_taramalar]
+        self.assertEqual(taramalar, [])
+
+
+class VeritabaniBaglantisiTests(TestCase):
+    def test_sqlite_baglantisi_pragmalarla_acilir(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("Yalnızca SQLite")
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMALARI["busy_timeout"])
+
+
+class YazmaIslemiTests(TransactionTestCase):
+    def test_yalnizca_yazma_islemi_kilidi_basta_alir(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("Yalnızca SQLite")
+        with CaptureQueriesContext(connection) as sorgular:
+            with yazma_islemi():
+                Kategori.objects.create(isim="Gundem")
+            with transaction.atomic():
+                Kategori.objects.count()
+
+        baslangiclar = [q["sql"] for q in sorgular.captured_queries if q["sql"].startswith("BEGIN")]
+        self.assertEqual(baslangiclar, ["BEGIN IMMEDIATE", "BEGIN"])
+
+
+class YedeklemeTests(TestCase):
+    def setUp(self):
+        self.dizin = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dizin)
+        self.kaynak = sqlite3.connect(os.path.join(self.dizin, "kaynak.sqlite3"))
+        self.addCleanup(self.kaynak.close)
+        self.kaynak.execute("CREATE TABLE t (x TEXT)")
+        self.kaynak.executemany("INSERT INTO t VALUES (?)", [("a" * 500,)] * 200)
+        self.kaynak.commit()
+
+    def test_fark_yedegi_yalnizca_degisen_sayfalari_yazar_ve_geri_yuklenir(self):
+        yedekler = os.path.join(self.dizin, "yedekler")
+        simdi = datetime(2026, 1, 10, 3, 0)
+        tam = yedekle(self.kaynak, yedekler, artimli=True, simdi=simdi)
+        self.assertEqual(tam.tur, "tam")
+
+        self.kaynak.execute("INSERT INTO t VALUES ('yeni')")
+        self.kaynak.commit()
+        fark = yedekle(self.kaynak, yedekler, artimli=True, simdi=simdi + timedelta(days=1))
+        self.assertEqual(fark.tur, "fark")
+        self.assertLess(fark.degisen_sayfa, fark.toplam_sayfa // 2)
+
+        hedef = os.path.join(self.dizin, "geri.sqlite3")
+        geri_yukle(os.path.join(yedekler, fark.dosya), hedef)
+        with closing(sqlite3.connect(hedef)) as geri:
+            self.assertEqual(geri.execute("SELECT COUNT(*) FROM t").fetchone()[0], 201)
+
+        # Taban tam yedek eski olsa da, ona bağlı fark saklandıkça silinmez
+        silinenler = eskileri_sil(yedekler, gun=30, simdi=simdi + timedelta(days=31))
+        self.assertEqual(silinenler, [])
+        silinenler = eskileri_sil(yedekler, gun=30, simdi=simdi + timedelta(days=32))
+        self.assertEqual(len(silinenler), 3)
+
+
+class StatikKopyaTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.dizin = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dizin)
+        self.haber = Haber.objects.create(baslik="Statik Baslik", icerik="icerik", kategori=Kategori.objects.create(isim="Gundem"))
+        self.adres = reverse("haber_detay", args=[self.haber.pk])
+
+    def test_yalnizca_degisen_sayfalar_yeniden_uretilir(self):
+        sonuc = disa_aktar(self.dizin)
+        yol = os.path.join(self.dizin, self.adres.strip("/"), "index.html")
+        with open(yol, encoding="utf-8") as dosya:
+            self.assertIn("Statik Baslik", dosya.read())
+        self.assertIn(self.adres, sonuc.uretilen)
+        self.assertEqual(sonuc.hatali, [])
+
+        # Hiçbir şey değişmediyse detay sayfası istenmez bile
+        self.assertNotIn(self.adres, disa_aktar(self.dizin).uretilen)
+
+        self.haber.baslik = "Yeni Baslik"
+        self.haber.save()
+        self.assertIn(self.adres, disa_aktar(self.dizin).uretilen)
+
+        self.haber.aktif_mi = False
+        self.haber.save()
+        self.assertIn(self.adres, disa_aktar(self.dizin).silinen)
+        self.assertFalse(os.path.exists(yol))
+
+
+class SiteHaritasiTests(TestCase):
+    def setUp(self):
+        self.dizin = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dizin, ignore_errors=True)
+        ayarlar = override_settings(SITE_HARITASI_DIZINI=self.dizin, SITE_ADRESI="https://ornek.test")
+        ayarlar.enable()
+        self.addCleanup(ayarlar.disable)
+        kategori = Kategori.objects.create(isim="Gundem")
+        self.haber = Haber.objects.create(baslik="Baraj & Yol", icerik="<p>x</p>", kategori=kategori)
+        Haber.objects.create(baslik="Taslak", icerik="<p>x</p>", kategori=kategori, aktif_mi=False)
+
+    def test_dizin_parcalari_ve_haber_haritasini_listeler(self):
+        response = self.client.get(reverse("site_haritasi"))
+
+        self.assertContains(response, "https://ornek.test/sitemap-haber-0.xml")
+        self.assertContains(response, "https://ornek.test/sitemap-haberler-0.xml")
+        self.assertNotContains(response, "sitemap-siir-0.xml")
+        self.assertContains(self.client.get("/sitemap-haberler-0.xml"), "<news:title>Baraj &amp; Yol</news:title>")
+
+    def test_yalnizca_degisen_parca_yeniden_yazilir(self):
+        adres = reverse("site_haritasi_parcasi", args=["haber", 0])
+        response = self.client.get(adres)
+        icerik = b"".join(response.streaming_content).decode()
+        self.assertIn(f"<loc>https://ornek.test/haber/{self.haber.pk}/</loc>", icerik)
+        self.assertEqual(icerik.count("<url>"), 1)
+        self.assertEqual(self.client.get(adres, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code, 304)
+        ilk = os.listdir(self.dizin)
+
+        self.haber.save()
+        self.client.get(adres)
+
+        self.assertEqual(len(os.listdir(self.dizin)), 1)
+        self.assertNotEqual(os.listdir(self.dizin), ilk)
+        self.assertEqual(self.client.get(reverse("site_haritasi_parcasi", args=["haber", 1])).status_code, 404)
+
+
+class BenzerIcerikTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.dizin = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dizin, ignore_errors=True)
+        ayarlar = override_settings(BENZERLIK_DIZINI=self.dizin)
+        ayarlar.enable()
+        self.addCleanup(ayarlar.disable)
+        self.gundem = Kategori.objects.create(isim="Gundem")
+        self.spor = Kategori.objects.create(isim="Spor")
+        self.baraj = [
+            self._haber("Yusufeli barajında su seviyesi yükseldi", "Baraj gölü su seviyesi türbin elektrik üretimi"),
+            self._haber("Deriner barajı elektrik üretiminde rekor", "Baraj türbin elektrik üretimi su seviyesi"),
+            self._haber("Borçka barajı kapakları açıldı", "Baraj gölü kapaklar su seviyesi türbin"),
+        ]
+        self.futbol = [
+            self._haber("Artvin Hopaspor deplasmanda kazandı", "Futbol maçı gol teknik direktör taraftar", self.spor),
+            self._haber("Hopaspor taraftarı stadı doldurdu", "Futbol maçı taraftar gol tribün", self.spor),
+        ]
+        yazar = KoseYazari.objects.create(ad_soyad="Yazar")
+        self.yazi = KoseYazisi.objects.create(
+            yazar=yazar, baslik="Barajlar ve vadinin geleceği", icerik="Baraj gölü türbin elektrik su seviyesi",
+        )
+
+    def _haber(self, baslik, icerik, kategori=None, **alanlar):
+        return Haber.objects.create(baslik=baslik, icerik=f"<p>{icerik}</p>", kategori=kategori or self.gundem, **alanlar)
+
+    def _liste(self, haber):
+        return [(b.hedef_tur, b.hedef_id) for b in benzer_icerikler("haber", haber.pk)]
+
+    def test_tam_kurulum_konu_komsularini_bulur_ve_sayfa_listeyi_tek_sorguyla_okur(self):
+        call_command("benzerlik_dizinini_olustur", stdout=StringIO())
+
+        liste = self._liste(self.baraj[0])
+        self.assertEqual(set(liste[:3]), {("haber", self.baraj[1].pk), ("haber", self.baraj[2].pk), ("yazi", self.yazi.pk)})
+        self.assertNotIn(("haber", self.baraj[0].pk), liste)
+
+        with CaptureQueriesContext(connection) as sorgular:
+            response = self.client.get(reverse("haber_detay", args=[self.baraj[0].pk]))
+        benzer_sorgulari = [
+            q for q in sorgular.captured_queries if '"haberler_benzericerik"' in q["sql"] and "kaynak_sirasi" not in q["sql"]
+        ]
+        self.assertEqual(len(benzer_sorgulari), 1)
+        self.assertContains(response, reverse("yazi_detay", args=[self.yazi.pk]))
+
+    def test_kaydedilen_ve_yayindan_kalkan_haber_listeleri_artimli_gunceller(self):
+        dizini_olustur()
+        adres = reverse("haber_detay", args=[self.baraj[1].pk])
+        self.client.get(adres)
+
+        yeni = self._haber("Yusufeli barajı türbinleri devrede", "Baraj türbin elektrik üretimi su seviyesi gölü")
+
+        self.assertIn(("haber", yeni.pk), self._liste(self.baraj[1]))
+        self.assertTrue(set(self._liste(yeni)[:3]) <= {("haber", h.pk) for h in self.baraj} | {("yazi", self.yazi.pk)})
+        self.assertContains(self.client.get(adres), "Yusufeli barajı türbinleri devrede")
+
+        yeni.baslik = "Yusufeli barajında türbinler devrede"
+        yeni.save()
+        self.assertContains(self.client.get(adres), "Yusufeli barajında türbinler devrede")
+
+        yeni.aktif_mi = False
+        yeni.save()
+        self.assertNotIn(("haber", yeni.pk), self._liste(self.baraj[1]))
+        self.assertNotContains(self.client.get(adres), "Yusufeli barajında türbinler devrede")
+
+    def test_metni_degismeyen_kismi_kayit_dizine_dokunmaz(self):
+        dizini_olustur()
+        haber = self.baraj[0]
+
+        with CaptureQueriesContext(connection) as sorgular:
+            haber.save(update_fields=["okunma_sayisi"])
+            haber.save(update_fields=["resim"])
+
+        tablolar = " ".join(q["sql"] for q in sorgular.captured_queries)
+        self.assertNotIn('"haberler_benzerlikvektoru"', tablolar)
+
+    def test_dizin_yokken_kategorinin_en_yenileri_gosterilir(self):
+        response = self.client.get(reverse("haber_detay", args=[self.futbol[0].pk]))
+
+        self.assertEqual([b.hedef_id for b in response.context["benzer_haberler"]], [self.futbol[1].pk])
+
+    def test_yapay_belgelerle_olcum(self):
+        olcum = benzerlik_olc(belge_sayisi=300, belge_uzunlugu=40, kelime_sayisi=2000)
+
+        self.assertEqual(olcum.belge, 300)
+        self.assertGreater(olcum.terim, 0)
+
+
+class IslenmisGovdeTests(TestCase):
+    def setUp(self):
+        self.kategori = Kategori.objects.create(isim="Gundem")
+
+    def test_video_sozdizimleri_kayitta_bir_kez_islenir(self):
+        haber = Haber.objects.create(
+            baslik="Video", kategori=self.kategori,
+            icerik="<p>(video: https://youtu.be/abcdefghijk)</p><p>[video=https://www.youtube.com/watch?v=bcdefghijkl&t=30s]</p>",
+        )
+
+        self.assertEqual(haber.islenmis_govde.count("<iframe"), 2)
+        self.assertIn("embed/bcdefghijkl?rel=0&modestbranding=1&playsinline=1&start=30", haber.islenmis_govde)
+        self.assertNotIn("(video:", haber.islenmis_govde)
+
+    def test_kayit_disi_degisiklik_ozetten_anlasilir_ve_komutla_yazilir(self):
+        haber = Haber.objects.create(baslik="Haber", kategori=self.kategori, icerik="<p>Eski</p>")
+        Haber.objects.filter(pk=haber.pk).update(icerik="<p>[video=https://youtu.be/abcdefghijk]</p>")
+
+        haber.refresh_from_db()
+        self.assertIn("<iframe", haber.govde_html)
+
+        cikti = StringIO()
+        call_command("govdeleri_isle", stdout=cikti)
+        self.assertIn("1 gövde yeniden işlendi", cikti.getvalue())
+        haber.refresh_from_db()
+        self.assertIn("<iframe", haber.islenmis_govde)
+
+
+class IstekProfiliTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.gecici = tempfile.TemporaryDirectory()
+        self.addCleanup(self.gecici.cleanup)
+        self.dosya = os.path.join(self.gecici.name, "yavas.jsonl")
+
+    def test_yavas_istek_gunluge_yazilir_ve_ozetlenir(self):
+        Kategori.objects.create(isim="Gundem")
+        with override_settings(PROFIL_ORNEKLEME_ORANI=1.0, PROFIL_YAVAS_ESIK_MS=0, PROFIL_GUNLUK_DOSYASI=self.dosya):
+            self.client.get(reverse("anasayfa"))
+
+        with open(self.dosya, encoding="utf-8") as f:
+            kayit = json.loads(f.readlines()[-1])
+        self.assertEqual(kayit["gorunum"], "anasayfa")
+        self.assertGreater(kayit["sorgu"], 0)
+        self.assertGreater(kayit["sablon_ms"], 0)
+        self.assertIn("anasayfa", profil_ozeti())
+
+    def test_cozumlenemeyen_adresler_tek_anahtarda_toplanir(self):
+        with override_settings(PROFIL_ORNEKLEME_ORANI=1.0, PROFIL_YAVAS_ESIK_MS=10 ** 6, PROFIL_GUNLUK_DOSYASI=self.dosya):
+            for yol in ("/wp-login.php", "/.env", "/yok/boyle/bir/sayfa/"):
+                self.client.get(yol)
+
+        ozet = profil_ozeti()
+        self.assertIn("<cozumlenemeyen>", ozet)
+        self.assertFalse(any(ad.startswith("/") for ad in ozet))
+
+    def test_orneklenmeyen_istek_olculmez(self):
+        with override_settings(PROFIL_ORNEKLEME_ORANI=0, PROFIL_YAVAS_ESIK_MS=0, PROFIL_GUNLUK_DOSYASI=self.dosya):
+            self.client.get(reverse("kimdir"))
+
+        self.assertFalse(os.path.exists(self.dosya))
+
+
+class GorselIslemeTests(TestCase):
+    def setUp(self):
+        gecici = tempfile.TemporaryDirectory()
+        self.addCleanup(gecici.cleanup)
+        ayar = override_settings(MEDIA_ROOT=gecici.name, GORSEL_ISLEME_ARKA_PLANDA=True)
+        ayar.enable()
+        self.addCleanup(ayar.disable)
+        # Varyant bilgisi dosya adına göre önbellekte; başka testin dizininden kalmasın
+        cache.clear()
+
+    def test_yukleme_kuyruga_girer_ve_isci_isler(self):
+        yazar = KoseYazari.objects.create(ad_soyad="Yazar", resim=make_test_image("yazar.jpg"))
+
+        self.assertTrue(yazar.resim.name.startswith("bekleyen/"))
+        self.assertIn("gorsel-hazirlaniyor", yazar.resim.url)
+        is_ = GorselIsi.objects.get()
+        self.assertEqual(is_.durum, GorselIsi.BEKLIYOR)
+
+        # Boyutlandırma ve ardından duyarlı varyantlar
+        self.assertEqual(gorsel_islerini_calistir(), 2)
+
+        yazar.refresh_from_db()
+        self.assertEqual(yazar.resim.name, "yazarlar/yazar.jpg")
+        self.assertTrue(yazar.resim.storage.exists(yazar.resim.name))
+        self.assertFalse(yazar.resim.storage.exists(is_.kaynak))
+        is_.refresh_from_db()
+        self.assertEqual(is_.durum, GorselIsi.TAMAM)
+
+    def test_varyantlar_uretilir_ve_srcset_basilir(self):
+        buffer = BytesIO()
+        Image.new("RGB", (600, 400), "white").save(buffer, format="JPEG")
+        haber = Haber.objects.create(
+            baslik="Haber", icerik="icerik", kategori=Kategori.objects.create(isim="Gundem"),
+            resim=SimpleUploadedFile("manzara.jpg", buffer.getvalue(), content_type="image/jpeg"),
+        )
+        gorsel_islerini_calistir()
+        haber.refresh_from_db()
+
+        html = Template('{% load gorsel_tags %}{% duyarli_gorsel haber.resim sizes="50vw" alt=haber.baslik %}').render(
+            Context({"haber": haber})
+        )
+
+        self.assertIn('type="image/webp"', html)
+        self.assertIn("turevler/haber_resimleri/manzara/320.webp 320w", html)
+        self.assertIn("800.webp 800w", html)
+        self.assertIn(f'src="{haber.resim.url}"', html)
+        self.assertIn('loading="lazy"', html)
+
+    def test_varyantlar_bitince_onbellekteki_sayfa_temizlenir(self):
+        haber = Haber.objects.create(
+            baslik="Haber", icerik="icerik", kategori=Kategori.objects.create(isim="Gundem"),
+            resim=make_test_image("manzara.jpg"),
+        )
+        # Önce boyutlandırma; sayfa varyantsız hâliyle önbelleğe girer
+        gorsel_islerini_calistir(en_fazla=1)
+        adres = reverse("haber_detay", args=[haber.pk])
+        self.assertNotContains(self.client.get(adres), "srcset")
+
+        gorsel_islerini_calistir()
+
+        self.assertContains(self.client.get(adres), "srcset")
+
+    def test_toplu_varyant_komutu_guncel_dosyalari_atlar(self):
+        default_storage.save("uploads/2025/01/foto.jpg", make_test_image())
+        default_storage.save("uploads/2025/01/foto_thumb.jpg", make_test_image())
+
+        cikti = StringIO()
+        call_command("gorsel_varyantlarini_olustur", isci=1, stdout=cikti)
+        self.assertIn("1 üretildi, 0 zaten günceldi", cikti.getvalue())
+        self.assertTrue(default_storage.exists("turevler/uploads/2025/01/foto/manifest.json"))
+
+        cikti = StringIO()
+        call_command("gorsel_varyantlarini_olustur", isci=1, stdout=cikti)
+        self.assertIn("0 üretildi, 1 zaten günceldi", cikti.getvalue())
+
+    def test_isci_oldugunde_asili_is_siraya_doner(self):
+        KoseYazari.objects.create(ad_soyad="Yazar", resim=make_test_image("yazar.jpg"))
+        is_ = GorselIsi.objects.get()
+        GorselIsi.objects.filter(pk=is_.pk).update(
+            durum=GorselIsi.ISLENIYOR, deneme=1, guncellenme_tarihi=timezone.now() - timedelta(hours=1),
+        )
+
+        self.assertEqual(gorsel_islerini_calistir(en_fazla=1), 1)
+
+        is_.refresh_from_db()
+        self.assertEqual((is_.durum, is_.deneme), (GorselIsi.TAMAM, 2))
+
+    def test_hatali_is_yeniden_denenir_ve_hata_kaydedilir(self):
+        yazar = KoseYazari.objects.create(ad_soyad="Yazar", resim=make_test_image("yazar.jpg"))
+        yazar.resim.storage.delete(yazar.resim.name)
+
+        with self.assertLogs("haberler.images", "ERROR"):
+            for _ in range(3):
+                gorsel_islerini_calistir(en_fazla=1)
+
+        is_ = GorselIsi.objects.get()
+        self.assertEqual(is_.durum, GorselIsi.HATA)
+        self.assertEqual(is_.deneme, 3)
+        self.assertTrue(is_.hata)
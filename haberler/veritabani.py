@@ -0,0 +1,62 @@
+"""
+Veritabanı bağlantı ayarları.
+
+SQLite varsayılan ayarlarla (rollback journal, synchronous=FULL) yazarken
+okuyucuları da bekletir; birden fazla gunicorn worker'ı okunma sayısı ve yorum
+yazdığında "database is locked" hataları başlar. Bu yüzden her yeni SQLite
+bağlantısı settings.SQLITE_PRAGMALARI ile açılır:
+
+    journal_mode=WAL      okuyucular yazarı, yazar okuyucuları beklemez
+    synchronous=NORMAL    WAL'da güvenli; her işlemde fsync yapılmaz
+    busy_timeout          kilit görülünce hemen hata yerine bekler (ms)
+    mmap_size             okumalar dosyayı bellek eşlemesiyle okur
+
+PostgreSQL seçildiğinde (bkz. settings.py, DJANGO_DB_ENGINE) bu kanca hiçbir
+şey yapmaz; orada kalıcı bağlantı veya bağlantı havuzu kullanılır.
+
+İşlemler varsayılan olarak DEFERRED başlar; salt okuyan bloklar WAL'da
+birbirini beklemez. Önce okuyup sonra yazan bloklar `yazma_islemi()` ile
+açılır: yazma kilidi BEGIN IMMEDIATE ile baştan alınır. Yoksa okumadan sonra
+başka bir yazar işlemini bitirmişse yazmaya geçiş busy_timeout beklenmeden
+"database is locked" ile düşer.
+"""
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+def pragmalari_uygula(cursor, pragmalar):
+    for ad, deger in pragmalar.items():
+        cursor.execute(f'PRAGMA {ad} = {deger}')
+
+
+@receiver(connection_created)
+def sqlite_baglantisini_ayarla(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    pragmalar = getattr(settings, 'SQLITE_PRAGMALARI', None)
+    if pragmalar:
+        with connection.cursor() as cursor:
+            pragmalari_uygula(cursor, pragmalar)
+
+
+@contextmanager
+def yazma_islemi(using=DEFAULT_DB_ALIAS):
+    """SQLite'ta BEGIN IMMEDIATE ile açılan transaction.atomic(); iç içe blokta düz savepoint."""
+    connection = connections[using]
+    if connection.vendor != 'sqlite' or connection.in_atomic_block:
+        with transaction.atomic(using=using):
+            yield
+        return
+    onceki = connection.transaction_mode
+    connection.transaction_mode = 'IMMEDIATE'
+    try:
+        with transaction.atomic(using=using):
+            # BEGIN çalıştı; bağlantının sonraki işlemleri eski kipte başlasın
+            connection.transaction_mode = onceki
+            yield
+    finally:
+        connection.transaction_mode = onceki
@@ -1,61 +1,62 @@
 from django.shortcuts import render, get_object_or_404, redirect
+from django.urls import reverse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.gzip import gzip_page
 from django.core.paginator import Paginator
-from django.db.models import Q, F
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from datetime import timedelta
+import math
 from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
 from django.contrib import messages
-from itertools import chain
-from operator import attrgetter
-import re
 
 from allauth.socialaccount.models import SocialApp
 
 # Modeller
 from .models import (
     Haber, Kategori, Galeri, 
-    Ilce, EczaneLinki, KoseYazari, KoseYazisi, Destekci, Siir,
-    OzelGun, TebrikMesaji, TarihiYer, Profil, get_youtube_embed, GaleriResim
+    Ilce, EczaneLinki, KoseYazari, KoseYazisi, Siir,
+    OzelGun, TebrikMesaji, TarihiYer, Profil, GaleriResim, Yorum, BenzerIcerik
 )
 
+# Önbellek
+from .cache import (
+    surumlu_getir, onbellek_istatistikleri, anonim_sayfa_onbellegi, parca_surumleri, menu_imzasini_denetle,
+)
+from .counters import okunma_artir, bekleyen_okunma
+from .search import ara
+from .pagination import imlecli_sayfala
+from .kosullu import kosullu_get
+from .manset import mansetler
+from .rozetler import rozet_imzasi, yorumlara_rozet_ekle
+from .benzerlik import benzer_icerikler, kategori_yenileri
+from . import site_haritasi as site_haritasi_modulu
+from .middleware import profil_ozeti
+
 # Formlar
 from .forms import KayitFormu, YorumForm, KullaniciGuncellemeForm, ProfilGuncellemeForm
 
 # --- YARDIMCI FONKSİYONLAR ---
 
-def metin_ici_video_duzelt(icerik):
-    """(video: ...) bloğu içindeki 11 haneli YouTube ID'sini çeker."""
-    if not icerik: return ""
-    block_pattern = re.compile(r'\(\s*video\s*:(.*?)\)', re.DOTALL | re.IGNORECASE)
-    
-    def replacement(match):
-        embed_url = get_youtube_embed(match.group(1))
-        if not embed_url:
-            return ""
-        return f'''
-        <div class="ratio ratio-16x9 my-4 shadow rounded border" style="width: 100%; display: block;">
-            <iframe src="{embed_url}" title="Video" loading="lazy"
-                allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share"
-                referrerpolicy="strict-origin-when-cross-origin" allowfullscreen style="border:0;"></iframe>
-        </div>
-        '''
-    return block_pattern.sub(replacement, icerik)
-
-def yorumlara_rozet_ekle(yorumlar):
-    aktif_destekciler = Destekci.objects.filter(aktif_mi=True, bitis_tarihi__gte=timezone.now())
-    destekci_dict = {d.email: d.paket for d in aktif_destekciler}
-    for yorum in yorumlar:
-        if yorum.email in destekci_dict:
-            yorum.destekci_tipi = destekci_dict[yorum.email]
-        else:
-            yorum.destekci_tipi = None
-    return yorumlar
+NAVIGASYON_ONBELLEK_SURESI = getattr(settings, 'NAVIGASYON_ONBELLEK_SURESI', 300)
+
+def _okunma_artir(model):
+    """Önbellekten sunulan detay sayfalarında da okunma sayısını artırır."""
+    def artir(request, pk):
+        okunma_artir(model, pk)
+    return artir
 
 # --- CONTEXT PROCESSOR (HATAYI ÇÖZEN KISIM) ---
 # Bu fonksiyon sitenin her yerinde kategori ve ilçe verilerinin görünmesini sağlar.
-def global_context(request):
+# Sonuç içerik sürümüne bağlı olarak önbellekte tutulur (bkz. haberler/signals.py);
+# sıcak önbellekte hiç sorgu atılmaz.
+def _navigasyon_verisi():
     try:
         available_social_providers = set(
             SocialApp.objects.filter(sites=settings.SITE_ID).values_list('provider', flat=True)
@@ -78,9 +79,12 @@ def global_context(request):
         available_social_providers = {'google'}
 
     return {
-        'global_kategoriler': Kategori.objects.all(),
-        'global_ilceler': Ilce.objects.all(),
-        'son_dakika': Haber.objects.filter(aktif_mi=True, son_dakika=True, yayin_tarihi__gte=timezone.now()-timedelta(hours=24)).order_by('-yayin_tarihi'),
+        'global_kategoriler': list(Kategori.objects.all()),
+        'global_ilceler': list(Ilce.objects.all()),
+        'son_dakika': list(
+            Haber.objects.filter(aktif_mi=True, son_dakika=True, yayin_tarihi__gte=timezone.now()-timedelta(hours=24))
+            .order_by('-yayin_tarihi').only('id', 'baslik')
+        ),
         'available_social_providers': available_social_providers,
         'has_roportaj': Haber.objects.filter(aktif_mi=True, roportaj_mi=True).exists(),
         'has_galeri': Galeri.objects.exists(),
@@ -88,65 +92,126 @@ def global_context(request):
         'has_tarihi_yer': TarihiYer.objects.exists(),
     }
 
+def navigasyon():
+    # Son dakika 24 saatlik pencereye bağlı olduğu için kayıt kısa süre tutulur
+    return surumlu_getir('navigasyon', _navigasyon_verisi, timeout=NAVIGASYON_ONBELLEK_SURESI)
+
+def menuyu_denetle(surum):
+    """
+    İçerik sürümü `surum`e geçtikten sonraki ilk anonim sayfa isteğinde
+    çağrılır (bkz. cache.py); menü değiştiyse tüm sayfalar temizlenir.
+    """
+    menu_imzasini_denetle(surum, navigasyon_imzasi(navigasyon()))
+
+def navigasyon_imzasi(veri):
+    """Her sayfada görünen menü ve son dakika verisinin karşılaştırılabilir özeti."""
+    return (
+        [(k.pk, k.isim) for k in veri['global_kategoriler']],
+        [(i.pk, i.isim) for i in veri['global_ilceler']],
+        [(h.pk, h.baslik) for h in veri['son_dakika']],
+        sorted(veri['available_social_providers']),
+        [veri[ad] for ad in ('has_roportaj', 'has_galeri', 'has_siir', 'has_tarihi_yer')],
+    )
+
+def global_context(request):
+    return navigasyon()
+
+def parca_onbellegi(request):
+    # Şablon parçalarının sürümleri; yalnızca {% cache %} kullanan sayfada okunur
+    return {'parca_surumleri': SimpleLazyObject(parca_surumleri)}
+
+@staff_member_required
+def onbellek_durumu(request):
+    return JsonResponse(onbellek_istatistikleri())
+
+@staff_member_required
+def profil_ozeti_gorunumu(request):
+    return JsonResponse(profil_ozeti())
+
 # =========================================================
 # 🏠 ANASAYFA
 # =========================================================
+def _anasayfa_kaynaklari(request):
+    return [
+        Haber.objects.all(), KoseYazisi.objects.all(), KoseYazari.objects.all(), Siir.objects.all(),
+        Galeri.objects.all(), GaleriResim.objects.all(), OzelGun.objects.all(), TarihiYer.objects.all(),
+        EczaneLinki.objects.all(),
+    ]
+
+def _yorum_kaynaklari(**filtre):
+    # Rozetler önbellekteki dizinden gelir; değişiklikleri rozet_imzasi ile ETag'e girer
+    return [Yorum.objects.filter(**filtre)]
+
+@kosullu_get(_anasayfa_kaynaklari)
+@anonim_sayfa_onbellegi
 def anasayfa(request):
-    haber_listesi = Haber.objects.filter(aktif_mi=True).order_by('-yayin_tarihi')
-    paginator = Paginator(haber_listesi, 10)
-    haberler = paginator.get_page(request.GET.get('page'))
-
-    manset_haberler = Haber.objects.filter(aktif_mi=True, manset_mi=True)
-    manset_yazilar = KoseYazisi.objects.filter(aktif_mi=True, manset_mi=True)
-    mansetler = sorted(chain(manset_haberler, manset_yazilar), key=attrgetter('yayin_tarihi'), reverse=True)[:10]
-
-    aktif_ozel_gun = OzelGun.objects.filter(aktif_mi=True, anasayfada_goster=True).first()
+    haber_listesi = Haber.objects.filter(aktif_mi=True).kartlar()
+    haberler = imlecli_sayfala(request, haber_listesi, 10)
+    if haberler.yonlendirme: return haberler.yonlendirme
+
+    # Manşet, yazar şeridi ve özel gün şablonda önbellekli parçalardır; sorgular
+    # yalnızca parça önbellekte yoksa çalışır
+    def yazarlar():
+        yazarlar_qs = KoseYazari.objects.filter(aktif_mi=True).order_by('-basyazar_mi', 'id').son_yazilariyla()
+        return [yazar for yazar in yazarlar_qs if yazar.son_yazisi]
+
+    aktif_ozel_gun = SimpleLazyObject(
+        lambda: OzelGun.objects.filter(aktif_mi=True, anasayfada_goster=True).prefetch_related('mesajlar').first()
+    )
     haftanin_fotosu = GaleriResim.objects.filter(haftanin_fotografi_mi=True).select_related('galeri').first()
     eczaneler = EczaneLinki.objects.all().order_by('sira')
-    yazarlar_qs = KoseYazari.objects.filter(aktif_mi=True).order_by('-basyazar_mi', 'id')
-    yazarlar = [yazar for yazar in yazarlar_qs if yazar.son_yazisi]
     
-    gunun_siiri = Siir.objects.filter(aktif_mi=True, gunun_siiri_mi=True).first() or Siir.objects.filter(aktif_mi=True).last()
+    siirler = Siir.objects.filter(aktif_mi=True).kartlar()
+    gunun_siiri = siirler.filter(gunun_siiri_mi=True).first() or siirler.last()
     rehber_ogeleri = TarihiYer.objects.filter(aktif_mi=True).order_by('sira')[:6]
     son_galeriler = Galeri.objects.all().order_by('-yayin_tarihi')[:6]
     return render(request, 'anasayfa.html', {
-        'haberler': haberler, 'mansetler': mansetler, 'haftanin_fotosu': haftanin_fotosu,
-        'eczaneler': eczaneler, 'yazarlar': yazarlar, 'gunun_siiri': gunun_siiri,
+        'haberler': haberler, 'mansetler': SimpleLazyObject(mansetler), 'haftanin_fotosu': haftanin_fotosu,
+        'eczaneler': eczaneler, 'yazarlar': SimpleLazyObject(yazarlar), 'gunun_siiri': gunun_siiri,
         'aktif_ozel_gun': aktif_ozel_gun,
         'rehber_ogeleri': rehber_ogeleri,
         'son_galeriler': son_galeriler,
     })
 
 # --- KATEGORİ VE İLÇE ---
+@kosullu_get(lambda request, pk: [Haber.objects.filter(kategori_id=pk), EczaneLinki.objects.all()])
+@anonim_sayfa_onbellegi
 def kategori_haberleri(request, pk):
     secilen_kategori = get_object_or_404(Kategori, pk=pk)
-    haber_listesi = Haber.objects.filter(kategori=secilen_kategori, aktif_mi=True).order_by('-yayin_tarihi')
-    paginator = Paginator(haber_listesi, 12)
-    haberler = paginator.get_page(request.GET.get('page'))
+    haber_listesi = Haber.objects.filter(kategori=secilen_kategori, aktif_mi=True).kartlar()
+    haberler = imlecli_sayfala(request, haber_listesi, 12)
+    if haberler.yonlendirme: return haberler.yonlendirme
     eczaneler = EczaneLinki.objects.all().order_by('sira')
     return render(request, 'kategori.html', {'haberler': haberler, 'secilen_kategori': secilen_kategori, 'eczaneler': eczaneler})
 
+@kosullu_get(lambda request, pk: [Haber.objects.filter(ilce_id=pk), EczaneLinki.objects.all()])
+@anonim_sayfa_onbellegi
 def ilce_haberleri(request, pk):
     secilen_ilce = get_object_or_404(Ilce, pk=pk)
-    haber_listesi = Haber.objects.filter(ilce=secilen_ilce, aktif_mi=True).order_by('-yayin_tarihi')
-    paginator = Paginator(haber_listesi, 12)
-    haberler = paginator.get_page(request.GET.get('page'))
+    haber_listesi = Haber.objects.filter(ilce=secilen_ilce, aktif_mi=True).kartlar()
+    haberler = imlecli_sayfala(request, haber_listesi, 12)
+    if haberler.yonlendirme: return haberler.yonlendirme
     eczaneler = EczaneLinki.objects.all().order_by('sira')
     return render(request, 'kategori.html', {'haberler': haberler, 'secilen_kategori': secilen_ilce, 'eczaneler': eczaneler})
 
 # =========================================================
 # 📄 DETAY SAYFALARI
 # =========================================================
+@kosullu_get(lambda request, pk: [
+    Haber.objects.filter(pk=pk),
+    BenzerIcerik.objects.filter(kaynak_tur='haber', kaynak_id=pk),
+    # Liste boşsa benzer haberler aynı kategoriden gelir
+    Haber.objects.filter(kategori__in=Haber.objects.filter(pk=pk).values('kategori')),
+    *_yorum_kaynaklari(haber_id=pk),
+], isabette=_okunma_artir(Haber), imza=rozet_imzasi)
+@anonim_sayfa_onbellegi(isabette=_okunma_artir(Haber))
 def haber_detay(request, pk):
     haber = get_object_or_404(Haber, pk=pk)
     if request.method == 'GET':
-        Haber.objects.filter(pk=haber.pk).update(okunma_sayisi=F('okunma_sayisi') + 1)
-        haber.refresh_from_db(fields=['okunma_sayisi'])
-    haber.icerik = metin_ici_video_duzelt(haber.icerik)
+        okunma_artir(Haber, haber.pk)
+    haber.okunma_sayisi += bekleyen_okunma(Haber, haber.pk)
     
-    benzer_haberler = Haber.objects.filter(kategori=haber.kategori, aktif_mi=True).exclude(id=haber.id).order_by('-yayin_tarihi')[:5]
-    if not benzer_haberler:
-        benzer_haberler = Haber.objects.filter(aktif_mi=True).exclude(id=haber.id).order_by('-yayin_tarihi')[:5]
+    benzer_haberler = benzer_icerikler('haber', haber.pk) or kategori_yenileri(haber)
 
     onayli_yorumlar = yorumlara_rozet_ekle(haber.yorumlar.filter(aktif=True))
 
@@ -165,12 +230,15 @@ def haber_detay(request, pk):
 
     return render(request, 'detay.html', {'haber': haber, 'benzer_haberler': benzer_haberler, 'yorumlar': onayli_yorumlar, 'yorum_form': form})
 
+@kosullu_get(lambda request, pk: [
+    KoseYazisi.objects.filter(pk=pk), KoseYazari.objects.filter(yazilar__pk=pk), *_yorum_kaynaklari(kose_yazisi_id=pk),
+], isabette=_okunma_artir(KoseYazisi), imza=rozet_imzasi)
+@anonim_sayfa_onbellegi(isabette=_okunma_artir(KoseYazisi))
 def yazi_detay(request, pk):
     yazi = get_object_or_404(KoseYazisi, pk=pk)
     if request.method == 'GET':
-        KoseYazisi.objects.filter(pk=yazi.pk).update(okunma_sayisi=F('okunma_sayisi') + 1)
-        yazi.refresh_from_db(fields=['okunma_sayisi'])
-    yazi.icerik = metin_ici_video_duzelt(yazi.icerik)
+        okunma_artir(KoseYazisi, yazi.pk)
+    yazi.okunma_sayisi += bekleyen_okunma(KoseYazisi, yazi.pk)
     onayli_yorumlar = yorumlara_rozet_ekle(yazi.yorumlar.filter(aktif=True))
 
     if request.method == 'POST':
@@ -188,37 +256,47 @@ def yazi_detay(request, pk):
     return render(request, 'yazi_detay.html', {'yazi': yazi, 'yorumlar': onayli_yorumlar, 'yorum_form': form})
 
 # --- DİĞER SAYFALAR ---
+@kosullu_get(lambda request, slug: [OzelGun.objects.filter(slug=slug), TebrikMesaji.objects.filter(ozel_gun__slug=slug)])
 def ozel_gun_detay(request, slug):
     ozel_gun = get_object_or_404(OzelGun, slug=slug, aktif_mi=True)
     mesajlar = ozel_gun.mesajlar.all().order_by('sira')
     return render(request, 'ozel_gun_detay.html', {'ozel_gun': ozel_gun, 'mesajlar': mesajlar})
 
+@kosullu_get(lambda request: [Siir.objects.all(), KoseYazari.objects.all()])
 def siir_listesi(request):
-    gunun_siiri = Siir.objects.filter(aktif_mi=True, gunun_siiri_mi=True).first() or Siir.objects.filter(aktif_mi=True).last()
-    liste = Siir.objects.filter(aktif_mi=True).exclude(id=gunun_siiri.id).order_by('-yayin_tarihi') if gunun_siiri else Siir.objects.filter(aktif_mi=True)
-    paginator = Paginator(liste, 9)
-    siirler = paginator.get_page(request.GET.get('page'))
+    siirler = Siir.objects.filter(aktif_mi=True).kartlar()
+    gunun_siiri = siirler.filter(gunun_siiri_mi=True).first() or siirler.last()
+    liste = siirler.exclude(id=gunun_siiri.id) if gunun_siiri else siirler
+    siirler = imlecli_sayfala(request, liste, 9)
+    if siirler.yonlendirme: return siirler.yonlendirme
     return render(request, 'siir_listesi.html', {'siirler': siirler, 'gunun_siiri': gunun_siiri})
 
+@kosullu_get(lambda request: [Haber.objects.all()])
 def roportaj_listesi(request):
-    roportajlar = Haber.objects.filter(aktif_mi=True, roportaj_mi=True).order_by('-yayin_tarihi')
-    paginator = Paginator(roportajlar, 9)
-    haberler = paginator.get_page(request.GET.get('page'))
+    roportajlar = Haber.objects.filter(aktif_mi=True, roportaj_mi=True).kartlar()
+    haberler = imlecli_sayfala(request, roportajlar, 9)
+    if haberler.yonlendirme: return haberler.yonlendirme
     return render(request, 'roportaj_listesi.html', {'haberler': haberler})
 
+@kosullu_get(lambda request, pk: [
+    Siir.objects.filter(pk=pk), KoseYazari.objects.filter(siir__pk=pk), *_yorum_kaynaklari(siir_id=pk),
+], isabette=_okunma_artir(Siir), imza=rozet_imzasi)
+@anonim_sayfa_onbellegi(isabette=_okunma_artir(Siir))
 def siir_detay(request, pk):
     siir = get_object_or_404(Siir, pk=pk)
     if request.method == 'GET':
-        Siir.objects.filter(pk=siir.pk).update(okunma_sayisi=F('okunma_sayisi') + 1)
-        siir.refresh_from_db(fields=['okunma_sayisi'])
+        okunma_artir(Siir, siir.pk)
+    siir.okunma_sayisi += bekleyen_okunma(Siir, siir.pk)
     onayli_yorumlar = yorumlara_rozet_ekle(siir.yorumlar.filter(aktif=True))
     return render(request, 'siir_detay.html', {'siir': siir, 'yorumlar': onayli_yorumlar, 'yorum_form': YorumForm()})
 
+@kosullu_get(lambda request: [Galeri.objects.all(), GaleriResim.objects.all()])
 def galeri_listesi(request):
     haftanin_fotografi = GaleriResim.objects.filter(haftanin_fotografi_mi=True).select_related('galeri').first()
     galeriler = Galeri.objects.all().order_by('-yayin_tarihi')
     return render(request, 'galeri_listesi.html', {'galeriler': galeriler, 'haftanin_fotografi': haftanin_fotografi})
 
+@kosullu_get(lambda request, pk: [Galeri.objects.filter(pk=pk), GaleriResim.objects.filter(galeri_id=pk)])
 def galeri_detay(request, pk):
     galeri = get_object_or_404(Galeri, pk=pk)
     resimler = galeri.resimler.all().order_by('-haftanin_fotografi_mi', '-id')
@@ -247,22 +325,146 @@ def profil(request):
     return render(request, 'profil.html', {'u_form': u_form, 'p_form': p_form})
 
 # --- TARİHİ VE TURİSTİK YERLER ---
+# Sayfa yalnızca listeyi taşır; işaretler harita.json'dan görünen alan kadar,
+# her yerin metni de tıklanınca icerik.json'dan gelir.
+HARITA_SAYFA_BOYUTU = 200
+VARSAYILAN_HARITA_IKONU = 'https://cdn-icons-png.flaticon.com/512/684/684908.png'
+
+def _tarihi_yer_listesi():
+    return (
+        TarihiYer.objects.filter(aktif_mi=True).order_by('sira')
+        .only('id', 'baslik', 'slug', 'ilce', 'harita_ikonu', 'resim', 'sira')
+    )
+
+@kosullu_get(lambda request: [TarihiYer.objects.all()])
 def tarihi_yerler_listesi(request):
-    yerler = TarihiYer.objects.filter(aktif_mi=True).order_by('sira')
-    return render(request, 'tarihi_yerler_listesi.html', {'yerler': yerler})
+    return render(request, 'tarihi_yerler_listesi.html', {'yerler': _tarihi_yer_listesi()})
 
+@kosullu_get(lambda request, slug: [TarihiYer.objects.all()])
 def tarihi_yer_detay(request, slug):
-    yerler = TarihiYer.objects.filter(aktif_mi=True).order_by('sira')
-    secili_yer = get_object_or_404(yerler, slug=slug)
-    return render(request, 'tarihi_yerler_listesi.html', {'yerler': yerler, 'selected_yer': secili_yer})
+    secili_yer = get_object_or_404(TarihiYer, aktif_mi=True, slug=slug)
+    return render(request, 'tarihi_yerler_listesi.html', {'yerler': _tarihi_yer_listesi(), 'selected_yer': secili_yer})
+
+def _harita_kutusu(deger):
+    """'batı,güney,doğu,kuzey' (Leaflet toBBoxString) -> (güney, batı, kuzey, doğu) ya da None."""
+    try:
+        bati, guney, dogu, kuzey = (float(parca) for parca in deger.split(','))
+    except ValueError:
+        return None
+    # nan/inf DecimalField aramasında ValidationError'a yol açar
+    if not all(math.isfinite(sayi) for sayi in (bati, guney, dogu, kuzey)):
+        return None
+    if not (-90 <= guney <= 90 and -90 <= kuzey <= 90 and -180 <= bati <= 180 and -180 <= dogu <= 180):
+        return None
+    return guney, bati, kuzey, dogu
+
+@gzip_page
+@cache_control(public=True, max_age=300)
+@kosullu_get(lambda request: [TarihiYer.objects.all()])
+@anonim_sayfa_onbellegi
+def tarihi_yer_isaretleri(request):
+    """
+    Harita işaretleri: ?kutu=batı,güney,doğu,kuzey ile görünen alan, ?ilce= ile
+    ilçe süzülür. Sayfalar id sırasıyla gelir; `sonraki` bir sonraki sayfanın
+    adresidir.
+    """
+    yerler = TarihiYer.objects.filter(aktif_mi=True, enlem__isnull=False, boylam__isnull=False)
+    if request.GET.get('kutu'):
+        kutu = _harita_kutusu(request.GET['kutu'])
+        if kutu is None:
+            return JsonResponse({'hata': "kutu 'batı,güney,doğu,kuzey' biçiminde olmalı"}, status=400)
+        yerler = yerler.kutu_icinde(*kutu)
+    if request.GET.get('ilce'):
+        yerler = yerler.filter(ilce=request.GET['ilce'])
+    try:
+        sonra = int(request.GET.get('sonra', 0))
+    except ValueError:
+        sonra = 0
+    sayfa = list(
+        yerler.filter(pk__gt=sonra).order_by('pk')
+        .values('id', 'baslik', 'slug', 'ilce', 'enlem', 'boylam', 'harita_ikonu')[:HARITA_SAYFA_BOYUTU + 1]
+    )
+    sonraki = None
+    if len(sayfa) > HARITA_SAYFA_BOYUTU:
+        sayfa = sayfa[:HARITA_SAYFA_BOYUTU]
+        sorgu = request.GET.copy()
+        sorgu['sonra'] = sayfa[-1]['id']
+        sonraki = f"{request.path}?{sorgu.urlencode()}"
+    ikon_alani = TarihiYer._meta.get_field('harita_ikonu')
+    isaretler = [{
+        'id': yer['id'],
+        'baslik': yer['baslik'],
+        'adres': reverse('tarihi_yer_detay', args=[yer['slug']]) if yer['slug'] else None,
+        'ilce': yer['ilce'],
+        'lat': float(yer['enlem']),
+        'lng': float(yer['boylam']),
+        'ikon': ikon_alani.storage.url(yer['harita_ikonu']) if yer['harita_ikonu'] else VARSAYILAN_HARITA_IKONU,
+    } for yer in sayfa]
+    return JsonResponse({'yerler': isaretler, 'sonraki': sonraki}, json_dumps_params={'ensure_ascii': False})
+
+@gzip_page
+@cache_control(public=True, max_age=300)
+@kosullu_get(lambda request, pk: [TarihiYer.objects.filter(pk=pk)])
+@anonim_sayfa_onbellegi
+def tarihi_yer_icerigi(request, pk):
+    yer = get_object_or_404(TarihiYer, pk=pk, aktif_mi=True)
+    return JsonResponse({
+        'id': yer.pk,
+        'baslik': yer.baslik,
+        'ilce': yer.ilce,
+        'resim': yer.resim.url if yer.resim else None,
+        'icerik': yer.icerik,
+    }, json_dumps_params={'ensure_ascii': False})
 
 # --- DİĞER ---
+# Sabit sayfalar yalnızca menüye ve şablona bağlıdır. Destek sayfası anonim
+# okuyucuya da CSRF'li form gösterdiğinden koşullu yanıtlanmaz.
+def sabit_sayfa_kaynaklari(request, *args, **kwargs): return []
+
 def destek(request): return render(request, 'destek.html')
+@kosullu_get(sabit_sayfa_kaynaklari)
 def kimdir(request): return render(request, 'kimdir.html')
+@kosullu_get(sabit_sayfa_kaynaklari)
 def iletisim(request): return render(request, 'iletisim.html')
+@kosullu_get(sabit_sayfa_kaynaklari)
 def tesekkur(request): return render(request, 'tesekkur.html')
 
 def arama(request):
-    query = request.GET.get('q')
-    sonuclar = Haber.objects.filter(Q(baslik__icontains=query)|Q(icerik__icontains=query), aktif_mi=True).order_by('-yayin_tarihi') if query else []
+    query = (request.GET.get('q') or '').strip()
+    sonuclar = []
+    if query:
+        paginator = Paginator(ara(query), 12)
+        sonuclar = paginator.get_page(request.GET.get('page'))
     return render(request, 'arama.html', {'sonuclar': sonuclar, 'query': query})
+
+# =========================================================
+# 🗺️ SİTE HARİTASI (bkz. haberler/site_haritasi.py)
+# =========================================================
+def _site_haritasi_yaniti(request, icerik, son):
+    """Last-Modified ekler; tarayıcının kopyası güncelse 304 döner."""
+    son_degisiklik = int(son.timestamp()) if son else None
+    kosullu = get_conditional_response(request, last_modified=son_degisiklik)
+    if kosullu is not None:
+        return kosullu
+    response = FileResponse(open(icerik, 'rb')) if isinstance(icerik, str) else HttpResponse(icerik)
+    response['Content-Type'] = 'application/xml; charset=utf-8'
+    if son_degisiklik:
+        response['Last-Modified'] = http_date(son_degisiklik)
+    return response
+
+def site_haritasi(request):
+    parcalar = site_haritasi_modulu.parcalar()
+    haberler = site_haritasi_modulu.haber_haritasi_durumu()
+    if haberler.adet:
+        parcalar.append(haberler)
+    son = max((parca.son for parca in parcalar if parca.son), default=None)
+    return _site_haritasi_yaniti(request, site_haritasi_modulu.dizin_xml(parcalar).encode('utf-8'), son)
+
+def site_haritasi_parcasi(request, bolum, no):
+    if bolum == site_haritasi_modulu.HABER_HARITASI and no == 0:
+        parca = site_haritasi_modulu.haber_haritasi_durumu()
+    else:
+        parca = site_haritasi_modulu.parca_durumu(bolum, no)
+    if parca is None:
+        raise Http404
+    return _site_haritasi_yaniti(request, site_haritasi_modulu.parca_dosyasi(parca), parca.son)
@@ -0,0 +1,208 @@
+"""
+Çalışan sitede tutarlı SQLite yedekleri.
+
+Dosyayı `cp` ile kopyalamak yazma ortasında yarım bir sayfa yakalayabilir.
+Burada sqlite3'ün yedekleme API'si kullanılır: kopya küçük sayfa gruplarıyla
+alınır ve gruplar arasında kilit bırakılır, böylece yazarlar bekletilmez.
+Alınan anlık görüntü `PRAGMA integrity_check` ile doğrulanır, ardından parça
+parça gzip'lenir.
+
+İki tür yedek üretilir:
+
+    db_<zaman>.sqlite3.gz   tam yedek (+ db_<zaman>.ozet: sayfa özetleri)
+    db_<zaman>.fark.gz      son tam yedekten bu yana değişen sayfalar
+
+Fark dosyası başlık satırı (JSON) ve ardından `>I` sayfa numarası + sayfa
+içeriği kayıtlarından oluşur. Geri yüklemede taban tam yedek açılıp fark
+sayfaları üzerine yazılır (bkz. `python manage.py veritabani_geri_yukle`).
+"""
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import struct
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+ZAMAN_BICIMI = '%Y%m%d_%H%M%S'
+TAM_UZANTI = '.sqlite3.gz'
+FARK_UZANTI = '.fark.gz'
+OZET_UZANTI = '.ozet'
+PARCA = 1024 * 1024
+_SAYFA_NO = struct.Struct('>I')
+
+
+class YedekHatasi(Exception):
+    pass
+
+
+@dataclass
+class YedekSonucu:
+    dosya: str
+    tur: str
+    boyut: int
+    toplam_sayfa: int
+    degisen_sayfa: int
+
+
+def anlik_goruntu_al(kaynak, hedef_yolu, sayfa=1024, bekleme=0.05, ilerleme=None):
+    """`kaynak` bağlantısından tutarlı bir kopyayı `hedef_yolu`na yazar ve doğrular."""
+    hedef = sqlite3.connect(hedef_yolu)
+    try:
+        kaynak.backup(hedef, pages=sayfa, progress=ilerleme, sleep=bekleme)
+        # Kopya WAL kipini devralır; tek dosya olarak saklanabilmesi için kapatılır
+        hedef.execute('PRAGMA journal_mode = DELETE')
+        sonuc = hedef.execute('PRAGMA integrity_check').fetchall()
+    finally:
+        hedef.close()
+    if sonuc != [('ok',)]:
+        raise YedekHatasi(f"Bütünlük denetimi başarısız: {sonuc[:5]}")
+
+
+def sayfa_boyutu(yol):
+    with closing(sqlite3.connect(yol)) as baglanti:
+        return baglanti.execute('PRAGMA page_size').fetchone()[0]
+
+
+def _sayfalar(yol):
+    boyut = sayfa_boyutu(yol)
+    with open(yol, 'rb') as dosya:
+        numara = 0
+        while icerik := dosya.read(boyut):
+            yield numara, icerik
+            numara += 1
+
+
+def _zaman(dosya_adi):
+    """db_<zaman>... adından zaman; başka biçimdeki dosyalarda None."""
+    try:
+        return datetime.strptime(dosya_adi[3:18], ZAMAN_BICIMI)
+    except ValueError:
+        return None
+
+
+def son_tam_yedek(dizin):
+    """Sayfa özetleri de bulunan en yeni tam yedeğin adı (yoksa None)."""
+    adaylar = sorted(
+        ad for ad in os.listdir(dizin)
+        if ad.startswith('db_') and ad.endswith(TAM_UZANTI)
+        and os.path.exists(os.path.join(dizin, ad[:-len(TAM_UZANTI)] + OZET_UZANTI))
+    )
+    return adaylar[-1] if adaylar else None
+
+
+def _sikistir(kaynak_yolu, hedef_yolu):
+    # Yarım kalan yazım geçerli bir yedek gibi görünmesin
+    with open(kaynak_yolu, 'rb') as kaynak, gzip.open(hedef_yolu + '.tmp', 'wb') as hedef:
+        shutil.copyfileobj(kaynak, hedef, PARCA)
+    os.replace(hedef_yolu + '.tmp', hedef_yolu)
+
+
+def _tam_yedek_yaz(goruntu, dizin, ad):
+    _sikistir(goruntu, os.path.join(dizin, ad + TAM_UZANTI))
+    ozetler = bytearray()
+    toplam = 0
+    for _, icerik in _sayfalar(goruntu):
+        ozetler += hashlib.sha1(icerik).digest()
+        toplam += 1
+    with open(os.path.join(dizin, ad + OZET_UZANTI), 'wb') as dosya:
+        dosya.write(ozetler)
+    return ad + TAM_UZANTI, toplam, toplam
+
+
+def _fark_yaz(goruntu, dizin, ad, taban):
+    with open(os.path.join(dizin, taban[:-len(TAM_UZANTI)] + OZET_UZANTI), 'rb') as dosya:
+        taban_ozetleri = dosya.read()
+    boyut = sayfa_boyutu(goruntu)
+    toplam = os.path.getsize(goruntu) // boyut
+    degisen = 0
+    gecici = os.path.join(dizin, ad + FARK_UZANTI + '.tmp')
+    with gzip.open(gecici, 'wb') as hedef:
+        baslik = {'taban': taban, 'sayfa_boyutu': boyut, 'sayfa_sayisi': toplam}
+        hedef.write(json.dumps(baslik).encode('utf-8') + b'\n')
+        for numara, icerik in _sayfalar(goruntu):
+            if taban_ozetleri[numara * 20:(numara + 1) * 20] != hashlib.sha1(icerik).digest():
+                hedef.write(_SAYFA_NO.pack(numara) + icerik)
+                degisen += 1
+    os.replace(gecici, os.path.join(dizin, ad + FARK_UZANTI))
+    return ad + FARK_UZANTI, toplam, degisen
+
+
+def yedekle(kaynak, dizin, artimli=False, tam_aralik_gun=7, sayfa=1024, bekleme=0.05, simdi=None):
+    """
+    `kaynak` (sqlite3.Connection) veritabanını `dizin`e yedekler. `artimli`
+    verilirse ve son `tam_aralik_gun` gün içinde tam yedek varsa yalnızca o
+    yedekten bu yana değişen sayfalar yazılır.
+    """
+    simdi = simdi or datetime.now()
+    ad = f"db_{simdi.strftime(ZAMAN_BICIMI)}"
+    os.makedirs(dizin, exist_ok=True)
+    taban = son_tam_yedek(dizin) if artimli else None
+    if taban and simdi - _zaman(taban) > timedelta(days=tam_aralik_gun):
+        taban = None
+
+    goruntu = os.path.join(dizin, ad + '.sqlite3.tmp')
+    try:
+        anlik_goruntu_al(kaynak, goruntu, sayfa=sayfa, bekleme=bekleme)
+        if taban:
+            dosya, toplam, degisen = _fark_yaz(goruntu, dizin, ad, taban)
+        else:
+            dosya, toplam, degisen = _tam_yedek_yaz(goruntu, dizin, ad)
+    finally:
+        if os.path.exists(goruntu):
+            os.remove(goruntu)
+    return YedekSonucu(dosya, 'fark' if taban else 'tam', os.path.getsize(os.path.join(dizin, dosya)), toplam, degisen)
+
+
+def _fark_basligi(yol):
+    with gzip.open(yol, 'rb') as dosya:
+        return json.loads(dosya.readline())
+
+
+def eskileri_sil(dizin, gun=30, simdi=None):
+    """
+    `gun` günden eski yedekleri siler. Hâlâ saklanan bir fark dosyasının
+    tabanı olan tam yedek, kendisi eski olsa da silinmez.
+    """
+    sinir = (simdi or datetime.now()) - timedelta(days=gun)
+    adlar = [ad for ad in os.listdir(dizin) if ad.startswith('db_') and _zaman(ad)]
+    eskiler = {ad for ad in adlar if _zaman(ad) < sinir}
+    gerekli = set()
+    for ad in adlar:
+        if ad.endswith(FARK_UZANTI) and ad not in eskiler:
+            taban = _fark_basligi(os.path.join(dizin, ad))['taban']
+            gerekli.update({taban, taban[:-len(TAM_UZANTI)] + OZET_UZANTI})
+
+    silinenler = sorted(eskiler - gerekli)
+    for ad in silinenler:
+        os.remove(os.path.join(dizin, ad))
+    return silinenler
+
+
+def geri_yukle(yedek_yolu, hedef_yolu):
+    """Tam ya da fark yedeğinden çalışır bir veritabanı dosyası üretir ve doğrular."""
+    if yedek_yolu.endswith(FARK_UZANTI):
+        with gzip.open(yedek_yolu, 'rb') as dosya:
+            baslik = json.loads(dosya.readline())
+            taban = os.path.join(os.path.dirname(yedek_yolu), baslik['taban'])
+            if not os.path.exists(taban):
+                raise YedekHatasi(f"Taban yedek bulunamadı: {taban}")
+            geri_yukle(taban, hedef_yolu)
+            boyut = baslik['sayfa_boyutu']
+            with open(hedef_yolu, 'r+b') as hedef:
+                hedef.truncate(baslik['sayfa_sayisi'] * boyut)
+                while kayit := dosya.read(_SAYFA_NO.size + boyut):
+                    (numara,) = _SAYFA_NO.unpack(kayit[:_SAYFA_NO.size])
+                    hedef.seek(numara * boyut)
+                    hedef.write(kayit[_SAYFA_NO.size:])
+    else:
+        with gzip.open(yedek_yolu, 'rb') as kaynak, open(hedef_yolu, 'wb') as hedef:
+            shutil.copyfileobj(kaynak, hedef, PARCA)
+
+    with closing(sqlite3.connect(hedef_yolu)) as baglanti:
+        sonuc = baglanti.execute('PRAGMA integrity_check').fetchall()
+    if sonuc != [('ok',)]:
+        raise YedekHatasi(f"Geri yüklenen veritabanı bozuk: {sonuc[:5]}")
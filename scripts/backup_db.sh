@@ -2,18 +2,11 @@
 set -euo pipefail
 
 PROJECT_DIR="$HOME/artvizyon-haber"
-DB_PATH="$PROJECT_DIR/db.sqlite3"
 BACKUP_DIR="$HOME/db_backups/artvizyon-haber"
-timestamp=$(date +"%Y%m%d_%H%M%S")
-backup_path="$BACKUP_DIR/db_${timestamp}.sqlite3"
+PYTHON="${PYTHON:-python3}"
 
-mkdir -p "$BACKUP_DIR"
-if [ ! -f "$DB_PATH" ]; then
-  echo "Database not found: $DB_PATH" >&2
-  exit 1
-fi
-
-cp "$DB_PATH" "$backup_path"
-
-# Keep last 30 days of backups.
-find "$BACKUP_DIR" -type f -name "db_*.sqlite3" -mtime +30 -delete
+# Consistent online backup (sqlite3 backup API), gzip'ed and integrity-checked.
+# Pages changed since the last full backup only; a full one at most every 7 days.
+# Backups older than 30 days are rotated out by the command itself.
+cd "$PROJECT_DIR"
+"$PYTHON" manage.py veritabani_yedekle --dizin "$BACKUP_DIR" --artimli --tam-aralik 7 --gun 30 "$@"